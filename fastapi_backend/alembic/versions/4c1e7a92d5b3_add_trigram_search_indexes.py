@@ -0,0 +1,54 @@
+"""Add trigram search indexes
+
+Revision ID: 4c1e7a92d5b3
+Revises: 96873e103400
+Create Date: 2026-10-17 09:12:40.518233
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e7a92d5b3'
+down_revision: Union[str, None] = '96873e103400'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns the search endpoints match with ILIKE '%term%', one GIN trigram index per column
+# so the OR of the per-column predicates becomes a BitmapOr of index scans
+SEARCH_COLUMNS = {
+    'digital_twin': ['name', 'title', 'subtitle', 'owner'],
+    'layer': ['title', 'type', 'url', 'featureName'],
+    'bookmarks': ['title', 'description'],
+    'projects': ['name', 'description'],
+    'stories': ['name', 'description'],
+    'terrain_providers': ['title', 'url'],
+    'tool': ['name'],
+    'users': ['name', 'email'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            op.create_index(
+                f'ix_{table}_{column.lower()}_trgm',
+                table,
+                [column],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'}
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in SEARCH_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f'ix_{table}_{column.lower()}_trgm', table_name=table)
+    # The pg_trgm extension is left installed, other database objects may depend on it
@@ -0,0 +1,40 @@
+"""Add foreign key indexes
+
+Revision ID: b7d20f6e4a19
+Revises: 4c1e7a92d5b3
+Create Date: 2026-10-17 10:03:17.274905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d20f6e4a19'
+down_revision: Union[str, None] = '4c1e7a92d5b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_digital_twin_tool_association_lookup', 'digital_twin_tool_association', ['digital_twin_id', 'tool_id', 'content_type_id', 'content_id'], unique=False)
+    op.create_index('ix_digital_twin_tool_association_content', 'digital_twin_tool_association', ['content_type_id', 'content_id'], unique=False)
+    op.create_index(op.f('ix_digital_twin_tool_association_tool_id'), 'digital_twin_tool_association', ['tool_id'], unique=False)
+    op.create_index(op.f('ix_digital_twin_layer_association_layer_id'), 'digital_twin_layer_association', ['layer_id'], unique=False)
+    op.create_index(op.f('ix_digital_twin_layer_association_group_id'), 'digital_twin_layer_association', ['group_id'], unique=False)
+    op.create_index('ix_group_digital_twin_id_sort_order', 'group', ['digital_twin_id', 'sort_order'], unique=False)
+    op.create_index(op.f('ix_group_parent_id'), 'group', ['parent_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_group_parent_id'), table_name='group')
+    op.drop_index('ix_group_digital_twin_id_sort_order', table_name='group')
+    op.drop_index(op.f('ix_digital_twin_layer_association_group_id'), table_name='digital_twin_layer_association')
+    op.drop_index(op.f('ix_digital_twin_layer_association_layer_id'), table_name='digital_twin_layer_association')
+    op.drop_index(op.f('ix_digital_twin_tool_association_tool_id'), table_name='digital_twin_tool_association')
+    op.drop_index('ix_digital_twin_tool_association_content', table_name='digital_twin_tool_association')
+    op.drop_index('ix_digital_twin_tool_association_lookup', table_name='digital_twin_tool_association')
@@ -0,0 +1,37 @@
+"""Add digital twin export table
+
+Revision ID: c5f1a9e2d843
+Revises: e3a58c0d7f21
+Create Date: 2026-10-17 13:05:51.207334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f1a9e2d843'
+down_revision: Union[str, None] = 'e3a58c0d7f21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('digital_twin_export',
+    sa.Column('digital_twin_id', sa.Integer(), nullable=False),
+    sa.Column('filename', sa.String(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('fingerprint', sa.String(length=40), nullable=False),
+    sa.Column('generated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['digital_twin_id'], ['digital_twin.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('digital_twin_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('digital_twin_export')
@@ -0,0 +1,51 @@
+"""Add job table
+
+Revision ID: d8b3e6f1a502
+Revises: c5f1a9e2d843
+Create Date: 2026-10-17 14:21:37.940115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b3e6f1a502'
+down_revision: Union[str, None] = 'c5f1a9e2d843'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=False),
+    sa.Column('params', sa.JSON(), nullable=False),
+    sa.Column('progress', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Integer(), nullable=True),
+    sa.Column('message', sa.String(), nullable=True),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('result_file', sa.LargeBinary(), nullable=True),
+    sa.Column('result_filename', sa.String(), nullable=True),
+    sa.Column('result_media_type', sa.String(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_job_id'), 'job', ['id'], unique=False)
+    op.create_index('ix_job_status_id', 'job', ['status', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_status_id', table_name='job')
+    op.drop_index(op.f('ix_job_id'), table_name='job')
+    op.drop_table('job')
@@ -0,0 +1,45 @@
+"""Cascade digital twin deletes
+
+Revision ID: e3a58c0d7f21
+Revises: b7d20f6e4a19
+Create Date: 2026-10-17 11:42:08.513620
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a58c0d7f21'
+down_revision: Union[str, None] = 'b7d20f6e4a19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referred table, ON DELETE action), the constraints keep the default Postgres names.
+# Group references are set to NULL rather than checked, so a twin delete that removes groups and
+# layer associations in the same statement does not depend on the order the cascades run in.
+FOREIGN_KEYS = [
+    ('digital_twin_layer_association', 'digital_twin_id', 'digital_twin', 'CASCADE'),
+    ('digital_twin_layer_association', 'group_id', 'group', 'SET NULL'),
+    ('digital_twin_tool_association', 'digital_twin_id', 'digital_twin', 'CASCADE'),
+    ('viewer', 'digital_twin_id', 'digital_twin', 'CASCADE'),
+    ('group', 'parent_id', 'group', 'SET NULL'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, referred_table, ondelete in FOREIGN_KEYS:
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred_table, [column], ['id'], ondelete=ondelete)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, referred_table, _ in reversed(FOREIGN_KEYS):
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referred_table, [column], ['id'])
@@ -0,0 +1,35 @@
+"""Add digital twin published export table
+
+Revision ID: f2c7d94b1e36
+Revises: d8b3e6f1a502
+Create Date: 2026-10-17 15:48:12.663081
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c7d94b1e36'
+down_revision: Union[str, None] = 'd8b3e6f1a502'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('digital_twin_published_export',
+    sa.Column('digital_twin_id', sa.Integer(), nullable=False),
+    sa.Column('content', sa.Text(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('published_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['digital_twin_id'], ['digital_twin.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('digital_twin_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('digital_twin_published_export')
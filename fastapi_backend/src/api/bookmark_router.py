@@ -1,6 +1,10 @@
+from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from api.responses import validated_response
 import services.bookmark_service as service
 from schemas.bookmark_schema import (
     BookmarkCreate,
@@ -11,37 +15,51 @@ from schemas.bookmark_schema import (
 
 router = APIRouter(prefix="/bookmarks", tags=["Bookmarks"])
 
+# Validates and serializes the list route in one pass
+BOOKMARK_LIST_ADAPTER = TypeAdapter(list[BookmarkResponse])
+
 @router.get("/", response_model=list[BookmarkResponse])
-def get_all_bookmark(db: Session = Depends(get_db)):
-    return service.get_all_bookmarks(db)
+async def get_all_bookmark(db: AsyncSession = Depends(get_async_db)):
+    rows = await service.get_all_bookmarks(db)
+    return validated_response(BOOKMARK_LIST_ADAPTER.validate_python(rows, from_attributes=True), BOOKMARK_LIST_ADAPTER)
 
 @router.get("/search", response_model=PaginatedBookmarksResponse)
-def get_bookmarks_search(
-    db: Session = Depends(get_db),
+async def get_bookmarks_search(
+    db: AsyncSession = Depends(get_async_db),
     search: str | None = Query(None, description="Search term"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_column: str = Query("title", description="Sort column"),
-    sort_direction: str = Query("asc", description="Sort direction: asc or desc")
+    sort_direction: str = Query("asc", description="Sort direction: asc or desc"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor for cursor pagination, empty for the first page"),
+    count: Literal["exact", "estimated", "cached", "none"] = Query("exact", description="How to compute total, none only reports has_more")
 ):
     params = {}
     if search:
         params['search'] = search
-    results, total = service.get_bookmarks_filtered_paginated(
-        db,
-        **params,
-        page=page,
-        page_size=page_size,
-        sort_column=sort_column,
-        sort_direction=sort_direction
-    )
-    results = [BookmarkResponse.model_validate(b, from_attributes=True) for b in results]
-    return PaginatedBookmarksResponse(
+    try:
+        result = await service.get_bookmarks_filtered_paginated(
+            db,
+            **params,
+            page=page,
+            page_size=page_size,
+            sort_column=sort_column,
+            sort_direction=sort_direction,
+            cursor=cursor,
+            count_strategy=count
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = [BookmarkResponse.model_validate(b, from_attributes=True) for b in result.results]
+    response = PaginatedBookmarksResponse(
         results=results,
-        total=total,
+        total=result.total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor
     )
+    return validated_response(response)
 
 @router.get("/{bookmark_id}", response_model=BookmarkResponse)
 def get_bookmark(bookmark_id: int, db: Session = Depends(get_db)):
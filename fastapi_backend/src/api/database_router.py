@@ -0,0 +1,12 @@
+from fastapi import APIRouter
+from db import database, pool_metrics
+
+router = APIRouter(prefix="/database", tags=["Database"])
+
+@router.get("/pool")
+def get_pool_metrics():
+    """Connection pool usage: current checkouts and overflow plus wait times since startup"""
+    return {
+        "sync": pool_metrics.snapshot(database.engine),
+        "async": pool_metrics.snapshot(database.async_engine),
+    }
\ No newline at end of file
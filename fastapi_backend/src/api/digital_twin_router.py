@@ -1,6 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from api.responses import validated_response
 import services.digital_twin_service as service
 import services.viewer_service as viewer_service
 import services.digital_twin_layer_relation_service as layer_service
@@ -28,43 +31,57 @@ from schemas.viewer_schema import (
 from schemas.digital_twin_tool_association_schema import (
     DigitalTwinToolBulkOperation
 )
-from typing import Dict, Any
+from typing import Dict, Any, Literal
 from sqlalchemy.exc import IntegrityError
 
 router = APIRouter(prefix="/digital-twins", tags=["Digital Twins"])
 
+# Validates and serializes the list route in one pass
+DIGITAL_TWIN_LIST_ADAPTER = TypeAdapter(list[DigitalTwinListResponse])
+
 @router.get("/", response_model=list[DigitalTwinListResponse])
-def read_all_digital_twins(db: Session = Depends(get_db)):
-    return service.list_digital_twins(db)
+async def read_all_digital_twins(db: AsyncSession = Depends(get_async_db)):
+    rows = await service.list_digital_twins(db)
+    return validated_response(DIGITAL_TWIN_LIST_ADAPTER.validate_python(rows, from_attributes=True), DIGITAL_TWIN_LIST_ADAPTER)
 
 @router.get("/search", response_model=PaginatedDigitalTwinResponse)
-def get_digital_twins_search(
-    db: Session = Depends(get_db),
+async def get_digital_twins_search(
+    db: AsyncSession = Depends(get_async_db),
     search: str | None = Query(None, description="Search term"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_column: str = Query("name", description="Sort column"),
-    sort_direction: str = Query("asc", description="Sort direction: asc or desc")
+    sort_direction: str = Query("asc", description="Sort direction: asc or desc"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor for cursor pagination, empty for the first page"),
+    count: Literal["exact", "estimated", "cached", "none"] = Query("exact", description="How to compute total, none only reports has_more")
 ):
-    results, total = service.get_digital_twins_filtered_paginated(
-        db,
-        search or "",
-        page,
-        page_size,
-        sort_column,
-        sort_direction
-    )
-    results = [DigitalTwinListResponse.model_validate(twin, from_attributes=True) for twin in results]
-    return PaginatedDigitalTwinResponse(
+    try:
+        result = await service.get_digital_twins_filtered_paginated(
+            db,
+            search or "",
+            page,
+            page_size,
+            sort_column,
+            sort_direction,
+            cursor=cursor,
+            count_strategy=count
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = [DigitalTwinListResponse.model_validate(twin, from_attributes=True) for twin in result.results]
+    response = PaginatedDigitalTwinResponse(
         results=results,
-        total=total,
+        total=result.total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor
     )
+    return validated_response(response)
 
 @router.get("/{digital_twin_id}", response_model=DigitalTwinResponse)
-def read_digital_twin(digital_twin_id: int, db: Session = Depends(get_db)):
-    twin = service.get_digital_twin(digital_twin_id, db)
+async def read_digital_twin(digital_twin_id: int, db: AsyncSession = Depends(get_async_db)):
+    twin = await service.get_digital_twin_with_associations(digital_twin_id, db)
     if not twin:
         raise HTTPException(status_code=404, detail="Digital twin not found")
     return twin
@@ -100,10 +117,8 @@ def update_digital_twin(digital_twin_id: int, data: DigitalTwinUpdate, db: Sessi
 
 @router.delete("/{digital_twin_id}", status_code=204)
 def delete_digital_twin(digital_twin_id: int, db: Session = Depends(get_db)):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.delete_digital_twin(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
-    service.delete_digital_twin(db_twin, db)
 
 # Viewer routes
 @router.get("/{digital_twin_id}/viewer", response_model=ViewerResponse)
@@ -137,8 +152,7 @@ def bulk_modify_layer_associations(
     payload: BulkAssociationsPayload,
     db: Session = Depends(get_db)
 ):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
 
     layer_results = layer_service.handle_bulk_layer_operations(
@@ -157,8 +171,7 @@ def bulk_modify_tool_associations(
     payload: DigitalTwinToolBulkOperation,
     db: Session = Depends(get_db)
 ):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
 
     results = tool_service.handle_bulk_tool_operations(
@@ -173,8 +186,7 @@ def bulk_modify_bookmark_associations(
     payload: DigitalTwinToolBulkOperation,
     db: Session = Depends(get_db)
 ):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
 
     results = bookmark_service.handle_bulk_bookmark_operations(
@@ -184,8 +196,7 @@ def bulk_modify_bookmark_associations(
 
 @router.get("/{digital_twin_id}/bookmarks")
 def get_digital_twin_bookmarks(digital_twin_id: int, db: Session = Depends(get_db)):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
     
     return bookmark_service.get_digital_twin_bookmarks(digital_twin_id, db)
@@ -197,8 +208,7 @@ def bulk_modify_project_associations(
     payload: DigitalTwinToolBulkOperation,
     db: Session = Depends(get_db)
 ):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
 
     results = project_service.handle_bulk_project_operations(
@@ -208,8 +218,7 @@ def bulk_modify_project_associations(
 
 @router.get("/{digital_twin_id}/projects")
 def get_digital_twin_projects(digital_twin_id: int, db: Session = Depends(get_db)):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
     
     return project_service.get_digital_twin_projects(digital_twin_id, db)
@@ -221,8 +230,7 @@ def bulk_modify_story_associations(
     payload: DigitalTwinToolBulkOperation,
     db: Session = Depends(get_db)
 ):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
 
     results = story_service.handle_bulk_story_operations(
@@ -232,8 +240,7 @@ def bulk_modify_story_associations(
 
 @router.get("/{digital_twin_id}/stories")
 def get_digital_twin_stories(digital_twin_id: int, db: Session = Depends(get_db)):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
     
     return story_service.get_digital_twin_stories(digital_twin_id, db)
@@ -245,8 +252,7 @@ def bulk_modify_terrain_provider_associations(
     payload: DigitalTwinToolBulkOperation,
     db: Session = Depends(get_db)
 ):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
 
     results = terrain_provider_service.handle_bulk_terrain_provider_operations(
@@ -256,8 +262,7 @@ def bulk_modify_terrain_provider_associations(
 
 @router.get("/{digital_twin_id}/terrain-providers")
 def get_digital_twin_terrain_providers(digital_twin_id: int, db: Session = Depends(get_db)):
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
     
     return terrain_provider_service.get_digital_twin_terrain_providers(digital_twin_id, db)
@@ -266,8 +271,7 @@ def get_digital_twin_terrain_providers(digital_twin_id: int, db: Session = Depen
 @router.get("/{digital_twin_id}/cesium/config")
 def get_cesium_configuration(digital_twin_id: int, db: Session = Depends(get_db)):
     """Get Cesium tool configuration for a digital twin"""
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
     
     config = cesium_config_service.get_cesium_configuration(digital_twin_id, db)
@@ -280,8 +284,7 @@ def update_cesium_configuration(
     db: Session = Depends(get_db)
 ):
     """Update Cesium tool configuration for a digital twin"""
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
     
     cesium_config_service.update_cesium_configuration(digital_twin_id, config, db)
@@ -290,8 +293,7 @@ def update_cesium_configuration(
 @router.delete("/{digital_twin_id}/cesium/config")
 def delete_cesium_configuration(digital_twin_id: int, db: Session = Depends(get_db)):
     """Delete Cesium tool configuration for a digital twin"""
-    db_twin = service.get_digital_twin(digital_twin_id, db)
-    if not db_twin:
+    if not service.digital_twin_exists(digital_twin_id, db):
         raise HTTPException(status_code=404, detail="Digital twin not found")
     
     cesium_config_service.delete_cesium_configuration(digital_twin_id, db)
@@ -1,27 +1,127 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 import services.export_service as service
+import services.export_cache_service as export_cache_service
+import services.export_artifact_service as artifact_service
+import services.export_diff_service as diff_service
+import services.export_stream_service as stream_service
 from sqlalchemy.orm import Session
-from db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
 
-from fastapi.responses import StreamingResponse
-import io
-import json
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 router = APIRouter(prefix="/digital-twins/{digital_twin_id}/export", tags=["Digital Twin Export"])
+bulk_router = APIRouter(prefix="/digital-twins/export", tags=["Digital Twin Export"])
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # Weak comparison, as required for If-None-Match
+    return "*" in candidates or etag in [candidate.removeprefix("W/") for candidate in candidates]
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if name.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
 
 @router.get("/download.json")
-async def export_digital_twin_file(digital_twin_id: int, db: Session = Depends(get_db)):
+async def export_digital_twin_file(
+    digital_twin_id: int,
+    request: Request,
+    compact: bool = Query(False, description="Render without indentation"),
+    live: bool = Query(False, description="Render the export now instead of serving the stored export"),
+    db: AsyncSession = Depends(get_async_db)
+):
     try:
-        name, export_data = service.export_digital_twin(db, digital_twin_id)
-        file_like = io.BytesIO(json.dumps(export_data, indent=2).encode("utf-8"))
+        fingerprint = await export_cache_service.get_fingerprint_async(db, digital_twin_id)
+        if fingerprint is None:
+            raise ValueError("Digital twin not found")
 
-        return StreamingResponse(file_like, media_type="application/json", headers={
-            "Content-Disposition": f"attachment; filename={name}.config.json"
-        })
+        use_gzip = accepts_gzip(request.headers.get("accept-encoding"))
+        # Every representation (indented/compact, plain/gzip) gets its own strong ETag
+        variant = ("-compact" if compact else "") + ("-gzip" if use_gzip else "")
+        cache_headers = {"ETag": f'"{fingerprint}{variant}"', "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        # Unchanged since the client's copy: skip rendering and serialization entirely
+        if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+            return Response(status_code=304, headers=cache_headers)
+
+        # The export worker keeps a rendered copy of every twin, served while its inputs are unchanged
+        stored = None if live else await artifact_service.get_current_export(db, digital_twin_id, fingerprint)
+        if stored is not None:
+            name = stored.filename
+            if compact:
+                body = stream_service.iter_export_json(json.loads(stored.content), compact=True)
+            else:
+                body = stream_service.iter_text(stored.content)
+        else:
+            cached = None if live else export_cache_service.get(digital_twin_id, fingerprint)
+            if cached is None:
+                # Rendering is blocking ORM and CPU work, keep it off the event loop
+                fingerprint, cached = await run_in_threadpool(service.render_digital_twin_export, digital_twin_id, live)
+                # A write committed since the check above is in the render, tag it with the render's fingerprint
+                cache_headers["ETag"] = f'"{fingerprint}{variant}"'
+            name, export_data = cached
+            body = stream_service.iter_export_json(export_data, compact=compact)
+        headers = {
+            "Content-Disposition": f"attachment; filename={name}.config.json",
+            **cache_headers
+        }
+        if use_gzip:
+            body = stream_service.iter_gzip(body)
+            headers["Content-Encoding"] = "gzip"
+
+        return StreamingResponse(body, media_type="application/json", headers=headers)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         print(f"Export error: {str(e)}")
         import traceback
         traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"Export error: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Export error: {str(e)}")
+
+@router.post("/publish")
+def publish_digital_twin_export(digital_twin_id: int, db: Session = Depends(get_db)):
+    """Record the current export as published, returning the JSON Patch from the previous publication"""
+    try:
+        return diff_service.publish_digital_twin(digital_twin_id, db)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+@router.get("/diff")
+async def get_digital_twin_export_diff(digital_twin_id: int, request: Request, db: AsyncSession = Depends(get_async_db)):
+    """RFC 6902 JSON Patch from the last published export to the current export"""
+    fingerprint = await export_cache_service.get_fingerprint_async(db, digital_twin_id)
+    if fingerprint is None:
+        raise HTTPException(status_code=404, detail="Digital twin not found")
+    published = await diff_service.get_published_export(digital_twin_id, db)
+    if published is None:
+        raise HTTPException(status_code=404, detail="Digital twin has not been published")
+    # The patch only changes when the twin's inputs or the published export change
+    etag = f'"{published.content_hash}-{fingerprint}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    try:
+        # Rendering and diffing are blocking work, keep them off the event loop. The ETag uses the
+        # fingerprint of the render, which includes writes committed since the check above.
+        fingerprint, patch = await run_in_threadpool(diff_service.diff_with_published, digital_twin_id, published.content)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    etag = f'"{published.content_hash}-{fingerprint}"'
+    return ORJSONResponse(patch, media_type="application/json-patch+json", headers={"ETag": etag})
+
+@bulk_router.get("/download.zip")
+def export_digital_twins_zip(
+    ids: list[int] | None = Query(None, description="Digital twin IDs to export, all digital twins when omitted"),
+    compact: bool = Query(False, description="Render without indentation")
+):
+    exports = service.export_digital_twins(ids)
+    return StreamingResponse(
+        stream_service.iter_export_zip(exports, compact=compact),
+        media_type="application/zip",
+        headers={"Content-Disposition": "attachment; filename=digital_twins.zip"}
+    )
\ No newline at end of file
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from db.database import get_db
-from schemas.group_schema import GroupCreate, GroupUpdate, GroupResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from schemas.group_schema import GroupCreate, GroupUpdate, GroupResponse, GroupTreeNode
 import services.group_service as service
 
 router = APIRouter(prefix="/digital-twins/{digital_twin_id}/groups", tags=["Digital Twin Groups"])
@@ -10,6 +11,11 @@ router = APIRouter(prefix="/digital-twins/{digital_twin_id}/groups", tags=["Digi
 def list_groups(digital_twin_id: int, db: Session = Depends(get_db)):
     return service.list_groups(digital_twin_id, db)
 
+# Declared before /{group_id} so "tree" is not parsed as a group id
+@router.get("/tree", response_model=list[GroupTreeNode])
+async def get_group_tree(digital_twin_id: int, db: AsyncSession = Depends(get_async_db)):
+    return await service.get_group_tree(digital_twin_id, db)
+
 @router.get("/{group_id}", response_model=GroupResponse)
 def get_group(digital_twin_id: int, group_id: int, db: Session = Depends(get_db)):
     group = service.get_group(group_id, db)
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from schemas.job_schema import JobCreate, JobResponse
+import services.job_service as service
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+@router.post("/", response_model=JobResponse, status_code=202)
+def submit_job(job: JobCreate, db: Session = Depends(get_db)):
+    """Queue a job for the job worker (python -m scripts.manage worker) and return it right away"""
+    try:
+        return service.submit_job(job.type, job.params, db)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: int, db: AsyncSession = Depends(get_async_db)):
+    job = await service.get_job(job_id, db)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.get("/{job_id}/result")
+async def get_job_result(job_id: int, db: AsyncSession = Depends(get_async_db)):
+    job = await service.get_job_with_result(job_id, db)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    if job.result_file is not None:
+        return Response(
+            content=job.result_file,
+            media_type=job.result_media_type,
+            headers={"Content-Disposition": f"attachment; filename={job.result_filename}"}
+        )
+    return job.result
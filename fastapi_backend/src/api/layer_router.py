@@ -1,42 +1,72 @@
+from typing import Literal, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from db.database import get_db
-from schemas.layer_schema import LayerCreate, LayerUpdate, LayerResponse, PaginatedLayersResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from api.responses import validated_response
+from schemas.layer_schema import LayerCreate, LayerUpdate, LayerResponse, LayerSummary, PaginatedLayersResponse
+from schemas.sparse_fields import FIELDS_DESCRIPTION, parse_fields, to_response
 from schemas.digital_twin_schema import DigitalTwinSummary
 import services.layer_service as service
 
 router = APIRouter(prefix="/layers", tags=["Layers"])
 
-@router.get("/", response_model=list[LayerResponse])
-def get_layers(db: Session = Depends(get_db)):
-    return service.list_layers(db)
+# Validates and serializes the list route in one pass
+LAYER_LIST_ADAPTER = TypeAdapter(list[Union[LayerResponse, LayerSummary]])
 
-@router.get("/search", response_model=PaginatedLayersResponse)
-def get_layers_search(
-    db: Session = Depends(get_db),
+@router.get("/", response_model=list[Union[LayerResponse, LayerSummary]], response_model_exclude_unset=True)
+async def get_layers(
+    db: AsyncSession = Depends(get_async_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
+):
+    try:
+        columns = parse_fields(fields, LayerResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    layers = await service.list_layers(db, columns)
+    results = [to_response(layer, LayerResponse, LayerSummary, columns) for layer in layers]
+    return validated_response(results, LAYER_LIST_ADAPTER, exclude_unset=True)
+
+@router.get("/search", response_model=PaginatedLayersResponse, response_model_exclude_unset=True)
+async def get_layers_search(
+    db: AsyncSession = Depends(get_async_db),
     search: str | None = Query(None, description="Search term"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_column: str = Query("title", description="Sort column"),
     sort_direction: str = Query("asc", description="Sort direction: asc or desc"),
-    is_background: bool | None = Query(None, description="Filter by isBackground")
+    is_background: bool | None = Query(None, description="Filter by isBackground"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor for cursor pagination, empty for the first page"),
+    count: Literal["exact", "estimated", "cached", "none"] = Query("exact", description="How to compute total, none only reports has_more"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
 ):
-    results, total = service.get_layers_filtered_paginated(
-        db,
-        search or "",
-        page,
-        page_size,
-        sort_column,
-        sort_direction,
-        is_background
-    )
-    results = [LayerResponse.model_validate(layer, from_attributes=True) for layer in results]
-    return PaginatedLayersResponse(
+    try:
+        columns = parse_fields(fields, LayerResponse)
+        result = await service.get_layers_filtered_paginated(
+            db,
+            search or "",
+            page,
+            page_size,
+            sort_column,
+            sort_direction,
+            is_background,
+            cursor=cursor,
+            count_strategy=count,
+            columns=columns
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = [to_response(layer, LayerResponse, LayerSummary, columns) for layer in result.results]
+    response = PaginatedLayersResponse(
         results=results,
-        total=total,
+        total=result.total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor
     )
+    return validated_response(response, exclude_unset=True)
 
 @router.get("/{layer_id}", response_model=LayerResponse)
 def read_layer(layer_id: int, db: Session = Depends(get_db)):
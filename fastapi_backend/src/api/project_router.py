@@ -1,44 +1,75 @@
+from typing import Literal, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from api.responses import validated_response
 import services.project_service as service
 from schemas.project_schema import (
     PaginatedProjectsResponse,
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
+    ProjectSummary,
 )
+from schemas.sparse_fields import FIELDS_DESCRIPTION, parse_fields, to_response
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
-@router.get("/", response_model=list[ProjectResponse])
-def get_all_projects(db: Session = Depends(get_db)):
-    return service.get_all_projects(db)
+# Validates and serializes the list route in one pass
+PROJECT_LIST_ADAPTER = TypeAdapter(list[Union[ProjectResponse, ProjectSummary]])
 
-@router.get("/search", response_model=PaginatedProjectsResponse)
-def get_projects_search(
-    db: Session = Depends(get_db),
+@router.get("/", response_model=list[Union[ProjectResponse, ProjectSummary]], response_model_exclude_unset=True)
+async def get_all_projects(
+    db: AsyncSession = Depends(get_async_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
+):
+    try:
+        columns = parse_fields(fields, ProjectResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    projects = await service.get_all_projects(db, columns)
+    results = [to_response(project, ProjectResponse, ProjectSummary, columns) for project in projects]
+    return validated_response(results, PROJECT_LIST_ADAPTER, exclude_unset=True)
+
+@router.get("/search", response_model=PaginatedProjectsResponse, response_model_exclude_unset=True)
+async def get_projects_search(
+    db: AsyncSession = Depends(get_async_db),
     search: str | None = Query(None, description="Search term"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_column: str = Query("name", description="Sort column"),
-    sort_direction: str = Query("asc", description="Sort direction: asc or desc")
+    sort_direction: str = Query("asc", description="Sort direction: asc or desc"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor for cursor pagination, empty for the first page"),
+    count: Literal["exact", "estimated", "cached", "none"] = Query("exact", description="How to compute total, none only reports has_more"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
 ):
-    results, total = service.get_projects_filtered_paginated(
-        db,
-        search or "",
-        page,
-        page_size,
-        sort_column,
-        sort_direction
-    )
-    results = [ProjectResponse.model_validate(project, from_attributes=True) for project in results]
-    return PaginatedProjectsResponse(
+    try:
+        columns = parse_fields(fields, ProjectResponse)
+        result = await service.get_projects_filtered_paginated(
+            db,
+            search or "",
+            page,
+            page_size,
+            sort_column,
+            sort_direction,
+            cursor=cursor,
+            count_strategy=count,
+            columns=columns
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = [to_response(project, ProjectResponse, ProjectSummary, columns) for project in result.results]
+    response = PaginatedProjectsResponse(
         results=results,
-        total=total,
+        total=result.total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor
     )
+    return validated_response(response, exclude_unset=True)
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project(project_id: int, db: Session = Depends(get_db)):
@@ -0,0 +1,118 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+
+# Send the timings of every response in a Server-Timing header (true/false)
+REQUEST_TIMING_HEADER = os.getenv("REQUEST_TIMING_HEADER", "true").lower() == "true"
+# Log a line per request: only "slow" ones (default), "all" requests, or "off"
+REQUEST_LOG = os.getenv("REQUEST_LOG", "slow").lower()
+# Requests taking at least this many milliseconds are logged as slow (0 disables)
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "500"))
+
+@dataclass
+class RequestTimings:
+    sql_ms: float = 0.0
+    sql_count: int = 0
+    serialize_ms: float = 0.0
+
+# Timings of the request being handled. Sync routes and streamed bodies run in worker threads
+# with a copy of the context, which still points at the same RequestTimings.
+_current: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._request_timing_start = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    timings = _current.get()
+    start = getattr(context, "_request_timing_start", None)
+    if timings is None or start is None:
+        return
+    timings.sql_ms += (time.perf_counter() - start) * 1000
+    timings.sql_count += 1
+
+def instrument(engine):
+    """Add the statements run on the engine to the timings of the current request (pass AsyncEngine.sync_engine for async engines)"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+@contextmanager
+def measure_serialization():
+    """Count the time spent in the block as serialization of the current request"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings = _current.get()
+        if timings is not None:
+            timings.serialize_ms += (time.perf_counter() - start) * 1000
+
+def server_timing(timings: RequestTimings, total_ms: float) -> str:
+    # Whatever is not SQL or serialization is the handler's own work (validation, Python code, waits)
+    app_ms = max(0.0, total_ms - timings.sql_ms - timings.serialize_ms)
+    return ", ".join([
+        f"app;dur={app_ms:.1f}",
+        f'db;dur={timings.sql_ms:.1f};desc="{timings.sql_count} {"query" if timings.sql_count == 1 else "queries"}"',
+        f"serialize;dur={timings.serialize_ms:.1f}",
+        f"total;dur={total_ms:.1f}",
+    ])
+
+def log_request(scope, status: int, timings: RequestTimings, total_ms: float):
+    slow = bool(SLOW_REQUEST_MS) and total_ms >= SLOW_REQUEST_MS
+    if REQUEST_LOG == "off" or (REQUEST_LOG == "slow" and not slow):
+        return
+    route = scope.get("route")
+    print(json.dumps({
+        "event": "slow_request" if slow else "request",
+        "method": scope["method"],
+        "path": scope["path"],
+        # The route template groups requests per endpoint, e.g. /layers/{layer_id}
+        "route": getattr(route, "path", None),
+        "status": status,
+        "duration_ms": round(total_ms, 1),
+        "db_ms": round(timings.sql_ms, 1),
+        "db_queries": timings.sql_count,
+        "serialize_ms": round(timings.serialize_ms, 1),
+    }))
+
+class RequestTimingMiddleware:
+    """Time every HTTP request: SQL (through instrument()), serialization and the total.
+
+    The Server-Timing header holds the timings up to the start of the response. The log line is
+    written when the response is complete, so it includes the body of streamed responses too.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if REQUEST_TIMING_HEADER:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(timings, (time.perf_counter() - start) * 1000))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            log_request(scope, status, timings, (time.perf_counter() - start) * 1000)
@@ -1,44 +1,75 @@
+from typing import Literal, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from api.responses import validated_response
 import services.story_service as service
 from schemas.story_schema import (
     PaginatedStoriesResponse,
     StoryCreate,
     StoryUpdate,
     StoryResponse,
+    StorySummary,
 )
+from schemas.sparse_fields import FIELDS_DESCRIPTION, parse_fields, to_response
 
 router = APIRouter(prefix="/stories", tags=["Stories"])
 
-@router.get("/", response_model=list[StoryResponse])
-def get_all_stories(db: Session = Depends(get_db)):
-    return service.get_all_stories(db)
+# Validates and serializes the list route in one pass
+STORY_LIST_ADAPTER = TypeAdapter(list[Union[StoryResponse, StorySummary]])
 
-@router.get("/search", response_model=PaginatedStoriesResponse)
-def get_stories_search(
-    db: Session = Depends(get_db),
+@router.get("/", response_model=list[Union[StoryResponse, StorySummary]], response_model_exclude_unset=True)
+async def get_all_stories(
+    db: AsyncSession = Depends(get_async_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
+):
+    try:
+        columns = parse_fields(fields, StoryResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    stories = await service.get_all_stories(db, columns)
+    results = [to_response(story, StoryResponse, StorySummary, columns) for story in stories]
+    return validated_response(results, STORY_LIST_ADAPTER, exclude_unset=True)
+
+@router.get("/search", response_model=PaginatedStoriesResponse, response_model_exclude_unset=True)
+async def get_stories_search(
+    db: AsyncSession = Depends(get_async_db),
     search: str | None = Query(None, description="Search term"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_column: str = Query("name", description="Sort column"),
-    sort_direction: str = Query("asc", description="Sort direction: asc or desc")
+    sort_direction: str = Query("asc", description="Sort direction: asc or desc"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor for cursor pagination, empty for the first page"),
+    count: Literal["exact", "estimated", "cached", "none"] = Query("exact", description="How to compute total, none only reports has_more"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
 ):
-    results, total = service.get_stories_filtered_paginated(
-        db,
-        search or "",
-        page,
-        page_size,
-        sort_column,
-        sort_direction
-    )
-    results = [StoryResponse.model_validate(story, from_attributes=True) for story in results]
-    return PaginatedStoriesResponse(
+    try:
+        columns = parse_fields(fields, StoryResponse)
+        result = await service.get_stories_filtered_paginated(
+            db,
+            search or "",
+            page,
+            page_size,
+            sort_column,
+            sort_direction,
+            cursor=cursor,
+            count_strategy=count,
+            columns=columns
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = [to_response(story, StoryResponse, StorySummary, columns) for story in result.results]
+    response = PaginatedStoriesResponse(
         results=results,
-        total=total,
+        total=result.total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor
     )
+    return validated_response(response, exclude_unset=True)
 
 @router.get("/{story_id}", response_model=StoryResponse)
 def get_story(story_id: int, db: Session = Depends(get_db)):
@@ -1,6 +1,10 @@
+from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from api.responses import validated_response
 import services.terrain_provider_service as service
 from schemas.terrain_provider_schema import (
     PaginatedTerrainProvidersResponse,
@@ -11,34 +15,48 @@ from schemas.terrain_provider_schema import (
 
 router = APIRouter(prefix="/terrain-providers", tags=["TerrainProvider"])
 
+# Validates and serializes the list route in one pass
+TERRAIN_PROVIDER_LIST_ADAPTER = TypeAdapter(list[TerrainProviderResponse])
+
 @router.get("/", response_model=list[TerrainProviderResponse])
-def get_all_terrain_providers(db: Session = Depends(get_db)):
-    return service.get_all_terrain_providers(db)
+async def get_all_terrain_providers(db: AsyncSession = Depends(get_async_db)):
+    rows = await service.get_all_terrain_providers(db)
+    return validated_response(TERRAIN_PROVIDER_LIST_ADAPTER.validate_python(rows, from_attributes=True), TERRAIN_PROVIDER_LIST_ADAPTER)
 
 @router.get("/search", response_model=PaginatedTerrainProvidersResponse)
-def get_terrain_providers_search(
-    db: Session = Depends(get_db),
+async def get_terrain_providers_search(
+    db: AsyncSession = Depends(get_async_db),
     search: str | None = Query(None, description="Search term"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_column: str = Query("title", description="Sort column"),
-    sort_direction: str = Query("asc", description="Sort direction: asc or desc")
+    sort_direction: str = Query("asc", description="Sort direction: asc or desc"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor for cursor pagination, empty for the first page"),
+    count: Literal["exact", "estimated", "cached", "none"] = Query("exact", description="How to compute total, none only reports has_more")
 ):
-    results, total = service.get_terrain_providers_filtered_paginated(
-        db,
-        search or "",
-        page,
-        page_size,
-        sort_column,
-        sort_direction
-    )
-    results = [TerrainProviderResponse.model_validate(tp, from_attributes=True) for tp in results]
-    return PaginatedTerrainProvidersResponse(
+    try:
+        result = await service.get_terrain_providers_filtered_paginated(
+            db,
+            search or "",
+            page,
+            page_size,
+            sort_column,
+            sort_direction,
+            cursor=cursor,
+            count_strategy=count
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = [TerrainProviderResponse.model_validate(tp, from_attributes=True) for tp in result.results]
+    response = PaginatedTerrainProvidersResponse(
         results=results,
-        total=total,
+        total=result.total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor
     )
+    return validated_response(response)
 
 @router.get("/{terrain_provider_id}", response_model=TerrainProviderResponse)
 def get_terrain_provider(terrain_provider_id: int, db: Session = Depends(get_db)):
@@ -1,40 +1,70 @@
+from typing import Literal, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from db.database import get_db
-from schemas.tool_schema import ToolCreate, ToolUpdate, ToolResponse, PaginatedToolsResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from api.responses import validated_response
+from schemas.tool_schema import ToolCreate, ToolUpdate, ToolResponse, ToolSummary, PaginatedToolsResponse
+from schemas.sparse_fields import FIELDS_DESCRIPTION, parse_fields, to_response
 import services.tool_service as service
 from sqlalchemy.exc import IntegrityError
 
 router = APIRouter(prefix="/tools", tags=["Tools"])
 
-@router.get("/", response_model=list[ToolResponse])
-def get_tools(db: Session = Depends(get_db)):
-    return service.list_tools(db)
+# Validates and serializes the list route in one pass
+TOOL_LIST_ADAPTER = TypeAdapter(list[Union[ToolResponse, ToolSummary]])
 
-@router.get("/search", response_model=PaginatedToolsResponse)
-def get_tools_search(
-    db: Session = Depends(get_db),
+@router.get("/", response_model=list[Union[ToolResponse, ToolSummary]], response_model_exclude_unset=True)
+async def get_tools(
+    db: AsyncSession = Depends(get_async_db),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
+):
+    try:
+        columns = parse_fields(fields, ToolResponse)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    tools = await service.list_tools(db, columns)
+    results = [to_response(tool, ToolResponse, ToolSummary, columns) for tool in tools]
+    return validated_response(results, TOOL_LIST_ADAPTER, exclude_unset=True)
+
+@router.get("/search", response_model=PaginatedToolsResponse, response_model_exclude_unset=True)
+async def get_tools_search(
+    db: AsyncSession = Depends(get_async_db),
     search: str | None = Query(None, description="Search term"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_column: str = Query("name", description="Sort column"),
-    sort_direction: str = Query("asc", description="Sort direction: asc or desc")
+    sort_direction: str = Query("asc", description="Sort direction: asc or desc"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor for cursor pagination, empty for the first page"),
+    count: Literal["exact", "estimated", "cached", "none"] = Query("exact", description="How to compute total, none only reports has_more"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION)
 ):
-    results, total = service.get_tools_filtered_paginated(
-        db,
-        search or "",
-        page,
-        page_size,
-        sort_column,
-        sort_direction
-    )
-    results = [ToolResponse.model_validate(tool, from_attributes=True) for tool in results]
-    return PaginatedToolsResponse(
+    try:
+        columns = parse_fields(fields, ToolResponse)
+        result = await service.get_tools_filtered_paginated(
+            db,
+            search or "",
+            page,
+            page_size,
+            sort_column,
+            sort_direction,
+            cursor=cursor,
+            count_strategy=count,
+            columns=columns
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = [to_response(tool, ToolResponse, ToolSummary, columns) for tool in result.results]
+    response = PaginatedToolsResponse(
         results=results,
-        total=total,
+        total=result.total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor
     )
+    return validated_response(response, exclude_unset=True)
 
 @router.get("/{tool_id}", response_model=ToolResponse)
 def read_tool(tool_id: int, db: Session = Depends(get_db)):
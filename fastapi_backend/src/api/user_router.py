@@ -1,39 +1,57 @@
+from typing import Literal
 from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-from db.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import get_db, get_async_db
+from api.responses import validated_response
 import services.user_service as service
 from schemas.user_schema import UserCreate, UserResponse, UserUpdate, PaginatedUsersResponse
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
+# Validates and serializes the list route in one pass
+USER_LIST_ADAPTER = TypeAdapter(list[UserResponse])
+
 @router.get("/", response_model=list[UserResponse])
-def read_all_users(db: Session = Depends(get_db)):
-    return service.list_users(db)
+async def read_all_users(db: AsyncSession = Depends(get_async_db)):
+    rows = await service.list_users(db)
+    return validated_response(USER_LIST_ADAPTER.validate_python(rows, from_attributes=True), USER_LIST_ADAPTER)
 
 @router.get("/search", response_model=PaginatedUsersResponse)
-def get_users_search(
-    db: Session = Depends(get_db),
+async def get_users_search(
+    db: AsyncSession = Depends(get_async_db),
     search: str | None = Query(None, description="Search term"),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
     sort_column: str = Query("name", description="Sort column"),
-    sort_direction: str = Query("asc", description="Sort direction: asc or desc")
+    sort_direction: str = Query("asc", description="Sort direction: asc or desc"),
+    cursor: str | None = Query(None, description="Cursor from next_cursor for cursor pagination, empty for the first page"),
+    count: Literal["exact", "estimated", "cached", "none"] = Query("exact", description="How to compute total, none only reports has_more")
 ):
-    results, total = service.get_users_filtered_paginated(
-        db,
-        search or "",
-        page,
-        page_size,
-        sort_column,
-        sort_direction
-    )
-    results = [UserResponse.model_validate(u, from_attributes=True) for u in results]
-    return PaginatedUsersResponse(
+    try:
+        result = await service.get_users_filtered_paginated(
+            db,
+            search or "",
+            page,
+            page_size,
+            sort_column,
+            sort_direction,
+            cursor=cursor,
+            count_strategy=count
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    results = [UserResponse.model_validate(u, from_attributes=True) for u in result.results]
+    response = PaginatedUsersResponse(
         results=results,
-        total=total,
+        total=result.total,
         page=page,
-        page_size=page_size
+        page_size=page_size,
+        has_more=result.has_more,
+        next_cursor=result.next_cursor
     )
+    return validated_response(response)
 
 @router.get("/{user_id}", response_model=UserResponse)
 def read_user(user_id: int, db: Session = Depends(get_db)):
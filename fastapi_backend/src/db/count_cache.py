@@ -0,0 +1,72 @@
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Seconds a cached search count stays valid; writes from this process invalidate it earlier,
+# the TTL bounds how stale counts can get after writes from other workers
+SEARCH_COUNT_CACHE_TTL = float(os.getenv("SEARCH_COUNT_CACHE_TTL", "30"))
+SEARCH_COUNT_CACHE_SIZE = int(os.getenv("SEARCH_COUNT_CACHE_SIZE", "1024"))
+
+# table name -> {query key -> (expires_at, count)}
+_cache: dict[str, dict[tuple, tuple[float, int]]] = {}
+_lock = threading.Lock()
+
+def get(table: str, key: tuple) -> Optional[int]:
+    with _lock:
+        entry = _cache.get(table, {}).get(key)
+    if entry is None or entry[0] < time.monotonic():
+        return None
+    return entry[1]
+
+def put(table: str, key: tuple, count: int):
+    if SEARCH_COUNT_CACHE_TTL <= 0:
+        return
+    with _lock:
+        entries = _cache.setdefault(table, {})
+        if len(entries) >= SEARCH_COUNT_CACHE_SIZE:
+            entries.clear()
+        entries[key] = (time.monotonic() + SEARCH_COUNT_CACHE_TTL, count)
+
+def invalidate(*tables: str):
+    with _lock:
+        for table in tables:
+            _cache.pop(table, None)
+
+def clear():
+    with _lock:
+        _cache.clear()
+
+# Invalidate on commit of any session that wrote to a table, through the unit of work
+# or through insert()/update()/delete() statements
+
+def _pending_tables(session) -> set:
+    return session.info.setdefault("count_cache_tables", set())
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session, flush_context):
+    tables = _pending_tables(session)
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            tables.add(table.name)
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_statement_tables(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        table = getattr(orm_execute_state.statement, "table", None)
+        if table is not None:
+            _pending_tables(orm_execute_state.session).add(table.name)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tables(session):
+    tables = session.info.pop("count_cache_tables", None)
+    if tables:
+        invalidate(*tables)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_tables(session):
+    session.info.pop("count_cache_tables", None)
@@ -2,6 +2,8 @@ import os
 from dotenv import load_dotenv, find_dotenv
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from db import pool_metrics
 
 # Use RUNNING_IN_DOCKER to switch between .env files
 if os.getenv("RUNNING_IN_DOCKER") == "true":
@@ -18,9 +20,57 @@ POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
 DATABASE_URL = (
     f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
 )
+# Same database through asyncpg, used by the read-only routes
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
-engine = create_engine(DATABASE_URL, echo=True)
+# Engine and pool settings, the defaults suit a single API worker
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+
+connect_args = {}
+if DB_STATEMENT_TIMEOUT_MS > 0:
+    connect_args["options"] = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS}"
+
+engine = create_engine(
+    DATABASE_URL,
+    echo=DB_ECHO,
+    poolclass=pool_metrics.MeteredQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    connect_args=connect_args,
+)
+pool_metrics.instrument(engine)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+async_connect_args = {}
+if DB_STATEMENT_TIMEOUT_MS > 0:
+    async_connect_args["server_settings"] = {"statement_timeout": str(DB_STATEMENT_TIMEOUT_MS)}
+
+# Async requests do not hold a threadpool worker while waiting on Postgres, so this pool
+# is sized separately from the sync one
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=DB_ECHO,
+    poolclass=pool_metrics.MeteredAsyncQueuePool,
+    pool_size=int(os.getenv("DB_ASYNC_POOL_SIZE", str(DB_POOL_SIZE))),
+    max_overflow=int(os.getenv("DB_ASYNC_MAX_OVERFLOW", str(DB_MAX_OVERFLOW))),
+    pool_timeout=DB_POOL_TIMEOUT,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_pre_ping=DB_POOL_PRE_PING,
+    connect_args=async_connect_args,
+)
+pool_metrics.instrument(async_engine.sync_engine)
+# expire_on_commit=False keeps loaded attributes usable after commit without lazy IO
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -29,3 +79,8 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
\ No newline at end of file
@@ -0,0 +1,27 @@
+from sqlalchemy import MetaData, UniqueConstraint
+
+def _index_prefixes(table) -> list[tuple[str, ...]]:
+    """Column names of the primary key, every index and every unique constraint of the table"""
+    prefixes = [tuple(column.name for column in table.primary_key.columns)]
+    prefixes += [tuple(column.name for column in index.columns) for index in table.indexes]
+    prefixes += [
+        tuple(column.name for column in constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+    ]
+    return prefixes
+
+def find_unindexed_foreign_keys(metadata: MetaData) -> list[str]:
+    """Foreign keys whose columns are not the leading columns of any index, as "table(column, ...)".
+
+    Postgres does not index foreign key columns by itself, so joins on them and the checks it runs
+    when the referenced row is deleted scan the whole table.
+    """
+    unindexed = []
+    for table in metadata.sorted_tables:
+        prefixes = _index_prefixes(table)
+        for foreign_key in table.foreign_key_constraints:
+            columns = {column.name for column in foreign_key.columns}
+            if not any(set(prefix[:len(columns)]) == columns for prefix in prefixes):
+                unindexed.append(f"{table.name}({', '.join(sorted(columns))})")
+    return unindexed
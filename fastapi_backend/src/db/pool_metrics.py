@@ -0,0 +1,122 @@
+import os
+import threading
+import time
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# Log a warning when a request waits longer than this for a pooled connection (0 disables)
+DB_POOL_WAIT_WARNING_MS = float(os.getenv("DB_POOL_WAIT_WARNING_MS", "100"))
+
+_lock = threading.Lock()
+
+def _new_counters() -> dict:
+    return {
+        "connects": 0,
+        "checkouts": 0,
+        "checkins": 0,
+        "timeouts": 0,
+        "total_wait_ms": 0.0,
+        "max_wait_ms": 0.0,
+    }
+
+# Counters per engine kind, "sync" for the psycopg2 engine and "async" for the asyncpg engine
+_counters = {"sync": _new_counters(), "async": _new_counters()}
+
+def _increment(kind: str, name: str):
+    with _lock:
+        _counters[kind][name] += 1
+
+def record_wait(kind: str, wait_ms: float, timed_out: bool = False):
+    with _lock:
+        counters = _counters[kind]
+        counters["total_wait_ms"] += wait_ms
+        counters["max_wait_ms"] = max(counters["max_wait_ms"], wait_ms)
+        if timed_out:
+            counters["timeouts"] += 1
+    if DB_POOL_WAIT_WARNING_MS and wait_ms >= DB_POOL_WAIT_WARNING_MS:
+        print(f"Warning: waited {wait_ms:.1f} ms for a {kind} database connection, the pool may be too small")
+
+# Milliseconds spent opening new connections in the checkout being timed, in a list so nested
+# calls add to it. A context variable because async checkouts of one thread run in separate greenlets.
+_checkout_connect_ms: ContextVar[Optional[list]] = ContextVar("checkout_connect_ms", default=None)
+
+class _MeteredPoolMixin:
+    """Records how long each checkout waits for a free connection.
+
+    Opening a new connection is not waiting for the pool, so that time is left out, and only
+    pool timeouts count as timeouts (not refused connections or failed logins).
+    """
+    _metrics_kind = "sync"
+
+    def __init__(self, *args, max_overflow: int = 10, **kwargs):
+        super().__init__(*args, max_overflow=max_overflow, **kwargs)
+        # The configured limit, for snapshot()
+        self.max_overflow = max_overflow
+
+    def _create_connection(self):
+        start = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            connect_ms = _checkout_connect_ms.get()
+            if connect_ms is not None:
+                connect_ms[0] += (time.perf_counter() - start) * 1000
+
+    def _do_get(self):
+        if _checkout_connect_ms.get() is not None:
+            # QueuePool retries by calling _do_get again, the outer call is already timing
+            return super()._do_get()
+        connect_ms = [0.0]
+        token = _checkout_connect_ms.set(connect_ms)
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            _checkout_connect_ms.reset(token)
+            wait_ms = (time.perf_counter() - start) * 1000 - connect_ms[0]
+            record_wait(self._metrics_kind, max(wait_ms, 0.0), timed_out)
+
+class MeteredQueuePool(_MeteredPoolMixin, QueuePool):
+    pass
+
+class MeteredAsyncQueuePool(_MeteredPoolMixin, AsyncAdaptedQueuePool):
+    _metrics_kind = "async"
+
+def _kind(engine) -> str:
+    return "async" if engine.dialect.is_async else "sync"
+
+def instrument(engine):
+    """Count connects, checkouts and checkins on the engine's pool (pass AsyncEngine.sync_engine for async engines)"""
+    kind = _kind(engine)
+    event.listen(engine, "connect", lambda *args: _increment(kind, "connects"))
+    event.listen(engine, "checkout", lambda *args: _increment(kind, "checkouts"))
+    event.listen(engine, "checkin", lambda *args: _increment(kind, "checkins"))
+
+def snapshot(engine) -> dict:
+    """Current pool state plus the counters collected since the process started"""
+    with _lock:
+        stats = dict(_counters[_kind(engine)])
+    checkouts = stats["checkouts"]
+    stats["avg_wait_ms"] = stats["total_wait_ms"] / checkouts if checkouts else 0.0
+
+    pool = engine.pool
+    if isinstance(pool, _MeteredPoolMixin):
+        stats.update(
+            pool_size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool.max_overflow,
+        )
+    return stats
+
+def reset():
+    with _lock:
+        for kind in _counters:
+            _counters[kind] = _new_counters()
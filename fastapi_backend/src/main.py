@@ -1,8 +1,12 @@
 from fastapi import FastAPI
-from api import layer_router, user_router, digital_twin_router, group_router, tool_router, project_router, story_router, bookmark_router, terrain_provider_router, export_router, content_type_router
+from api import layer_router, user_router, digital_twin_router, group_router, tool_router, project_router, story_router, bookmark_router, terrain_provider_router, export_router, content_type_router, database_router, job_router
 from fastapi.middleware.cors import CORSMiddleware
+from api.request_timing import RequestTimingMiddleware, instrument
+from api.responses import TimedORJSONResponse
+from db import database
 
-app = FastAPI()
+# Render JSON responses with orjson instead of the stdlib encoder
+app = FastAPI(default_response_class=TimedORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -10,16 +14,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Let the frontend read the timings of cross-origin responses
+    expose_headers=["Server-Timing"],
 )
 
+# Added last so it wraps every router and the CORS middleware
+instrument(database.engine)
+instrument(database.async_engine.sync_engine)
+app.add_middleware(RequestTimingMiddleware)
+
 app.include_router(user_router.router)
 app.include_router(digital_twin_router.router)
 app.include_router(layer_router.router)
 app.include_router(group_router.router)
 app.include_router(tool_router.router)
 app.include_router(export_router.router)
+app.include_router(export_router.bulk_router)
 app.include_router(project_router.router)
 app.include_router(terrain_provider_router.router)
 app.include_router(story_router.router)
 app.include_router(bookmark_router.router)
-app.include_router(content_type_router.router)
\ No newline at end of file
+app.include_router(content_type_router.router)
+app.include_router(database_router.router)
+app.include_router(job_router.router)
\ No newline at end of file
@@ -6,4 +6,6 @@ from .viewer import Viewer
 from .group import Group
 from .associations import DigitalTwinLayerAssociation, DigitalTwinToolAssociation
 from .tool_associations import Bookmark, Project, TerrainProvider, Story
-from .user import User
\ No newline at end of file
+from .user import User
+from .digital_twin_export import DigitalTwinExport, DigitalTwinPublishedExport
+from .job import Job
@@ -1,12 +1,13 @@
-from sqlalchemy import Column, Integer, ForeignKey, Boolean, String, JSON
+from sqlalchemy import Column, Integer, ForeignKey, Boolean, String, JSON, Index
 from sqlalchemy.orm import relationship
 from db.database import Base
 
 class DigitalTwinLayerAssociation(Base):
     __tablename__ = "digital_twin_layer_association"
-    digital_twin_id = Column(Integer, ForeignKey("digital_twin.id"), primary_key=True)
-    layer_id = Column(Integer, ForeignKey("layer.id"), primary_key=True)
-    group_id = Column(Integer, ForeignKey("group.id"), nullable=True, default=None)
+    digital_twin_id = Column(Integer, ForeignKey("digital_twin.id", ondelete="CASCADE"), primary_key=True)
+    # The primary key serves lookups by digital twin, layer_id needs its own index
+    layer_id = Column(Integer, ForeignKey("layer.id"), primary_key=True, index=True)
+    group_id = Column(Integer, ForeignKey("group.id", ondelete="SET NULL"), nullable=True, default=None, index=True)
     is_default = Column(Boolean, default=False, nullable=False)
     sort_order = Column(Integer, nullable=False)
     content = Column(JSON, nullable=True)
@@ -17,9 +18,15 @@ class DigitalTwinLayerAssociation(Base):
 
 class DigitalTwinToolAssociation(Base):
     __tablename__ = "digital_twin_tool_association"
+    __table_args__ = (
+        # The relation services and the export look up associations by twin, tool, content type and content
+        Index("ix_digital_twin_tool_association_lookup", "digital_twin_id", "tool_id", "content_type_id", "content_id"),
+        # Deleting a bookmark, project, story or terrain provider removes its associations
+        Index("ix_digital_twin_tool_association_content", "content_type_id", "content_id"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
-    digital_twin_id = Column(Integer, ForeignKey("digital_twin.id"), nullable=False)
-    tool_id = Column(Integer, ForeignKey("tool.id"), nullable=False)
+    digital_twin_id = Column(Integer, ForeignKey("digital_twin.id", ondelete="CASCADE"), nullable=False)
+    tool_id = Column(Integer, ForeignKey("tool.id"), nullable=False, index=True)
     content_type_id = Column(Integer, ForeignKey("content_types.id"), nullable=True)
     content_id = Column(Integer, nullable=True)
     sort_order = Column(Integer, nullable=False, default=0)
@@ -2,10 +2,17 @@ from sqlalchemy import Column, Integer, String, Boolean, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from db.database import Base
+from models.indexes import trigram_index
 from models.associations import DigitalTwinLayerAssociation, DigitalTwinToolAssociation
 
 class DigitalTwin(Base):
     __tablename__ = "digital_twin"
+    __table_args__ = (
+        trigram_index("digital_twin", "name"),
+        trigram_index("digital_twin", "title"),
+        trigram_index("digital_twin", "subtitle"),
+        trigram_index("digital_twin", "owner"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
@@ -15,10 +22,14 @@ class DigitalTwin(Base):
     isPrivate = Column(Boolean, default=False)
     last_updated = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
 
+    # The foreign keys to digital_twin cascade in the database, passive_deletes keeps the ORM
+    # from loading the viewer, groups and associations just to delete them
     viewer = relationship(
         "Viewer",
         back_populates="digital_twin",
-        uselist=False
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     groups = relationship(
@@ -32,7 +43,8 @@ class DigitalTwin(Base):
     layer_associations = relationship(
         "DigitalTwinLayerAssociation",
         back_populates="digital_twin",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     layers = relationship(
@@ -45,7 +57,8 @@ class DigitalTwin(Base):
         "DigitalTwinToolAssociation",
         order_by="DigitalTwinToolAssociation.tool_id",
         back_populates="digital_twin",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     tools = relationship(
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from db.database import Base
+
+class DigitalTwinExport(Base):
+    """The rendered export of a digital twin, kept up to date by the export worker"""
+    __tablename__ = "digital_twin_export"
+
+    digital_twin_id = Column(Integer, ForeignKey("digital_twin.id", ondelete="CASCADE"), primary_key=True)
+    filename = Column(String, nullable=False)
+    # The export as served by the download endpoint (json.dumps with indent=2)
+    content = Column(Text, nullable=False)
+    # SHA-256 of content, and the export fingerprint of the inputs it was rendered from
+    content_hash = Column(String(64), nullable=False)
+    fingerprint = Column(String(40), nullable=False)
+    generated_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
+
+class DigitalTwinPublishedExport(Base):
+    """The export of a digital twin as it was last published, the base of the export diff"""
+    __tablename__ = "digital_twin_published_export"
+
+    digital_twin_id = Column(Integer, ForeignKey("digital_twin.id", ondelete="CASCADE"), primary_key=True)
+    content = Column(Text, nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    published_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
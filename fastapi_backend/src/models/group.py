@@ -1,14 +1,18 @@
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from db.database import Base
 
 class Group(Base):
     __tablename__ = "group"
+    __table_args__ = (
+        # Groups are always loaded per digital twin in sort order
+        Index("ix_group_digital_twin_id_sort_order", "digital_twin_id", "sort_order"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     digital_twin_id = Column(Integer, ForeignKey("digital_twin.id", ondelete="CASCADE"), nullable=False)
-    parent_id = Column(Integer, ForeignKey("group.id"), nullable=True)
+    parent_id = Column(Integer, ForeignKey("group.id", ondelete="SET NULL"), nullable=True, index=True)
     sort_order = Column(Integer, nullable=False, default=0)
 
     digital_twin = relationship("DigitalTwin", back_populates="groups")
@@ -0,0 +1,10 @@
+from sqlalchemy import Index
+
+def trigram_index(table: str, column: str) -> Index:
+    """GIN trigram index that lets Postgres serve column ILIKE '%term%' (needs the pg_trgm extension)"""
+    return Index(
+        f"ix_{table}_{column.lower()}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"}
+    )
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, LargeBinary, Index
+from sqlalchemy.orm import deferred
+from sqlalchemy.sql import func
+from db.database import Base
+
+# queued -> running -> succeeded or failed
+JOB_STATUSES = ("queued", "running", "succeeded", "failed")
+
+class Job(Base):
+    """Background work submitted through /jobs and run by the job worker"""
+    __tablename__ = "job"
+    __table_args__ = (
+        # Workers claim the oldest queued job
+        Index("ix_job_status_id", "status", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    type = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="queued")
+    params = Column(JSON, nullable=False, default=dict)
+    # Units of work done out of total (None until the job knows its size), and what it is doing
+    progress = Column(Integer, nullable=False, default=0)
+    total = Column(Integer, nullable=True)
+    message = Column(String, nullable=True)
+    result = Column(JSON, nullable=True)
+    # File results such as export archives, only loaded by the result endpoint
+    result_file = deferred(Column(LargeBinary, nullable=True))
+    result_filename = Column(String, nullable=True)
+    result_media_type = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    # Refreshed with every progress report, a running job without heartbeat lost its worker
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
@@ -2,9 +2,16 @@ from sqlalchemy import Column, Integer, String, JSON, Boolean, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from db.database import Base
+from models.indexes import trigram_index
 
 class Layer(Base):
     __tablename__ = "layer"
+    __table_args__ = (
+        trigram_index("layer", "title"),
+        trigram_index("layer", "type"),
+        trigram_index("layer", "url"),
+        trigram_index("layer", "featureName"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     type = Column(String, nullable=False)
@@ -2,9 +2,13 @@ from sqlalchemy import Column, Integer, String, JSON, DateTime
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from db.database import Base
+from models.indexes import trigram_index
 
 class Tool(Base):
     __tablename__ = "tool"
+    __table_args__ = (
+        trigram_index("tool", "name"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True, nullable=False)
@@ -1,9 +1,14 @@
 from sqlalchemy import Column, Integer, String, JSON, Boolean, Float, DateTime
 from sqlalchemy.sql import func
 from db.database import Base
+from models.indexes import trigram_index
 
 class Bookmark(Base):
     __tablename__ = "bookmarks"
+    __table_args__ = (
+        trigram_index("bookmarks", "title"),
+        trigram_index("bookmarks", "description"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(255), nullable=False)
     description = Column(String(255), nullable=True)
@@ -17,6 +22,10 @@ class Bookmark(Base):
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        trigram_index("projects", "name"),
+        trigram_index("projects", "description"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
     description = Column(String(255), nullable=True)
@@ -25,6 +34,10 @@ class Project(Base):
 
 class TerrainProvider(Base):
     __tablename__ = "terrain_providers"
+    __table_args__ = (
+        trigram_index("terrain_providers", "title"),
+        trigram_index("terrain_providers", "url"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String(255), nullable=False)
     url = Column(String(255), nullable=False)
@@ -33,6 +46,10 @@ class TerrainProvider(Base):
 
 class Story(Base):
     __tablename__ = "stories"
+    __table_args__ = (
+        trigram_index("stories", "name"),
+        trigram_index("stories", "description"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(255), nullable=False)
     description = Column(String(255), nullable=True)
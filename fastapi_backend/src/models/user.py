@@ -1,8 +1,13 @@
 from sqlalchemy import Column, Integer, String
 from db.database import Base
+from models.indexes import trigram_index
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        trigram_index("users", "name"),
+        trigram_index("users", "email"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False)
@@ -8,5 +8,5 @@ class Viewer(Base):
     id = Column(Integer, primary_key=True, index=True)
     content = Column(JSON, nullable=False)
 
-    digital_twin_id = Column(Integer, ForeignKey("digital_twin.id"), unique=True)
+    digital_twin_id = Column(Integer, ForeignKey("digital_twin.id", ondelete="CASCADE"), unique=True)
     digital_twin = relationship("DigitalTwin", back_populates="viewer")
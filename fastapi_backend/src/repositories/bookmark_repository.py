@@ -1,4 +1,7 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.pagination import Page, paginate, search_filter
 from models.tool_associations import Bookmark
 
 def get_by_id(db: Session, bookmark_id: int):
@@ -10,6 +13,9 @@ def get_bookmarks_by_ids(db: Session, bookmark_ids: list):
 def get_all(db: Session):
     return db.query(Bookmark).all()
 
+async def get_all_async(db: AsyncSession):
+    return (await db.scalars(select(Bookmark))).all()
+
 def create(db: Session, bookmark: Bookmark):
     db.add(bookmark)
     db.commit()
@@ -30,27 +36,20 @@ def delete(db: Session, bookmark_id: int):
         db.commit()
     return bookmark
 
-def get_filtered_paginated(
-    db: Session,
+async def get_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "title",
-    sort_direction: str = "asc"
-):
-    query = db.query(Bookmark)
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact"
+) -> Page:
+    stmt = select(Bookmark)
     if search:
-        search_lower = f"%{search.lower()}%"
-        query = query.filter(
-            (Bookmark.title.ilike(search_lower)) |
-            (Bookmark.description.ilike(search_lower))
-        )
-    # Sorting
-    if sort_column in ["title", "description", "id"]:
-        sort_attr = getattr(Bookmark, sort_column)
-        if sort_direction == "desc":
-            sort_attr = sort_attr.desc()
-        query = query.order_by(sort_attr)
-    total = query.count()
-    results = query.offset((page - 1) * page_size).limit(page_size).all()
-    return results, total
\ No newline at end of file
+        stmt = stmt.where(search_filter(search, Bookmark.title, Bookmark.description))
+    allowed_columns = ["title", "description", "id"]
+    return await paginate(
+        db, stmt, Bookmark, sort_column, sort_direction, allowed_columns, page, page_size, cursor, count_strategy
+    )
\ No newline at end of file
@@ -7,6 +7,9 @@ def get_by_id(db: Session, content_type_id: int):
 def get_by_name(db: Session, name: str):
     return db.query(ContentType).filter_by(name=name).first()
 
+def get_by_names(db: Session, names: list[str]):
+    return db.query(ContentType).filter(ContentType.name.in_(names)).all()
+
 def get_all(db: Session):
     return db.query(ContentType).all()
 
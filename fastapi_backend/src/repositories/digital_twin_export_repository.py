@@ -0,0 +1,49 @@
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.digital_twin_export import DigitalTwinExport, DigitalTwinPublishedExport
+
+async def get_export_async(db: AsyncSession, digital_twin_id: int, fingerprint: str):
+    # Matching on the fingerprint in SQL keeps an outdated content blob in the database
+    stmt = select(DigitalTwinExport).where(
+        DigitalTwinExport.digital_twin_id == digital_twin_id,
+        DigitalTwinExport.fingerprint == fingerprint
+    )
+    return (await db.scalars(stmt)).first()
+
+def get_fingerprints(db: Session) -> dict[int, str]:
+    """digital_twin_id -> fingerprint of every stored export, without loading the content"""
+    rows = db.execute(select(DigitalTwinExport.digital_twin_id, DigitalTwinExport.fingerprint)).all()
+    return {digital_twin_id: fingerprint for digital_twin_id, fingerprint in rows}
+
+def save_export(db: Session, digital_twin_id: int, filename: str, content: str, content_hash: str, fingerprint: str):
+    stored = db.get(DigitalTwinExport, digital_twin_id)
+    if stored is None:
+        stored = DigitalTwinExport(digital_twin_id=digital_twin_id)
+        db.add(stored)
+    # Only rewrite the content when the export itself changed, not just its inputs' versions
+    if stored.content_hash != content_hash:
+        stored.content = content
+        stored.content_hash = content_hash
+    stored.filename = filename
+    stored.fingerprint = fingerprint
+    stored.generated_at = func.now()
+    db.commit()
+
+def get_published_export(db: Session, digital_twin_id: int):
+    return db.get(DigitalTwinPublishedExport, digital_twin_id)
+
+async def get_published_export_async(db: AsyncSession, digital_twin_id: int):
+    return await db.get(DigitalTwinPublishedExport, digital_twin_id)
+
+def save_published_export(db: Session, digital_twin_id: int, content: str, content_hash: str):
+    published = db.get(DigitalTwinPublishedExport, digital_twin_id)
+    if published is None:
+        published = DigitalTwinPublishedExport(digital_twin_id=digital_twin_id)
+        db.add(published)
+    published.content = content
+    published.content_hash = content_hash
+    published.published_at = func.now()
+    db.commit()
+    db.refresh(published)
+    return published
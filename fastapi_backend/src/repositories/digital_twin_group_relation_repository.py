@@ -1,15 +1,40 @@
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from models.group import Group
 
 def get_group_by_id(db: Session, digital_twin_id: int, group_id: int) -> Group:
     return db.query(Group).filter_by(id=group_id, digital_twin_id=digital_twin_id).first()
 
-def bulk_create_group(db: Session, group: Group):
-    db.add(group)
+def get_group_ids_for_digital_twin(db: Session, digital_twin_id: int, group_ids: list[int]) -> set[int]:
+    if not group_ids:
+        return set()
+    rows = (
+        db.query(Group.id)
+        .filter(Group.digital_twin_id == digital_twin_id, Group.id.in_(group_ids))
+        .all()
+    )
+    return {group_id for (group_id,) in rows}
 
-def bulk_update_group_fields(group: Group, updates: dict):
-    for field, value in updates.items():
-        setattr(group, field, value)
+def bulk_insert_groups(db: Session, rows: list[dict]):
+    if rows:
+        db.execute(insert(Group), rows)
 
-def bulk_delete_group(db: Session, group: Group):
-    db.delete(group)
+def bulk_update_groups(db: Session, mappings: list[dict]):
+    # Executemany UPDATE by primary key, each mapping holds the group id
+    if mappings:
+        db.execute(update(Group), mappings)
+
+def bulk_delete_groups(db: Session, digital_twin_id: int, group_ids: list[int]):
+    if not group_ids:
+        return
+    # Detach subgroups of deleted groups first, like the ORM did when deleting groups one by one
+    (
+        db.query(Group)
+        .filter(Group.parent_id.in_(group_ids), Group.id.notin_(group_ids))
+        .update({Group.parent_id: None}, synchronize_session=False)
+    )
+    (
+        db.query(Group)
+        .filter(Group.digital_twin_id == digital_twin_id, Group.id.in_(group_ids))
+        .delete(synchronize_session=False)
+    )
\ No newline at end of file
@@ -1,3 +1,4 @@
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from models.digital_twin import DigitalTwinLayerAssociation
 from typing import Optional
@@ -24,13 +25,37 @@ def delete_layer_association(db: Session, association: DigitalTwinLayerAssociati
     db.delete(association)
     db.commit()
 
-# Query for bulk edits without commiting till all operations are successful
-def bulk_create_layer_association(db: Session, association: DigitalTwinLayerAssociation):
-    db.add(association)
+# Set-based queries for bulk edits without commiting till all operations are successful
+def get_associated_layer_ids(db: Session, digital_twin_id: int, layer_ids: list[int]) -> set[int]:
+    if not layer_ids:
+        return set()
+    rows = (
+        db.query(DigitalTwinLayerAssociation.layer_id)
+        .filter(
+            DigitalTwinLayerAssociation.digital_twin_id == digital_twin_id,
+            DigitalTwinLayerAssociation.layer_id.in_(layer_ids)
+        )
+        .all()
+    )
+    return {layer_id for (layer_id,) in rows}
+
+def bulk_insert_layer_associations(db: Session, rows: list[dict]):
+    # Multi-row INSERT for all new associations
+    if rows:
+        db.execute(insert(DigitalTwinLayerAssociation), rows)
 
-def bulk_update_layer_fields(assoc: DigitalTwinLayerAssociation, updates: dict):
-    for field, value in updates.items():
-        setattr(assoc, field, value)
+def bulk_update_layer_associations(db: Session, mappings: list[dict]):
+    # Executemany UPDATE by primary key, each mapping holds digital_twin_id and layer_id
+    if mappings:
+        db.execute(update(DigitalTwinLayerAssociation), mappings)
 
-def bulk_delete_layer_association(db: Session, assoc: DigitalTwinLayerAssociation):
-    db.delete(assoc)
\ No newline at end of file
+def bulk_delete_layer_associations(db: Session, digital_twin_id: int, layer_ids: list[int]):
+    if layer_ids:
+        (
+            db.query(DigitalTwinLayerAssociation)
+            .filter(
+                DigitalTwinLayerAssociation.digital_twin_id == digital_twin_id,
+                DigitalTwinLayerAssociation.layer_id.in_(layer_ids)
+            )
+            .delete(synchronize_session=False)
+        )
\ No newline at end of file
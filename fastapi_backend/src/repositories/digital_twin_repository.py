@@ -1,12 +1,123 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select, func, exists
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.pagination import Page, paginate, search_filter
 from models.digital_twin import DigitalTwin
+from models.associations import DigitalTwinLayerAssociation, DigitalTwinToolAssociation
+from models.layer import Layer
+from models.tool import Tool
+from models.group import Group
+from models.content_type import ContentType
+from models.tool_associations import Bookmark, Project, Story, TerrainProvider
 
 def get_digital_twin_by_id(db: Session, digital_twin_id: int):
     return db.query(DigitalTwin).filter(DigitalTwin.id == digital_twin_id).first()
 
+def digital_twin_exists(db: Session, digital_twin_id: int) -> bool:
+    # SELECT EXISTS on the primary key, for routes that only need to know the twin is there
+    return db.query(exists().where(DigitalTwin.id == digital_twin_id)).scalar()
+
+def with_associations():
+    """Loader options for exactly what DigitalTwinResponse serializes: the twin columns plus its
+    layer and tool associations, one SELECT ... IN each. Anything else raises instead of lazy loading."""
+    return (
+        selectinload(DigitalTwin.layer_associations).raiseload("*"),
+        selectinload(DigitalTwin.tool_associations).raiseload("*"),
+        raiseload("*"),
+    )
+
+async def get_digital_twin_with_associations(db: AsyncSession, digital_twin_id: int):
+    # Async sessions cannot lazy load, so load what DigitalTwinResponse serializes up front
+    stmt = select(DigitalTwin).options(*with_associations()).where(DigitalTwin.id == digital_twin_id)
+    return (await db.scalars(stmt)).first()
+
+def get_digital_twin_for_export(db: Session, digital_twin_id: int):
+    # Eager load the full export graph: one joined query for twin + viewer,
+    # then one SELECT ... IN per collection instead of a query per relation.
+    # The tools are loaded with their associations so they match the fingerprint of this session.
+    return (
+        db.query(DigitalTwin)
+        .options(
+            joinedload(DigitalTwin.viewer),
+            selectinload(DigitalTwin.groups),
+            selectinload(DigitalTwin.layer_associations).joinedload(DigitalTwinLayerAssociation.layer),
+            selectinload(DigitalTwin.tool_associations).joinedload(DigitalTwinToolAssociation.tool),
+        )
+        .filter(DigitalTwin.id == digital_twin_id)
+        .first()
+    )
+
+def export_fingerprint_columns(digital_twin_id):
+    """The version columns of everything the export depends on.
+
+    digital_twin_id is a twin ID, or DigitalTwin.id to correlate the columns with every twin
+    of the enclosing query.
+    """
+    def max_content_last_updated(model, content_type_name: str):
+        return (
+            select(func.max(model.last_updated))
+            .join(DigitalTwinToolAssociation, DigitalTwinToolAssociation.content_id == model.id)
+            .join(ContentType, ContentType.id == DigitalTwinToolAssociation.content_type_id)
+            .where(
+                DigitalTwinToolAssociation.digital_twin_id == digital_twin_id,
+                ContentType.name == content_type_name
+            )
+            .scalar_subquery()
+        )
+
+    def count_for_twin(model):
+        return (
+            select(func.count())
+            .select_from(model)
+            .where(model.digital_twin_id == digital_twin_id)
+            .scalar_subquery()
+        )
+
+    return (
+        DigitalTwin.last_updated,
+        select(func.max(Layer.last_updated))
+        .join(DigitalTwinLayerAssociation, DigitalTwinLayerAssociation.layer_id == Layer.id)
+        .where(DigitalTwinLayerAssociation.digital_twin_id == digital_twin_id)
+        .scalar_subquery(),
+        select(func.max(Tool.last_updated))
+        .join(DigitalTwinToolAssociation, DigitalTwinToolAssociation.tool_id == Tool.id)
+        .where(DigitalTwinToolAssociation.digital_twin_id == digital_twin_id)
+        .scalar_subquery(),
+        max_content_last_updated(Bookmark, "bookmark"),
+        max_content_last_updated(Project, "project"),
+        max_content_last_updated(Story, "story"),
+        max_content_last_updated(TerrainProvider, "terrain_provider"),
+        count_for_twin(DigitalTwinLayerAssociation),
+        count_for_twin(DigitalTwinToolAssociation),
+        count_for_twin(Group),
+    )
+
+def export_fingerprint_query(digital_twin_id: int):
+    """Select the export version columns of one twin, in one query"""
+    return select(*export_fingerprint_columns(digital_twin_id)).where(DigitalTwin.id == digital_twin_id)
+
+def get_export_fingerprint(db: Session, digital_twin_id: int):
+    return db.execute(export_fingerprint_query(digital_twin_id)).first()
+
+async def get_export_fingerprint_async(db: AsyncSession, digital_twin_id: int):
+    return (await db.execute(export_fingerprint_query(digital_twin_id))).first()
+
+def get_export_fingerprints(db: Session):
+    """(digital_twin_id, *version columns) of every twin, in one query"""
+    return db.execute(select(DigitalTwin.id, *export_fingerprint_columns(DigitalTwin.id))).all()
+
+def touch_digital_twin(db: Session, digital_twin_id: int):
+    # Bump last_updated without committing, so it lands in the caller's transaction
+    db.query(DigitalTwin).filter(DigitalTwin.id == digital_twin_id).update(
+        {DigitalTwin.last_updated: func.now()}, synchronize_session=False
+    )
+
 def get_all_digital_twins(db: Session):
     return db.query(DigitalTwin).all()
 
+async def get_all_digital_twins_async(db: AsyncSession):
+    return (await db.scalars(select(DigitalTwin))).all()
+
 def insert_digital_twin(db: Session, digital_twin: DigitalTwin):
     db.add(digital_twin)
     db.commit()
@@ -20,34 +131,26 @@ def update_digital_twin(db: Session, digital_twin: DigitalTwin, updates: dict):
     db.refresh(digital_twin)
     return digital_twin
 
-def delete_digital_twin(db: Session, digital_twin: DigitalTwin):
-    db.delete(digital_twin)
+def delete_digital_twin(db: Session, digital_twin_id: int) -> bool:
+    # One DELETE, the database cascades it to the viewer, groups and layer and tool associations
+    result = db.execute(delete(DigitalTwin).where(DigitalTwin.id == digital_twin_id))
     db.commit()
+    return result.rowcount > 0
 
-def get_filtered_paginated(
-    db: Session,
+async def get_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
-):
-    query = db.query(DigitalTwin)
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact"
+) -> Page:
+    stmt = select(DigitalTwin)
     if search:
-        search_lower = f"%{search.lower()}%"
-        query = query.filter(
-            (DigitalTwin.name.ilike(search_lower)) |
-            (DigitalTwin.title.ilike(search_lower)) |
-            (DigitalTwin.subtitle.ilike(search_lower)) |
-            (DigitalTwin.owner.ilike(search_lower))
-        )
-    # Sorting
+        stmt = stmt.where(search_filter(search, DigitalTwin.name, DigitalTwin.title, DigitalTwin.subtitle, DigitalTwin.owner))
     allowed_columns = ["name", "title", "subtitle", "owner", "private", "last_updated", "id"]
-    if sort_column in allowed_columns:
-        sort_attr = getattr(DigitalTwin, sort_column)
-        if sort_direction == "desc":
-            sort_attr = sort_attr.desc()
-        query = query.order_by(sort_attr)
-    total = query.count()
-    results = query.offset((page - 1) * page_size).limit(page_size).all()
-    return results, total
\ No newline at end of file
+    return await paginate(
+        db, stmt, DigitalTwin, sort_column, sort_direction, allowed_columns, page, page_size, cursor, count_strategy
+    )
\ No newline at end of file
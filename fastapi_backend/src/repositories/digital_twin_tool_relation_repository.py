@@ -1,3 +1,4 @@
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from models.associations import DigitalTwinToolAssociation
 from typing import Optional
@@ -31,4 +32,52 @@ def bulk_update_tool_association(db: Session, association: DigitalTwinToolAssoci
         setattr(association, key, value)
 
 def bulk_delete_tool_association(db: Session, assoc: DigitalTwinToolAssociation):
-    db.delete(assoc)
\ No newline at end of file
+    db.delete(assoc)
+
+# Set-based queries for the tool-content bulk edits
+def get_existing_content_ids(db: Session, model, content_ids: list[int]) -> set[int]:
+    if not content_ids:
+        return set()
+    rows = db.query(model.id).filter(model.id.in_(content_ids)).all()
+    return {content_id for (content_id,) in rows}
+
+def get_content_associations(db: Session, digital_twin_id: int, tool_id: int, content_type_id: int, content_ids: list[int]):
+    if not content_ids:
+        return []
+    return (
+        db.query(DigitalTwinToolAssociation.id, DigitalTwinToolAssociation.content_id)
+        .filter(
+            DigitalTwinToolAssociation.digital_twin_id == digital_twin_id,
+            DigitalTwinToolAssociation.tool_id == tool_id,
+            DigitalTwinToolAssociation.content_type_id == content_type_id,
+            DigitalTwinToolAssociation.content_id.in_(content_ids)
+        )
+        .order_by(DigitalTwinToolAssociation.id)
+        .all()
+    )
+
+def bulk_insert_tool_associations(db: Session, rows: list[dict]):
+    if rows:
+        db.execute(insert(DigitalTwinToolAssociation), rows)
+
+def bulk_update_tool_associations(db: Session, mappings: list[dict]):
+    # Executemany UPDATE by primary key, each mapping holds the association id
+    if mappings:
+        db.execute(update(DigitalTwinToolAssociation), mappings)
+
+def bulk_delete_tool_associations(db: Session, association_ids: list[int]):
+    if association_ids:
+        (
+            db.query(DigitalTwinToolAssociation)
+            .filter(DigitalTwinToolAssociation.id.in_(association_ids))
+            .delete(synchronize_session=False)
+        )
+def delete_content_associations(db: Session, content_type_id: int, content_id: int) -> list[int]:
+    """Delete the associations of one content item from every twin, returning the IDs of those twins"""
+    associations = db.query(DigitalTwinToolAssociation).filter(
+        DigitalTwinToolAssociation.content_type_id == content_type_id,
+        DigitalTwinToolAssociation.content_id == content_id
+    )
+    digital_twin_ids = sorted({digital_twin_id for (digital_twin_id,) in associations.with_entities(DigitalTwinToolAssociation.digital_twin_id)})
+    associations.delete(synchronize_session=False)
+    return digital_twin_ids
@@ -1,5 +1,8 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import func, literal, select
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.ext.asyncio import AsyncSession
 from models.group import Group
+from models.associations import DigitalTwinLayerAssociation
 
 def get_group_by_id(db: Session, group_id: int) -> Group | None:
     return db.query(Group).filter(Group.id == group_id).first()
@@ -15,6 +18,44 @@ def get_groups_by_digital_twin_id(db: Session, digital_twin_id: int):
         .all()
     )
 
+async def get_group_tree_rows(db: AsyncSession, digital_twin_id: int):
+    """Every group reachable from a root group of the twin, with its depth and number of layers.
+
+    One recursive CTE walks down from the root groups, so groups in a parent_id cycle (which never
+    reach a root) are not returned and the recursion always ends. Rows come parents first, then
+    by sort_order.
+    """
+    tree = (
+        select(Group.id, Group.title, Group.parent_id, Group.sort_order, literal(0).label("depth"))
+        .where(Group.digital_twin_id == digital_twin_id, Group.parent_id.is_(None))
+        .cte("group_tree", recursive=True)
+    )
+    child = aliased(Group)
+    tree = tree.union_all(
+        select(child.id, child.title, child.parent_id, child.sort_order, tree.c.depth + 1)
+        .join(tree, child.parent_id == tree.c.id)
+        .where(child.digital_twin_id == digital_twin_id)
+    )
+    layer_counts = (
+        select(DigitalTwinLayerAssociation.group_id, func.count().label("layer_count"))
+        .where(DigitalTwinLayerAssociation.digital_twin_id == digital_twin_id)
+        .group_by(DigitalTwinLayerAssociation.group_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            tree.c.id,
+            tree.c.title,
+            tree.c.parent_id,
+            tree.c.sort_order,
+            tree.c.depth,
+            func.coalesce(layer_counts.c.layer_count, 0).label("layer_count"),
+        )
+        .outerjoin(layer_counts, layer_counts.c.group_id == tree.c.id)
+        .order_by(tree.c.depth, tree.c.sort_order, tree.c.id)
+    )
+    return (await db.execute(stmt)).all()
+
 def insert_group(db: Session, group_data: dict) -> Group:
     group = Group(**group_data)
     db.add(group)
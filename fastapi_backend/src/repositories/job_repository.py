@@ -0,0 +1,84 @@
+from datetime import datetime
+
+from sqlalchemy import select, update, delete, and_, or_, func
+from sqlalchemy.orm import Session, undefer
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.job import Job
+
+def insert_job(db: Session, job_type: str, params: dict) -> Job:
+    job = Job(type=job_type, status="queued", params=params, progress=0, attempts=0)
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+async def get_job_async(db: AsyncSession, job_id: int, with_result_file: bool = False):
+    stmt = select(Job).where(Job.id == job_id)
+    if with_result_file:
+        stmt = stmt.options(undefer(Job.result_file))
+    return (await db.scalars(stmt)).first()
+
+def claim_next_job(db: Session, stale_before: datetime) -> Job | None:
+    """Mark the oldest runnable job as running and return it, None when there is none.
+
+    Runnable are queued jobs and running jobs whose heartbeat is older than stale_before
+    (their worker stopped). SKIP LOCKED lets concurrent workers pass over a job another
+    worker is claiming instead of waiting for it, so no job is claimed twice.
+    """
+    stmt = (
+        select(Job)
+        .where(or_(
+            Job.status == "queued",
+            and_(Job.status == "running", Job.heartbeat_at < stale_before)
+        ))
+        .order_by(Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+    )
+    job = db.scalars(stmt).first()
+    if job is None:
+        db.rollback()
+        return None
+    job.status = "running"
+    job.attempts += 1
+    job.started_at = func.now()
+    job.heartbeat_at = func.now()
+    db.commit()
+    db.refresh(job)
+    return job
+
+def _claimed(job_id: int, attempts: int):
+    # Only the worker holding the latest claim may write: a job taken over by another worker
+    # has a higher attempts count, so updates of the previous worker match no row
+    return and_(Job.id == job_id, Job.status == "running", Job.attempts == attempts)
+
+def update_progress(db: Session, job_id: int, attempts: int, progress: int, total: int | None, message: str | None) -> bool:
+    """Record progress and refresh the heartbeat, False when the claim was lost"""
+    result = db.execute(
+        update(Job).where(_claimed(job_id, attempts))
+        .values(progress=progress, total=total, message=message, heartbeat_at=func.now())
+    )
+    db.commit()
+    return result.rowcount == 1
+
+def touch_heartbeat(db: Session, job_id: int, attempts: int) -> bool:
+    """Refresh the heartbeat, False when the claim was lost"""
+    result = db.execute(update(Job).where(_claimed(job_id, attempts)).values(heartbeat_at=func.now()))
+    db.commit()
+    return result.rowcount == 1
+
+def finish_job(db: Session, job_id: int, attempts: int, status: str, **values) -> bool:
+    """Store the outcome of the claimed run, False when the claim was lost"""
+    result = db.execute(
+        update(Job).where(_claimed(job_id, attempts))
+        .values(status=status, finished_at=func.now(), **values)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+def delete_finished_jobs(db: Session, finished_before: datetime) -> int:
+    result = db.execute(
+        delete(Job).where(Job.status.in_(("succeeded", "failed")), Job.finished_at < finished_before)
+    )
+    db.commit()
+    return result.rowcount
@@ -1,4 +1,7 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.pagination import Page, only_columns, paginate, search_filter
 from models.layer import Layer
 from models.associations import DigitalTwinLayerAssociation
 from models.digital_twin import DigitalTwin
@@ -13,6 +16,9 @@ def get_layers_by_ids(db: Session, layer_ids: list[int]):
 def get_all_layers(db: Session):
     return db.query(Layer).all()
 
+async def get_all_layers_async(db: AsyncSession, columns: list[str] | None = None):
+    return (await db.scalars(only_columns(select(Layer), Layer, columns))).all()
+
 def insert_layer(db: Session, layer: Layer) -> Layer:
     db.add(layer)
     db.commit()
@@ -38,32 +44,24 @@ def get_digital_twins_for_layer(db: Session, layer_id: int):
     twins = db.query(DigitalTwin).filter(DigitalTwin.id.in_(twin_ids)).all()
     return twins
 
-def get_filtered_paginated(
-    db: Session,
+async def get_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "title",
     sort_direction: str = "asc",
-    is_background: bool | None = None
-):
-    query = db.query(Layer)
+    is_background: bool | None = None,
+    cursor: str | None = None,
+    count_strategy: str = "exact",
+    columns: list[str] | None = None
+) -> Page:
+    stmt = select(Layer)
     if search:
-        search_lower = f"%{search.lower()}%"
-        query = query.filter(
-            (Layer.title.ilike(search_lower)) |
-            (Layer.type.ilike(search_lower)) |
-            (Layer.url.ilike(search_lower)) |
-            (Layer.featureName.ilike(search_lower))
-        )
+        stmt = stmt.where(search_filter(search, Layer.title, Layer.type, Layer.url, Layer.featureName))
     if is_background is not None:
-        query = query.filter(Layer.isBackground == is_background)
+        stmt = stmt.where(Layer.isBackground == is_background)
     allowed_columns = ["title", "type", "url", "featureName", "id"]
-    if sort_column in allowed_columns:
-        sort_attr = getattr(Layer, sort_column)
-        if sort_direction == "desc":
-            sort_attr = sort_attr.desc()
-        query = query.order_by(sort_attr)
-    total = query.count()
-    results = query.offset((page - 1) * page_size).limit(page_size).all()
-    return results, total
\ No newline at end of file
+    return await paginate(
+        db, stmt, Layer, sort_column, sort_direction, allowed_columns, page, page_size, cursor, count_strategy, columns
+    )
\ No newline at end of file
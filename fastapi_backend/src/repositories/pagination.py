@@ -0,0 +1,182 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import Select, and_, func, or_, select, text, tuple_
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from db import count_cache
+
+# How paginate computes the total: "exact" runs a COUNT, "estimated" asks Postgres
+# (table statistics when unfiltered, the planner otherwise), "cached" reuses an exact
+# count until the table is written to, "none" skips counting and only reports has_more
+COUNT_STRATEGIES = ("exact", "estimated", "cached", "none")
+
+@dataclass
+class Page:
+    results: list
+    # None when the count strategy is "none"
+    total: Optional[int]
+    has_more: bool = False
+    # Opaque cursor for the next page in cursor mode, None on the last page or in page mode
+    next_cursor: Optional[str] = None
+
+def _encode_value(value: Any):
+    if isinstance(value, datetime):
+        return {"datetime": value.isoformat()}
+    return value
+
+def _decode_value(value: Any):
+    if isinstance(value, dict) and "datetime" in value:
+        return datetime.fromisoformat(value["datetime"])
+    return value
+
+def encode_cursor(sort_column: str, sort_direction: str, value: Any, row_id: int) -> str:
+    payload = json.dumps([sort_column, sort_direction, _encode_value(value), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, sort_column: str, sort_direction: str):
+    """Return the (value, id) a cursor points at, it must come from a search with the same sort"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_column, cursor_direction, value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if (cursor_column, cursor_direction) != (sort_column, sort_direction) or not isinstance(row_id, int):
+        raise ValueError("Cursor does not match the requested sort")
+    return _decode_value(value), row_id
+
+def _seek(sort_attr, id_attr, descending: bool, value: Any, row_id: int):
+    """Rows after (value, row_id) in ORDER BY sort_attr, id with NULLs last (asc) or first (desc)"""
+    if sort_attr is id_attr:
+        return id_attr < row_id if descending else id_attr > row_id
+    if descending:
+        if value is None:
+            return or_(sort_attr.is_not(None), and_(sort_attr.is_(None), id_attr < row_id))
+        return tuple_(sort_attr, id_attr) < tuple_(value, row_id)
+    if value is None:
+        return and_(sort_attr.is_(None), id_attr > row_id)
+    return or_(tuple_(sort_attr, id_attr) > tuple_(value, row_id), sort_attr.is_(None))
+
+def search_filter(search: str, *columns):
+    """Case-insensitive substring match of search on any of the columns.
+
+    Every column gets its own plain ILIKE, which the pg_trgm GIN index on that column can serve;
+    wrapping the column in lower() or concatenating columns would force a sequential scan.
+    """
+    pattern = f"%{search.lower()}%"
+    return or_(*(column.ilike(pattern) for column in columns))
+
+def only_columns(stmt: Select, model, columns: Optional[list[str]]) -> Select:
+    """Load just the given columns of model, the others (such as large JSON content) stay in the database"""
+    if not columns:
+        return stmt
+    return stmt.options(load_only(*(getattr(model, column) for column in dict.fromkeys(columns))))
+
+async def _exact_count(db: AsyncSession, stmt: Select) -> int:
+    count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+    return (await db.execute(count_stmt)).scalar_one()
+
+async def _estimated_count(db: AsyncSession, stmt: Select, model) -> int:
+    if db.bind.dialect.name != "postgresql":
+        return await _exact_count(db, stmt)
+
+    if stmt.whereclause is None:
+        # reltuples is maintained by VACUUM/ANALYZE, -1 means the table was never analyzed
+        estimate = (await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+            {"table": model.__table__.name}
+        )).scalar()
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+        return await _exact_count(db, stmt)
+
+    # Row estimate of the planner for the filtered query, without running it
+    compiled = stmt.order_by(None).compile(dialect=postgresql.dialect(paramstyle="named"))
+    plan = (await db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"), compiled.params)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+async def _cached_count(db: AsyncSession, stmt: Select, model) -> int:
+    compiled = stmt.order_by(None).compile()
+    key = (str(compiled), tuple(sorted((name, repr(value)) for name, value in compiled.params.items())))
+    table = model.__table__.name
+    total = count_cache.get(table, key)
+    if total is None:
+        total = await _exact_count(db, stmt)
+        count_cache.put(table, key, total)
+    return total
+
+async def count(db: AsyncSession, stmt: Select, model, strategy: str = "exact") -> Optional[int]:
+    if strategy == "none":
+        return None
+    if strategy == "estimated":
+        return await _estimated_count(db, stmt, model)
+    if strategy == "cached":
+        return await _cached_count(db, stmt, model)
+    if strategy != "exact":
+        raise ValueError(f"Unknown count strategy {strategy}, use one of {', '.join(COUNT_STRATEGIES)}")
+    return await _exact_count(db, stmt)
+
+async def paginate(
+    db: AsyncSession,
+    stmt: Select,
+    model,
+    sort_column: str,
+    sort_direction: str,
+    allowed_columns: list[str],
+    page: int = 1,
+    page_size: int = 10,
+    cursor: Optional[str] = None,
+    count_strategy: str = "exact",
+    columns: Optional[list[str]] = None
+) -> Page:
+    """Sort stmt on (sort_column, id) and fetch one page of it.
+
+    Page mode (cursor is None) uses OFFSET. Cursor mode seeks past the row the cursor points at,
+    so deep pages cost the same as the first one; an empty cursor starts at the first page.
+    Both modes fetch one row more than page_size to report has_more without a count.
+    When columns is given only those columns (plus id and the sort column) are loaded.
+    """
+    # The id tie-breaker keeps the order stable when rows share a sort value
+    sort_attr = getattr(model, sort_column, None) if sort_column in allowed_columns else None
+    if sort_attr is None:
+        sort_column, sort_attr = "id", model.id
+    if columns:
+        stmt = only_columns(stmt, model, [*columns, "id", sort_column])
+    descending = sort_direction == "desc"
+    if descending:
+        stmt = stmt.order_by(sort_attr.desc().nulls_first(), model.id.desc())
+    else:
+        stmt = stmt.order_by(sort_attr.asc().nulls_last(), model.id.asc())
+
+    direction = "desc" if descending else "asc"
+    seek = None
+    if cursor:
+        value, row_id = decode_cursor(cursor, sort_column, direction)
+        seek = _seek(sort_attr, model.id, descending, value, row_id)
+
+    # The total covers the whole filtered set, not just the rows after the cursor
+    total = await count(db, stmt, model, count_strategy)
+
+    if cursor is None:
+        results = (await db.scalars(stmt.offset((page - 1) * page_size).limit(page_size + 1))).all()
+        has_more = len(results) > page_size
+        return Page(results=results[:page_size], total=total, has_more=has_more)
+
+    if seek is not None:
+        stmt = stmt.where(seek)
+    results = (await db.scalars(stmt.limit(page_size + 1))).all()
+
+    next_cursor = None
+    has_more = len(results) > page_size
+    if has_more:
+        results = results[:page_size]
+        last = results[-1]
+        next_cursor = encode_cursor(sort_column, direction, getattr(last, sort_column), last.id)
+    return Page(results=results, total=total, has_more=has_more, next_cursor=next_cursor)
@@ -1,4 +1,7 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.pagination import Page, only_columns, paginate, search_filter
 from models.tool_associations import Project
 
 def get_by_id(db: Session, project_id: int):
@@ -10,6 +13,9 @@ def get_projects_by_ids(db: Session, project_ids: list):
 def get_all(db: Session):
     return db.query(Project).all()
 
+async def get_all_async(db: AsyncSession, columns: list[str] | None = None):
+    return (await db.scalars(only_columns(select(Project), Project, columns))).all()
+
 def create(db: Session, project: Project):
     db.add(project)
     db.commit()
@@ -30,28 +36,21 @@ def delete(db: Session, project_id: int):
         db.commit()
     return project
 
-def get_filtered_paginated(
-    db: Session,
+async def get_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
-):
-    query = db.query(Project)
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact",
+    columns: list[str] | None = None
+) -> Page:
+    stmt = select(Project)
     if search:
-        search_lower = f"%{search.lower()}%"
-        query = query.filter(
-            (Project.name.ilike(search_lower)) |
-            (Project.description.ilike(search_lower))
-        )
-    # Sorting
+        stmt = stmt.where(search_filter(search, Project.name, Project.description))
     allowed_columns = ["name", "description", "id"]
-    if sort_column in allowed_columns:
-        sort_attr = getattr(Project, sort_column)
-        if sort_direction == "desc":
-            sort_attr = sort_attr.desc()
-        query = query.order_by(sort_attr)
-    total = query.count()
-    results = query.offset((page - 1) * page_size).limit(page_size).all()
-    return results, total
\ No newline at end of file
+    return await paginate(
+        db, stmt, Project, sort_column, sort_direction, allowed_columns, page, page_size, cursor, count_strategy, columns
+    )
\ No newline at end of file
@@ -1,4 +1,7 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.pagination import Page, only_columns, paginate, search_filter
 from models.tool_associations import Story
 
 def get_by_id(db: Session, story_id: int):
@@ -10,6 +13,9 @@ def get_stories_by_ids(db: Session, story_ids: list):
 def get_all(db: Session):
     return db.query(Story).all()
 
+async def get_all_async(db: AsyncSession, columns: list[str] | None = None):
+    return (await db.scalars(only_columns(select(Story), Story, columns))).all()
+
 def create(db: Session, story: Story):
     db.add(story)
     db.commit()
@@ -30,28 +36,21 @@ def delete(db: Session, story_id: int):
         db.commit()
     return story
 
-def get_filtered_paginated(
-    db: Session,
+async def get_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
-):
-    query = db.query(Story)
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact",
+    columns: list[str] | None = None
+) -> Page:
+    stmt = select(Story)
     if search:
-        search_lower = f"%{search.lower()}%"
-        query = query.filter(
-            (Story.name.ilike(search_lower)) |
-            (Story.description.ilike(search_lower))
-        )
-    # Sorting
+        stmt = stmt.where(search_filter(search, Story.name, Story.description))
     allowed_columns = ["name", "description", "id"]
-    if sort_column in allowed_columns:
-        sort_attr = getattr(Story, sort_column)
-        if sort_direction == "desc":
-            sort_attr = sort_attr.desc()
-        query = query.order_by(sort_attr)
-    total = query.count()
-    results = query.offset((page - 1) * page_size).limit(page_size).all()
-    return results, total
\ No newline at end of file
+    return await paginate(
+        db, stmt, Story, sort_column, sort_direction, allowed_columns, page, page_size, cursor, count_strategy, columns
+    )
\ No newline at end of file
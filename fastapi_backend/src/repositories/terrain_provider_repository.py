@@ -1,4 +1,7 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.pagination import Page, paginate, search_filter
 from models.tool_associations import TerrainProvider
 
 def get_by_id(db: Session, terrainProvider_id: int):
@@ -10,6 +13,9 @@ def get_by_ids(db: Session, terrain_provider_ids: list):
 def get_all(db: Session):
     return db.query(TerrainProvider).all()
 
+async def get_all_async(db: AsyncSession):
+    return (await db.scalars(select(TerrainProvider))).all()
+
 def create(db: Session, terrainProvider: TerrainProvider):
     db.add(terrainProvider)
     db.commit()
@@ -30,27 +36,20 @@ def delete(db: Session, terrainProvider_id: int):
         db.commit()
     return terrainProvider
 
-def get_filtered_paginated(
-    db: Session,
+async def get_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "title",
-    sort_direction: str = "asc"
-):
-    query = db.query(TerrainProvider)
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact"
+) -> Page:
+    stmt = select(TerrainProvider)
     if search:
-        search_lower = f"%{search.lower()}%"
-        query = query.filter(
-            (TerrainProvider.title.ilike(search_lower)) |
-            (TerrainProvider.url.ilike(search_lower))
-        )
+        stmt = stmt.where(search_filter(search, TerrainProvider.title, TerrainProvider.url))
     allowed_columns = ["title", "url", "vertexNormals", "id"]
-    if sort_column in allowed_columns:
-        sort_attr = getattr(TerrainProvider, sort_column)
-        if sort_direction == "desc":
-            sort_attr = sort_attr.desc()
-        query = query.order_by(sort_attr)
-    total = query.count()
-    results = query.offset((page - 1) * page_size).limit(page_size).all()
-    return results, total
\ No newline at end of file
+    return await paginate(
+        db, stmt, TerrainProvider, sort_column, sort_direction, allowed_columns, page, page_size, cursor, count_strategy
+    )
\ No newline at end of file
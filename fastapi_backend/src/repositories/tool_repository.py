@@ -1,4 +1,7 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.pagination import Page, only_columns, paginate, search_filter
 from models.tool import Tool
 from typing import Dict, Any
 
@@ -14,6 +17,9 @@ def get_tools_by_ids(db: Session, tool_ids: list[int]):
 def get_all_tools(db: Session):
     return db.query(Tool).all()
 
+async def get_all_tools_async(db: AsyncSession, columns: list[str] | None = None):
+    return (await db.scalars(only_columns(select(Tool), Tool, columns))).all()
+
 def insert_tool(db: Session, tool_data: Dict[str, Any]) -> Tool:
     tool = Tool(**tool_data)
     db.add(tool)
@@ -32,26 +38,21 @@ def delete_tool(db: Session, tool):
     db.delete(tool)
     db.commit()
 
-def get_filtered_paginated(
-    db: Session,
+async def get_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
-):
-    query = db.query(Tool)
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact",
+    columns: list[str] | None = None
+) -> Page:
+    stmt = select(Tool)
     if search:
-        search_lower = f"%{search.lower()}%"
-        query = query.filter(
-            Tool.name.ilike(search_lower)
-        )
+        stmt = stmt.where(search_filter(search, Tool.name))
     allowed_columns = ["name", "id"]
-    if sort_column in allowed_columns:
-        sort_attr = getattr(Tool, sort_column)
-        if sort_direction == "desc":
-            sort_attr = sort_attr.desc()
-        query = query.order_by(sort_attr)
-    total = query.count()
-    results = query.offset((page - 1) * page_size).limit(page_size).all()
-    return results, total
\ No newline at end of file
+    return await paginate(
+        db, stmt, Tool, sort_column, sort_direction, allowed_columns, page, page_size, cursor, count_strategy, columns
+    )
\ No newline at end of file
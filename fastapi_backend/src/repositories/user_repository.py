@@ -1,4 +1,7 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.pagination import Page, paginate, search_filter
 from models.user import User
 
 def get_user_by_id(db: Session, user_id: int):
@@ -7,6 +10,9 @@ def get_user_by_id(db: Session, user_id: int):
 def get_all_users(db: Session):
     return db.query(User).all()
 
+async def get_all_users_async(db: AsyncSession):
+    return (await db.scalars(select(User))).all()
+
 def create_user(db: Session, user_create):
     user = User(**user_create.dict())
     db.add(user)
@@ -27,27 +33,20 @@ def delete_user(db: Session, user: User):
     db.delete(user)
     db.commit()
 
-def get_filtered_paginated(
-    db: Session,
+async def get_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
-):
-    query = db.query(User)
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact"
+) -> Page:
+    stmt = select(User)
     if search:
-        search_lower = f"%{search.lower()}%"
-        query = query.filter(
-            (User.name.ilike(search_lower)) |
-            (User.email.ilike(search_lower))
-        )
+        stmt = stmt.where(search_filter(search, User.name, User.email))
     allowed_columns = ["name", "email", "id"]
-    if sort_column in allowed_columns:
-        sort_attr = getattr(User, sort_column)
-        if sort_direction == "desc":
-            sort_attr = sort_attr.desc()
-        query = query.order_by(sort_attr)
-    total = query.count()
-    results = query.offset((page - 1) * page_size).limit(page_size).all()
-    return results, total
+    return await paginate(
+        db, stmt, User, sort_column, sort_direction, allowed_columns, page, page_size, cursor, count_strategy
+    )
@@ -55,6 +55,9 @@ class BookmarkToolAssociationResponse(BaseModel):
 
 class PaginatedBookmarksResponse(BaseModel):
     results: List[BookmarkResponse]
-    total: int
+    # None when counting is skipped with count=none
+    total: Optional[int]
     page: int
-    page_size: int
\ No newline at end of file
+    page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -56,7 +56,10 @@ class DigitalTwinSummary(BaseModel):
 
 class PaginatedDigitalTwinResponse(BaseModel):
     results: List[DigitalTwinListResponse]
-    total: int
+    # None when counting is skipped with count=none
+    total: Optional[int]
     page: int
     page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
@@ -23,7 +23,18 @@ class GroupResponse(BaseModel):
     model_config = {
         "from_attributes": True
     }
-    
+
+class GroupTreeNode(BaseModel):
+    id: int
+    title: str
+    parent_id: Optional[int] = None
+    sort_order: int = 0
+    depth: int
+    # Layers directly in this group, and in this group plus all its subgroups
+    layer_count: int
+    total_layer_count: int
+    children: List["GroupTreeNode"] = []
+
 class DigitalTwinGroupBulkItem(BaseModel):
     id: Optional[int] = None
     title: Optional[str] = None
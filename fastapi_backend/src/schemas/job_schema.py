@@ -0,0 +1,37 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, Dict, Any, List
+from datetime import datetime
+from schemas.digital_twin_schema import BulkAssociationsPayload
+
+class JobCreate(BaseModel):
+    type: str
+    params: Dict[str, Any] = {}
+
+class JobResponse(BaseModel):
+    id: int
+    type: str
+    status: str
+    params: Dict[str, Any]
+    progress: int
+    total: Optional[int] = None
+    message: Optional[str] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+# Parameters of each job type, validated when the job is submitted
+
+class ExportJobParams(BaseModel):
+    # All digital twins when omitted
+    ids: Optional[List[int]] = None
+    compact: bool = False
+
+class RefreshExportsJobParams(BaseModel):
+    pass
+
+class BulkAssociationsJobParams(BaseModel):
+    digital_twin_id: int
+    payload: BulkAssociationsPayload
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_serializer
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
 
 class LayerBase(BaseModel):
@@ -32,8 +32,26 @@ class LayerResponse(LayerBase):
         "from_attributes": True
     }
 
+class LayerSummary(BaseModel):
+    """Sparse LayerResponse for ?fields=, only the requested fields are set"""
+    id: int
+    type: Optional[str] = None
+    title: Optional[str] = None
+    url: Optional[str] = None
+    featureName: Optional[str] = None
+    isBackground: Optional[bool] = None
+    content: Optional[Dict[str, Any]] = None
+    last_updated: Optional[datetime] = None
+
+    @field_serializer("last_updated")
+    def format_last_updated(self, value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
 class PaginatedLayersResponse(BaseModel):
-    results: List[LayerResponse]
-    total: int
+    results: List[Union[LayerResponse, LayerSummary]]
+    # None when counting is skipped with count=none
+    total: Optional[int]
     page: int
-    page_size: int
\ No newline at end of file
+    page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
\ No newline at end of file
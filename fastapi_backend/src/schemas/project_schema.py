@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_serializer
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Union
 from datetime import datetime
 
 class ProjectBase(BaseModel):
@@ -26,8 +26,23 @@ class ProjectResponse(ProjectBase):
     class Config:
         from_attributes = True
 
+class ProjectSummary(BaseModel):
+    """Sparse ProjectResponse for ?fields=, only the requested fields are set"""
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    content: Optional[Any] = None
+    last_updated: Optional[datetime] = None
+
+    @field_serializer("last_updated")
+    def format_last_updated(self, value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
 class PaginatedProjectsResponse(BaseModel):
-    results: List[ProjectResponse]
-    total: int
+    results: List[Union[ProjectResponse, ProjectSummary]]
+    # None when counting is skipped with count=none
+    total: Optional[int]
     page: int
-    page_size: int
\ No newline at end of file
+    page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
\ No newline at end of file
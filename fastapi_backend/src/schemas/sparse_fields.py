@@ -0,0 +1,27 @@
+from typing import Any, Optional
+from pydantic import BaseModel
+
+def parse_fields(fields: Optional[str], schema: type[BaseModel]) -> Optional[list[str]]:
+    """Field names of a ?fields=name,description query, id is always included.
+
+    Returns None when no fields were asked for, raises ValueError for names the schema does not have.
+    """
+    if fields is None:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in names if name not in schema.model_fields]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+    return list(dict.fromkeys(["id", *names]))
+
+def to_response(obj: Any, schema: type[BaseModel], sparse_schema: type[BaseModel], fields: Optional[list[str]]) -> BaseModel:
+    """The full response schema, or the sparse schema with only the requested fields set.
+
+    Routes returning sparse schemas use response_model_exclude_unset, so fields that were not
+    asked for are left out of the response instead of being sent as null.
+    """
+    if fields is None:
+        return schema.model_validate(obj, from_attributes=True)
+    return sparse_schema(**{name: getattr(obj, name) for name in fields})
+
+FIELDS_DESCRIPTION = "Comma separated fields to return, e.g. id,name. Leave content out to skip loading it"
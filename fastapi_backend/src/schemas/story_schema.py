@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_serializer
-from typing import Optional, Any, List
+from typing import Optional, Any, List, Union
 from datetime import datetime
 
 class StoryBase(BaseModel):
@@ -26,8 +26,23 @@ class StoryResponse(StoryBase):
     class Config:
         from_attributes = True
 
+class StorySummary(BaseModel):
+    """Sparse StoryResponse for ?fields=, only the requested fields are set"""
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    content: Optional[Any] = None
+    last_updated: Optional[datetime] = None
+
+    @field_serializer("last_updated")
+    def format_last_updated(self, value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
 class PaginatedStoriesResponse(BaseModel):
-    results: List[StoryResponse]
-    total: int
+    results: List[Union[StoryResponse, StorySummary]]
+    # None when counting is skipped with count=none
+    total: Optional[int]
     page: int
-    page_size: int
\ No newline at end of file
+    page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
\ No newline at end of file
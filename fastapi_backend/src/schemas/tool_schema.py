@@ -1,5 +1,5 @@
 from pydantic import BaseModel, field_serializer
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union
 from datetime import datetime
 
 class ToolBase(BaseModel):
@@ -28,8 +28,23 @@ class ToolResponse(ToolBase):
         "from_attributes": True
     }
 
+class ToolSummary(BaseModel):
+    """Sparse ToolResponse for ?fields=, only the requested fields are set"""
+    id: int
+    name: Optional[str] = None
+    description: Optional[str] = None
+    content: Optional[Dict[str, Any]] = None
+    last_updated: Optional[datetime] = None
+
+    @field_serializer("last_updated")
+    def format_last_updated(self, value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
 class PaginatedToolsResponse(BaseModel):
-    results: List[ToolResponse]
-    total: int
+    results: List[Union[ToolResponse, ToolSummary]]
+    # None when counting is skipped with count=none
+    total: Optional[int]
     page: int
-    page_size: int
\ No newline at end of file
+    page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
\ No newline at end of file
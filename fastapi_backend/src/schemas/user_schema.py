@@ -21,6 +21,9 @@ class UserResponse(UserBase):
 
 class PaginatedUsersResponse(BaseModel):
     results: List[UserResponse]
-    total: int
+    # None when counting is skipped with count=none
+    total: Optional[int]
     page: int
     page_size: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
@@ -2,7 +2,6 @@ import sys
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.orm import sessionmaker
 from db.database import Base, get_db, DATABASE_URL
-from seeders.seeder import main as run_seeders    
 from seeders.content_type_seeder import seed as seed_content_type
 from seeders.tool_seeder import seed as seed_tool
 import subprocess
@@ -27,6 +26,8 @@ def migrate():
     subprocess.run(["alembic", "upgrade", "head"], cwd=project_root, check=True)
 
 def seed_full():
+    # Imported here so the other commands (the workers in particular) start without the full seeders
+    from seeders.seeder import main as run_seeders
     print("Running full seeders...")
     run_seeders()
 
@@ -45,6 +46,44 @@ def seed_minimal():
     finally:
         db.close()
 
+def export_digital_twins(output_path: str, digital_twin_ids: list[int] | None = None):
+    from services.export_service import export_digital_twins as render_exports
+    from services.export_stream_service import iter_export_zip
+
+    target = "all digital twins" if digital_twin_ids is None else f"digital twins {digital_twin_ids}"
+    print(f"Exporting {target} to {output_path}...")
+    with open(output_path, "wb") as output:
+        for chunk in iter_export_zip(render_exports(digital_twin_ids)):
+            output.write(chunk)
+    print("Export completed!")
+
+def export_worker():
+    from services.export_artifact_service import run_export_worker
+
+    try:
+        run_export_worker()
+    except KeyboardInterrupt:
+        print("Export worker stopped.")
+
+def worker():
+    from services.job_service import run_job_worker
+
+    try:
+        run_job_worker()
+    except KeyboardInterrupt:
+        print("Job worker stopped.")
+
+def check_indexes():
+    import models
+    from db.index_check import find_unindexed_foreign_keys
+
+    unindexed = find_unindexed_foreign_keys(Base.metadata)
+    for foreign_key in unindexed:
+        print(f"Foreign key without an index: {foreign_key}")
+    if unindexed:
+        sys.exit(1)
+    print("Every foreign key is indexed.")
+
 def fresh_full():
     drop_all_tables()
     migrate()
@@ -57,7 +96,7 @@ def fresh_minimal():
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python manage.py [drop|create|migrate|seed|seed-minimal|fresh|fresh-minimal]")
+        print("Usage: python manage.py [drop|create|migrate|seed|seed-minimal|fresh|fresh-minimal|export|export-worker|worker|check-indexes]")
         sys.exit(1)
     
     command = sys.argv[1]
@@ -76,5 +115,16 @@ if __name__ == "__main__":
         fresh_full()
     elif command == "fresh-minimal":
         fresh_minimal()
+    elif command == "export":
+        # export [output.zip] [digital_twin_id ...]
+        output_path = sys.argv[2] if len(sys.argv) > 2 else "digital_twins.zip"
+        digital_twin_ids = [int(arg) for arg in sys.argv[3:]] or None
+        export_digital_twins(output_path, digital_twin_ids)
+    elif command == "export-worker":
+        export_worker()
+    elif command == "worker":
+        worker()
+    elif command == "check-indexes":
+        check_indexes()
     else:
         print(f"Unknown command {command}")
\ No newline at end of file
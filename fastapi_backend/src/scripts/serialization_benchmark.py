@@ -0,0 +1,150 @@
+"""Micro-benchmark the response serialization of the list and search endpoints.
+
+Builds pages of in-memory rows (no database) and times, per endpoint, the old response path
+against the current one:
+    before  rows validated into models, validated again by FastAPI through response_model,
+            encoded with the stdlib json encoder (JSONResponse)
+    after   rows validated into models once, dumped and encoded with orjson (validated_response)
+
+Usage (from fastapi_backend/src):
+    python -m scripts.serialization_benchmark --rows 100 --chapters 50
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Union
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from api.bookmark_router import BOOKMARK_LIST_ADAPTER
+from api.layer_router import LAYER_LIST_ADAPTER
+from api.responses import validated_response
+from api.story_router import STORY_LIST_ADAPTER
+from models import Bookmark, DigitalTwin, Layer, Project, Story
+from schemas.bookmark_schema import BookmarkResponse, PaginatedBookmarksResponse
+from schemas.digital_twin_schema import DigitalTwinListResponse, PaginatedDigitalTwinResponse
+from schemas.layer_schema import LayerResponse, LayerSummary, PaginatedLayersResponse
+from schemas.project_schema import PaginatedProjectsResponse, ProjectResponse
+from schemas.sparse_fields import to_response
+from schemas.story_schema import PaginatedStoriesResponse, StoryResponse, StorySummary
+
+def build_rows(args) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "layers": [
+            Layer(
+                id=i, type="wms", title=f"Layer {i}", url=f"https://example.com/wms/{i}", featureName=None,
+                isBackground=False, content={"layers": f"layer_{i}", "opacity": 0.8}, last_updated=now
+            )
+            for i in range(args.rows)
+        ],
+        "bookmarks": [
+            Bookmark(
+                id=i, title=f"Bookmark {i}", description="Synthetic bookmark", x=5.1, y=52.1, z=300.0,
+                heading=0.0, pitch=-45.0, duration=2.0, last_updated=now
+            )
+            for i in range(args.rows)
+        ],
+        "projects": [
+            Project(
+                id=i, name=f"Project {i}", description="Synthetic project", last_updated=now,
+                content={"polygon": [[5.0 + p / 1000, 52.0 + p / 1000] for p in range(args.polygon_points)]}
+            )
+            for i in range(args.rows)
+        ],
+        "stories": [
+            Story(
+                id=i, name=f"Story {i}", description="Synthetic story", last_updated=now,
+                content={"chapters": [
+                    {"id": c, "title": f"Chapter {c}", "text": "Lorem ipsum " * 20, "camera": [5.1, 52.1, 300.0]}
+                    for c in range(args.chapters)
+                ]}
+            )
+            for i in range(args.rows)
+        ],
+        "digital_twins": [
+            DigitalTwin(id=i, name=f"twin-{i}", title=f"Twin {i}", subtitle=None, owner="bench", isPrivate=False, last_updated=now)
+            for i in range(args.rows)
+        ],
+    }
+
+def page(schema, results, rows):
+    return schema(results=results, total=len(rows), page=1, page_size=len(rows), has_more=False, next_cursor=None)
+
+def build_cases(rows: dict) -> list:
+    """(name, response_model, exclude_unset, build the validated content, render it the current way)"""
+    def search(schema, response_schema, summary_schema, key, exclude_unset):
+        def build():
+            if summary_schema is None:
+                results = [response_schema.model_validate(row, from_attributes=True) for row in rows[key]]
+            else:
+                results = [to_response(row, response_schema, summary_schema, None) for row in rows[key]]
+            return page(schema, results, rows[key])
+        return build, lambda content: validated_response(content, exclude_unset=exclude_unset)
+
+    def listing(adapter, response_schema, summary_schema, key, exclude_unset):
+        def build():
+            if summary_schema is None:
+                return adapter.validate_python(rows[key], from_attributes=True)
+            return [to_response(row, response_schema, summary_schema, None) for row in rows[key]]
+        return build, lambda content: validated_response(content, adapter, exclude_unset=exclude_unset)
+
+    return [
+        ("GET /layers/", list[Union[LayerResponse, LayerSummary]], True,
+            *listing(LAYER_LIST_ADAPTER, LayerResponse, LayerSummary, "layers", True)),
+        ("GET /layers/search", PaginatedLayersResponse, True,
+            *search(PaginatedLayersResponse, LayerResponse, LayerSummary, "layers", True)),
+        ("GET /bookmarks/", list[BookmarkResponse], False,
+            *listing(BOOKMARK_LIST_ADAPTER, BookmarkResponse, None, "bookmarks", False)),
+        ("GET /bookmarks/search", PaginatedBookmarksResponse, False,
+            *search(PaginatedBookmarksResponse, BookmarkResponse, None, "bookmarks", False)),
+        ("GET /projects/search", PaginatedProjectsResponse, True,
+            *search(PaginatedProjectsResponse, ProjectResponse, None, "projects", True)),
+        ("GET /stories/", list[Union[StoryResponse, StorySummary]], True,
+            *listing(STORY_LIST_ADAPTER, StoryResponse, StorySummary, "stories", True)),
+        ("GET /stories/search", PaginatedStoriesResponse, True,
+            *search(PaginatedStoriesResponse, StoryResponse, StorySummary, "stories", True)),
+        ("GET /digital-twins/search", PaginatedDigitalTwinResponse, False,
+            *search(PaginatedDigitalTwinResponse, DigitalTwinListResponse, None, "digital_twins", False)),
+    ]
+
+def render_before(field, exclude_unset: bool, content) -> bytes:
+    # What FastAPI does with a returned value: validate and dump it through response_model, then encode
+    serialized = asyncio.run(serialize_response(field=field, response_content=content, exclude_unset=exclude_unset, is_coroutine=True))
+    return JSONResponse(serialized).body
+
+def time_ms(operation, iterations: int) -> float:
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100, help="Rows per page")
+    parser.add_argument("--chapters", type=int, default=50, help="Chapters per story")
+    parser.add_argument("--polygon-points", type=int, default=200, help="Polygon points per project")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed runs per endpoint, the median is reported")
+    args = parser.parse_args()
+
+    rows = build_rows(args)
+    print(f"{'endpoint':<28}{'before ms':>12}{'after ms':>12}{'speedup':>10}{'bytes':>12}")
+    for name, response_model, exclude_unset, build, render_after in build_cases(rows):
+        field = create_model_field(name="Response", type_=response_model, mode="serialization")
+        before = lambda: render_before(field, exclude_unset, build())
+        after = lambda: render_after(build()).body
+        body = after()
+        if json.loads(before()) != json.loads(body):
+            raise SystemExit(f"{name}: the responses differ")
+        before_ms, after_ms = time_ms(before, args.iterations), time_ms(after, args.iterations)
+        print(f"{name:<28}{before_ms:>12.2f}{after_ms:>12.2f}{before_ms / after_ms:>9.1f}x{len(body):>12}")
+
+if __name__ == "__main__":
+    main()
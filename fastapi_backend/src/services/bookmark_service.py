@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import repositories.bookmark_repository as repo
 import repositories.digital_twin_tool_relation_repository as tool_relation_repo
 import services.content_type_service as content_type_service
+import services.export_cache_service as export_cache_service
 from models.tool_associations import Bookmark
 from schemas.bookmark_schema import (
     BookmarkCreate,
@@ -11,8 +13,8 @@ from schemas.bookmark_schema import (
 def get_bookmark(db: Session, bookmark_id: int) -> Bookmark | None:
     return repo.get_by_id(db, bookmark_id)
 
-def get_all_bookmarks(db: Session) -> list[Bookmark]:
-    return repo.get_all(db)
+async def get_all_bookmarks(db: AsyncSession) -> list[Bookmark]:
+    return await repo.get_all_async(db)
 
 def create_bookmark(db: Session, data: BookmarkCreate) -> Bookmark:
     bookmark = Bookmark(**data.dict())
@@ -35,15 +37,11 @@ def delete_bookmark(db: Session, bookmark_id: int) -> bool:
         bookmark_content_type = content_type_service.get_content_type_by_name(db, "bookmark")
         
         if bookmark_content_type:
-            # Delete all digital_twin_tool_association records that reference this bookmark
-            from models.associations import DigitalTwinToolAssociation
-            associations = db.query(DigitalTwinToolAssociation).filter(
-                DigitalTwinToolAssociation.content_type_id == bookmark_content_type.id,
-                DigitalTwinToolAssociation.content_id == bookmark_id
-            ).all()
-            
-            for assoc in associations:
-                db.delete(assoc)
+            # Delete all digital_twin_tool_association records that reference this bookmark, and bump
+            # those twins so their fingerprint changes for every worker process
+            digital_twin_ids = tool_relation_repo.delete_content_associations(db, bookmark_content_type.id, bookmark_id)
+            for digital_twin_id in digital_twin_ids:
+                export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
         
         # Delete the bookmark itself
         db.delete(bookmark)
@@ -54,19 +52,23 @@ def delete_bookmark(db: Session, bookmark_id: int) -> bool:
         db.rollback()
         raise
 
-def get_bookmarks_filtered_paginated(
-    db: Session,
+async def get_bookmarks_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "title",
-    sort_direction: str = "asc"
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact"
 ):
-    return repo.get_filtered_paginated(
+    return await repo.get_filtered_paginated(
         db,
         search,
         page,
         page_size,
         sort_column,
-        sort_direction
+        sort_direction,
+        cursor,
+        count_strategy
     )
\ No newline at end of file
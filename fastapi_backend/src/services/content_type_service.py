@@ -1,26 +1,43 @@
 from sqlalchemy.orm import Session
 import repositories.content_type_repository as repo
+import services.reference_data_service as reference_data_service
 from models.content_type import ContentType
 from schemas.content_type_schema import ContentTypeCreate, ContentTypeUpdate
 
+# The lookups are served from the in-process registry, the returned content types are detached and read-only
+
 def get_content_type(db: Session, content_type_id: int) -> ContentType | None:
-    return repo.get_by_id(db, content_type_id)
+    return reference_data_service.get_content_type_by_id(db, content_type_id)
 
 def get_content_type_by_name(db: Session, name: str) -> ContentType | None:
-    return repo.get_by_name(db, name)
+    return reference_data_service.get_content_type_by_name(db, name)
+
+def get_content_types_by_names(db: Session, names: list[str]) -> dict[str, ContentType]:
+    content_types = {}
+    for name in names:
+        content_type = reference_data_service.get_content_type_by_name(db, name)
+        if content_type:
+            content_types[name] = content_type
+    return content_types
 
 def get_all_content_types(db: Session) -> list[ContentType]:
-    return repo.get_all(db)
+    return reference_data_service.get_content_types(db)
 
 def create_content_type(db: Session, data: ContentTypeCreate) -> ContentType:
     content_type = ContentType(**data.dict())
-    return repo.create(db, content_type)
+    content_type = repo.create(db, content_type)
+    reference_data_service.invalidate()
+    return content_type
 
 def update_content_type(db: Session, content_type_id: int, updates: ContentTypeUpdate) -> ContentType | None:
     content_type = repo.get_by_id(db, content_type_id)
     if not content_type:
         return None
-    return repo.update(db, content_type, updates.dict(exclude_unset=True))
+    content_type = repo.update(db, content_type, updates.dict(exclude_unset=True))
+    reference_data_service.invalidate()
+    return content_type
 
 def delete_content_type(db: Session, content_type_id: int) -> bool:
-    return repo.delete(db, content_type_id)
+    deleted = repo.delete(db, content_type_id)
+    reference_data_service.invalidate()
+    return deleted
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 import repositories.digital_twin_tool_relation_repository as repo
 import services.tool_service as tool_service
+import services.export_cache_service as export_cache_service
 from models.associations import DigitalTwinToolAssociation
 from typing import Dict, Any, Optional
 
@@ -56,6 +57,7 @@ def update_cesium_configuration(digital_twin_id: int, config: Dict[str, Any], db
         )
         repo.bulk_create_tool_association(db, new_association)
     
+    export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
     db.commit()
 
 def delete_cesium_configuration(digital_twin_id: int, db: Session):
@@ -77,4 +79,5 @@ def delete_cesium_configuration(digital_twin_id: int, db: Session):
     
     if cesium_association:
         repo.bulk_delete_tool_association(db, cesium_association)
+        export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
         db.commit()
@@ -0,0 +1,130 @@
+from sqlalchemy.orm import Session
+import repositories.digital_twin_tool_relation_repository as repo
+import services.content_type_service as content_type_service
+import services.tool_service as tool_service
+import services.export_cache_service as export_cache_service
+from models.tool_associations import Bookmark, Project, Story, TerrainProvider
+from typing import List
+from schemas.digital_twin_tool_association_schema import DigitalTwinToolBulkItem
+
+# Content type name -> the tool its associations belong to and how they are validated and written.
+# reset_default: an update without is_default clears the default flag (stories always did),
+# otherwise a missing is_default leaves it unchanged.
+CONTENT_RELATIONS = {
+    "bookmark": {"tool": "bookmarks", "model": Bookmark, "label": "Bookmark", "has_default": False},
+    "project": {"tool": "projects", "model": Project, "label": "Project", "has_default": True},
+    "story": {"tool": "stories", "model": Story, "label": "Story", "has_default": True, "reset_default": True},
+    # Terrain providers are associated with the cesium tool
+    "terrain_provider": {"tool": "cesium", "model": TerrainProvider, "label": "Terrain provider", "has_default": False},
+}
+
+def handle_bulk_content_operations(digital_twin_id: int, content_type_name: str, operations: List[DigitalTwinToolBulkItem], db: Session):
+    """Apply create/update/delete operations on the tool-content associations of one content type.
+
+    The tool_id sent by the frontend is ignored, the tool belonging to the content type is used.
+    The operations are applied by action, not in request order: all deletes, then all creates,
+    then all updates. Content can therefore be removed and re-added in one request, and an update
+    only applies to content that was associated before the request.
+    Returns the created/updated/deleted counts and an "operations" list with the outcome of every
+    operation in request order.
+    """
+    relation = CONTENT_RELATIONS[content_type_name]
+    result_counter = {"created": 0, "updated": 0, "deleted": 0}
+
+    content_type = content_type_service.get_content_type_by_name(db, content_type_name)
+    if not content_type:
+        raise ValueError(f"{relation['label']} content type not found")
+
+    tool = tool_service.get_tool_by_name(relation["tool"], db)
+    if not tool:
+        raise ValueError(f"{relation['tool'].capitalize()} tool not found")
+
+    content_ids = list({op.content_id for op in operations if op.content_id is not None})
+
+    # Validate every content id the creates refer to in one query
+    create_ids = {op.content_id for op in operations if op.action == "create" and op.content_id}
+    missing_ids = create_ids - repo.get_existing_content_ids(db, relation["model"], list(create_ids))
+    if missing_ids:
+        raise ValueError(
+            f"{relation['label']} with id {', '.join(str(i) for i in sorted(missing_ids))} not found"
+        )
+
+    # content_id -> id of its existing association, the oldest one if there are duplicates
+    association_ids = {}
+    for association_id, content_id in repo.get_content_associations(
+        db, digital_twin_id, tool.id, content_type.id, content_ids
+    ):
+        association_ids.setdefault(content_id, association_id)
+
+    results = [
+        {"action": op.action, "content_id": op.content_id, "status": "skipped"}
+        for op in operations
+    ]
+    delete_ids, rows, mappings = [], [], []
+    created_content_ids = set()
+
+    # Deletes run first so content can be removed and re-added in the same request
+    for index, op in enumerate(operations):
+        if op.action != "delete":
+            continue
+        association_id = association_ids.pop(op.content_id, None)
+        if association_id is None:
+            results[index]["reason"] = "not associated"
+            continue
+        delete_ids.append(association_id)
+        results[index].update(status="deleted", id=association_id)
+
+    for index, op in enumerate(operations):
+        if op.action != "create":
+            continue
+        if op.content_id in association_ids or op.content_id in created_content_ids:
+            results[index]["reason"] = "already associated"
+            continue
+        if op.content_id is not None:
+            created_content_ids.add(op.content_id)
+        row = {
+            "digital_twin_id": digital_twin_id,
+            "tool_id": tool.id,
+            "content_type_id": content_type.id,
+            "content_id": op.content_id,
+            "sort_order": op.sort_order or 0,
+        }
+        if relation["has_default"]:
+            row["is_default"] = op.is_default or False
+        rows.append(row)
+        results[index]["status"] = "created"
+
+    for index, op in enumerate(operations):
+        if op.action != "update":
+            continue
+        association_id = association_ids.get(op.content_id)
+        if association_id is None:
+            results[index]["reason"] = "not associated"
+            continue
+        # Only update fields that are provided (not None)
+        mapping = {"id": association_id}
+        if op.sort_order is not None:
+            mapping["sort_order"] = op.sort_order
+        if relation["has_default"] and op.is_default is not None:
+            mapping["is_default"] = op.is_default
+        elif relation.get("reset_default"):
+            mapping["is_default"] = False
+        if len(mapping) > 1:
+            mappings.append(mapping)
+        results[index].update(status="updated", id=association_id)
+
+    try:
+        repo.bulk_delete_tool_associations(db, delete_ids)
+        repo.bulk_insert_tool_associations(db, rows)
+        repo.bulk_update_tool_associations(db, mappings)
+        export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    result_counter["deleted"] = len(delete_ids)
+    result_counter["created"] = len(rows)
+    result_counter["updated"] = sum(1 for result in results if result["status"] == "updated")
+    result_counter["operations"] = results
+    return result_counter
@@ -1,38 +1,22 @@
 from typing import List
 from sqlalchemy.orm import Session
 from schemas.group_schema import DigitalTwinGroupBulkItem
-from models.group import Group
 import repositories.digital_twin_group_relation_repository as repo
+import services.export_cache_service as export_cache_service
 
 def handle_bulk_group_operations(digital_twin_id: int, operations: List[DigitalTwinGroupBulkItem], db: Session):
     result_counter = {"created": 0, "updated": 0, "deleted": 0}
 
+    creates, updates, deletes = [], [], []
+
     def handle_create(op: DigitalTwinGroupBulkItem):
-        group = Group(
-            digital_twin_id=digital_twin_id,
-            title=op.title,
-            parent_id=op.parent_id,
-            sort_order=op.sort_order or 0
-        )
-        repo.bulk_create_group(db, group)
-        result_counter["created"] += 1
+        creates.append(op)
 
     def handle_update(op: DigitalTwinGroupBulkItem):
-        group = repo.get_group_by_id(db, digital_twin_id, op.id)
-        if group:
-            updates = {
-                "title": op.title,
-                "parent_id": op.parent_id,
-                "sort_order": op.sort_order,
-            }
-            repo.bulk_update_group_fields(group, updates)
-            result_counter["updated"] += 1
+        updates.append(op)
 
     def handle_delete(op: DigitalTwinGroupBulkItem):
-        group = repo.get_group_by_id(db, digital_twin_id, op.id)
-        if group:
-            repo.bulk_delete_group(db, group)
-            result_counter["deleted"] += 1
+        deletes.append(op)
 
     dispatch = {
         "create": handle_create,
@@ -40,15 +24,51 @@ def handle_bulk_group_operations(digital_twin_id: int, operations: List[DigitalT
         "delete": handle_delete
     }
 
+    for op in operations:
+        handler = dispatch.get(op.action)
+        if handler:
+            handler(op)
+
     try:
-        for op in operations:
-            handler = dispatch.get(op.action)
-            if handler:
-                handler(op)
+        # One lookup for every group the request touches, limited to groups of this digital twin
+        existing_ids = repo.get_group_ids_for_digital_twin(
+            db, digital_twin_id, [op.id for op in updates + deletes if op.id is not None]
+        )
+
+        rows = [
+            {
+                "digital_twin_id": digital_twin_id,
+                "title": op.title,
+                "parent_id": op.parent_id,
+                "sort_order": op.sort_order or 0
+            }
+            for op in creates
+        ]
+        repo.bulk_insert_groups(db, rows)
+        result_counter["created"] = len(rows)
+
+        mappings = [
+            {
+                "id": op.id,
+                "title": op.title,
+                "parent_id": op.parent_id,
+                "sort_order": op.sort_order,
+            }
+            for op in updates
+            if op.id in existing_ids
+        ]
+        repo.bulk_update_groups(db, mappings)
+        result_counter["updated"] = len(mappings)
+
+        # Deletes run last so subgroups moved under a deleted group are detached as before
+        deleted_ids = {op.id for op in deletes if op.id in existing_ids}
+        repo.bulk_delete_groups(db, digital_twin_id, list(deleted_ids))
+        result_counter["deleted"] = len(deleted_ids)
 
+        export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
         db.commit()
     except Exception:
         db.rollback()
         raise
 
-    return result_counter
+    return result_counter
\ No newline at end of file
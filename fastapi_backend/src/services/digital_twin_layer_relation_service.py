@@ -1,47 +1,22 @@
 from sqlalchemy.orm import Session
 import repositories.digital_twin_layer_relation_repository as repo
-from models.associations import DigitalTwinLayerAssociation
+import services.export_cache_service as export_cache_service
 from schemas.digital_twin_layer_association_schema import DigitalTwinLayerBulkItem
 from typing import List
 
 def handle_bulk_layer_operations(digital_twin_id: int, operations: List[DigitalTwinLayerBulkItem], db: Session):
     result_counter = {"created": 0, "updated": 0, "deleted": 0}
 
+    creates, updates, deletes = [], [], []
+
     def handle_create(op: DigitalTwinLayerBulkItem):
-        assoc = DigitalTwinLayerAssociation(
-            digital_twin_id=digital_twin_id,
-            layer_id=op.layer_id,
-            group_id=op.group_id,
-            sort_order=op.sort_order or 0,
-            is_default=op.is_default or False,
-            content=op.content
-        )
-        repo.bulk_create_layer_association(db, assoc)
-        result_counter["created"] += 1
+        creates.append(op)
 
     def handle_update(op: DigitalTwinLayerBulkItem):
-        assoc = repo.get_layer_association(db, digital_twin_id, op.layer_id)
-        if assoc:
-            updates = {}
-            
-            # Only update fields that are provided (not None)
-            if op.sort_order is not None:
-                updates["sort_order"] = op.sort_order
-            if op.group_id is not None:
-                updates["group_id"] = op.group_id
-            if op.is_default is not None:
-                updates["is_default"] = op.is_default
-            if op.content is not None:
-                updates["content"] = op.content
-                
-            repo.bulk_update_layer_fields(assoc, updates)
-            result_counter["updated"] += 1
+        updates.append(op)
 
     def handle_delete(op: DigitalTwinLayerBulkItem):
-        assoc = repo.get_layer_association(db, digital_twin_id, op.layer_id)
-        if assoc:
-            repo.bulk_delete_layer_association(db, assoc)
-            result_counter["deleted"] += 1
+        deletes.append(op)
 
     dispatch = {
         "create": handle_create,
@@ -49,12 +24,59 @@ def handle_bulk_layer_operations(digital_twin_id: int, operations: List[DigitalT
         "delete": handle_delete
     }
 
+    for op in operations:
+        handler = dispatch.get(op.action)
+        if handler:
+            handler(op)
+
     try:
-        for op in operations:
-            handler = dispatch.get(op.action)
-            if handler:
-                handler(op)
+        # One lookup for every layer the request touches instead of one per operation
+        existing_ids = repo.get_associated_layer_ids(
+            db, digital_twin_id, [op.layer_id for op in updates + deletes]
+        )
+
+        # Deletes run first so a layer can be removed and re-added in the same request
+        deleted_ids = {op.layer_id for op in deletes if op.layer_id in existing_ids}
+        repo.bulk_delete_layer_associations(db, digital_twin_id, list(deleted_ids))
+        result_counter["deleted"] = len(deleted_ids)
+
+        rows = [
+            {
+                "digital_twin_id": digital_twin_id,
+                "layer_id": op.layer_id,
+                "group_id": op.group_id,
+                "sort_order": op.sort_order or 0,
+                "is_default": op.is_default or False,
+                "content": op.content
+            }
+            for op in creates
+        ]
+        repo.bulk_insert_layer_associations(db, rows)
+        result_counter["created"] = len(rows)
+
+        updatable_ids = (existing_ids - deleted_ids) | {op.layer_id for op in creates}
+        mappings = []
+        for op in updates:
+            if op.layer_id not in updatable_ids:
+                continue
+            mapping = {"digital_twin_id": digital_twin_id, "layer_id": op.layer_id}
+
+            # Only update fields that are provided (not None)
+            if op.sort_order is not None:
+                mapping["sort_order"] = op.sort_order
+            if op.group_id is not None:
+                mapping["group_id"] = op.group_id
+            if op.is_default is not None:
+                mapping["is_default"] = op.is_default
+            if op.content is not None:
+                mapping["content"] = op.content
+
+            if len(mapping) > 2:
+                mappings.append(mapping)
+            result_counter["updated"] += 1
+        repo.bulk_update_layer_associations(db, mappings)
 
+        export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
         db.commit()
     except Exception:
         db.rollback()
@@ -1,13 +1,21 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.digital_twin_schema import DigitalTwinCreate, DigitalTwinUpdate
 from models.digital_twin import DigitalTwin
 import repositories.digital_twin_repository as repo
+import services.export_cache_service as export_cache_service
 
 def get_digital_twin(digital_twin_id: int, db: Session):
     return repo.get_digital_twin_by_id(db, digital_twin_id)
 
-def list_digital_twins(db: Session):
-    return repo.get_all_digital_twins(db)
+def digital_twin_exists(digital_twin_id: int, db: Session) -> bool:
+    return repo.digital_twin_exists(db, digital_twin_id)
+
+async def get_digital_twin_with_associations(digital_twin_id: int, db: AsyncSession):
+    return await repo.get_digital_twin_with_associations(db, digital_twin_id)
+
+async def list_digital_twins(db: AsyncSession):
+    return await repo.get_all_digital_twins_async(db)
 
 def create_digital_twin(digital_twin_create: DigitalTwinCreate, db: Session):
     digital_twin = DigitalTwin(**digital_twin_create.dict())
@@ -17,22 +25,28 @@ def update_digital_twin(existing_digital_twin: DigitalTwin, data: DigitalTwinUpd
     updates = data.dict(exclude_unset=True)
     return repo.update_digital_twin(db, existing_digital_twin, updates)
 
-def delete_digital_twin(existing_digital_twin: DigitalTwin, db: Session):
-    repo.delete_digital_twin(db, existing_digital_twin)
+def delete_digital_twin(digital_twin_id: int, db: Session) -> bool:
+    deleted = repo.delete_digital_twin(db, digital_twin_id)
+    export_cache_service.invalidate(digital_twin_id)
+    return deleted
 
-def get_digital_twins_filtered_paginated(
-    db: Session,
+async def get_digital_twins_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact"
 ):
-    return repo.get_filtered_paginated(
+    return await repo.get_filtered_paginated(
         db,
         search,
         page,
         page_size,
         sort_column,
-        sort_direction
+        sort_direction,
+        cursor,
+        count_strategy
     )
\ No newline at end of file
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 import repositories.digital_twin_tool_relation_repository as repo
+import services.export_cache_service as export_cache_service
 from models.associations import DigitalTwinToolAssociation
 from typing import List
 from schemas.digital_twin_tool_association_schema import DigitalTwinToolBulkItem
@@ -56,6 +57,7 @@ def handle_bulk_tool_operations(digital_twin_id: int, operations: List[DigitalTw
             handler = dispatch.get(op.action)
             if handler:
                 handler(op)
+        export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
         db.commit()
     except Exception:
         db.rollback()
@@ -0,0 +1,74 @@
+import hashlib
+import json
+import os
+import time
+
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import SessionLocal
+from models.digital_twin_export import DigitalTwinExport
+import repositories.digital_twin_export_repository as repo
+import services.export_cache_service as export_cache_service
+import services.export_service as export_service
+import services.reference_data_service as reference_data_service
+
+# Seconds the export worker waits between checks for digital twins whose inputs changed
+EXPORT_WORKER_INTERVAL = float(os.getenv("EXPORT_WORKER_INTERVAL", "10"))
+
+async def get_current_export(db: AsyncSession, digital_twin_id: int, fingerprint: str) -> DigitalTwinExport | None:
+    """The stored export of the twin, None when there is none or it was rendered from older inputs"""
+    return await repo.get_export_async(db, digital_twin_id, fingerprint)
+
+def refresh_exports(db: Session) -> list[int]:
+    """Render and store the export of every digital twin whose stored export is missing or outdated.
+
+    Staleness is decided by the export fingerprint, so a change to any input (the twin, its
+    viewer, groups, layer and tool associations, or the layers, tools, bookmarks, projects,
+    stories and terrain providers it uses) is picked up. Returns the refreshed twin IDs.
+    """
+    # Tools and content types are only invalidated in the API process that changed them, so
+    # reload them here rather than render new fingerprints from registry data up to a TTL old
+    reference_data_service.invalidate()
+    stored = repo.get_fingerprints(db)
+    stale = {
+        digital_twin_id: fingerprint
+        for digital_twin_id, fingerprint in export_cache_service.get_fingerprints(db).items()
+        if stored.get(digital_twin_id) != fingerprint
+    }
+    if not stale:
+        return []
+
+    shared = export_service.load_shared_export_data(db)
+    refreshed = []
+    for digital_twin_id, fingerprint in stale.items():
+        # The fingerprint was taken before rendering, so a change made while rendering
+        # leaves the stored export outdated and the next run renders it again
+        try:
+            filename, export_data = export_service.export_digital_twin(db, digital_twin_id, shared)
+        except ValueError:
+            # Deleted since the fingerprints were taken, its stored export is deleted with it
+            continue
+        except Exception as e:
+            # One twin that fails to render must not keep the others outdated
+            db.rollback()
+            print(f"Warning: export of digital twin {digital_twin_id} failed: {str(e)}")
+            continue
+        content = json.dumps(export_data, indent=2)
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        repo.save_export(db, digital_twin_id, filename, content, content_hash, fingerprint)
+        refreshed.append(digital_twin_id)
+    return refreshed
+
+def run_export_worker(interval: float = EXPORT_WORKER_INTERVAL):
+    """Keep the stored exports up to date until interrupted"""
+    print(f"Export worker started, checking for changes every {interval:g} seconds")
+    while True:
+        try:
+            with SessionLocal() as db:
+                refreshed = refresh_exports(db)
+            if refreshed:
+                print(f"Refreshed the exports of digital twins {refreshed}")
+        except Exception as e:
+            # Keep running, the database may be restarting
+            print(f"Export worker error: {str(e)}")
+        time.sleep(interval)
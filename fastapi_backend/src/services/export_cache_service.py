@@ -0,0 +1,77 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+import repositories.digital_twin_repository as digital_twin_repo
+
+# Bump when the export format changes so cached exports and ETags from older code are not reused
+EXPORT_FORMAT_VERSION = "1"
+
+EXPORT_CACHE_SIZE = int(os.getenv("EXPORT_CACHE_SIZE", "64"))
+
+# digital_twin_id -> (fingerprint, (filename, export_data)), least recently used first
+_cache: "OrderedDict[int, Tuple[str, Tuple[str, dict]]]" = OrderedDict()
+_lock = threading.Lock()
+
+def _hash_fingerprint(digital_twin_id: int, row) -> Optional[str]:
+    if row is None:
+        return None
+    parts = [EXPORT_FORMAT_VERSION, str(digital_twin_id)]
+    parts.extend(value.isoformat() if hasattr(value, "isoformat") else str(value) for value in row)
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+def get_fingerprint(db: Session, digital_twin_id: int) -> Optional[str]:
+    """Hash the last_updated values and association counts the export depends on"""
+    return _hash_fingerprint(digital_twin_id, digital_twin_repo.get_export_fingerprint(db, digital_twin_id))
+
+async def get_fingerprint_async(db: AsyncSession, digital_twin_id: int) -> Optional[str]:
+    return _hash_fingerprint(digital_twin_id, await digital_twin_repo.get_export_fingerprint_async(db, digital_twin_id))
+
+def get_fingerprints(db: Session) -> dict[int, str]:
+    """The current fingerprint of every digital twin, in one query"""
+    return {
+        row[0]: _hash_fingerprint(row[0], row[1:])
+        for row in digital_twin_repo.get_export_fingerprints(db)
+    }
+
+def get(digital_twin_id: int, fingerprint: str) -> Optional[Tuple[str, dict]]:
+    with _lock:
+        entry = _cache.get(digital_twin_id)
+        if entry is None:
+            return None
+        if entry[0] != fingerprint:
+            # Stale entry, the twin or one of its dependencies changed since it was stored
+            del _cache[digital_twin_id]
+            return None
+        _cache.move_to_end(digital_twin_id)
+        return entry[1]
+
+def put(digital_twin_id: int, fingerprint: str, export: Tuple[str, Any]):
+    if EXPORT_CACHE_SIZE <= 0:
+        return
+    with _lock:
+        _cache[digital_twin_id] = (fingerprint, export)
+        _cache.move_to_end(digital_twin_id)
+        while len(_cache) > EXPORT_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+def invalidate(digital_twin_id: int):
+    with _lock:
+        _cache.pop(digital_twin_id, None)
+
+def clear():
+    with _lock:
+        _cache.clear()
+
+def mark_digital_twin_changed(db: Session, digital_twin_id: int):
+    """Record a change to a digital twin's export inputs.
+
+    Bumps the twin's last_updated in the caller's transaction so the fingerprint changes
+    for every worker process, and drops the local cache entry right away.
+    """
+    digital_twin_repo.touch_digital_twin(db, digital_twin_id)
+    invalidate(digital_twin_id)
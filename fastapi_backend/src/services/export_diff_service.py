@@ -0,0 +1,221 @@
+import hashlib
+import json
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+import repositories.digital_twin_export_repository as repo
+import services.export_service as export_service
+
+# Fields that identify the items of a list in the export (layer and group IDs, tool names as
+# id, bookmark titles, project and story names), tried in this order. A list is matched by
+# position when no field is present and unique in every item of both versions.
+LIST_KEY_FIELDS = ("id", "title", "name")
+
+class _Fenwick:
+    """Occupied slots of the list being patched, with the number of occupied slots before a slot"""
+
+    def __init__(self, occupied: list[int]):
+        self._tree = [0] + occupied
+        for index in range(1, len(self._tree)):
+            parent = index + (index & -index)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[index]
+
+    def add(self, slot: int, delta: int):
+        index = slot + 1
+        while index < len(self._tree):
+            self._tree[index] += delta
+            index += index & -index
+
+    def count_before(self, slot: int) -> int:
+        total = 0
+        index = slot
+        while index > 0:
+            total += self._tree[index]
+            index -= index & -index
+        return total
+
+def _pointer(path: str, token) -> str:
+    return f"{path}/{str(token).replace('~', '~0').replace('/', '~1')}"
+
+def _is_key(value) -> bool:
+    return isinstance(value, (str, int)) and not isinstance(value, bool)
+
+def _list_key_field(source: list, target: list) -> str | None:
+    if not source or not target:
+        return None
+    for field in LIST_KEY_FIELDS:
+        if all(_has_unique_keys(items, field) for items in (source, target)):
+            return field
+    return None
+
+def _has_unique_keys(items: list, field: str) -> bool:
+    seen = set()
+    for item in items:
+        if not isinstance(item, dict) or not _is_key(item.get(field)) or item[field] in seen:
+            return False
+        seen.add(item[field])
+    return True
+
+def _longest_increasing_subsequence(values: list[int]) -> set[int]:
+    # Patience sorting: tails[k] is the index of the smallest last value of an increasing run of length k + 1
+    tails: list[int] = []
+    tail_values: list[int] = []
+    previous: list[int | None] = [None] * len(values)
+    for index, value in enumerate(values):
+        length = bisect_left(tail_values, value)
+        if length == len(tails):
+            tails.append(index)
+            tail_values.append(value)
+        else:
+            tails[length] = index
+            tail_values[length] = value
+        previous[index] = tails[length - 1] if length else None
+
+    result = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        result.add(values[index])
+        index = previous[index]
+    return result
+
+def _diff_keyed_lists(source: list, target: list, field: str, path: str, operations: list):
+    """Patch source into target matching items on field instead of position.
+
+    Removed items are removed from the back, so every index refers to the original list. The
+    remaining items that are already in target order (the longest increasing subsequence)
+    stay put and every other item is moved right after its predecessor in target, so moving
+    one item is one operation. Each item has fixed slots in a virtual list (where it is before
+    and after moving), and a Fenwick tree over the occupied slots turns a slot into the index
+    of the list at that point of the patch in O(log n).
+    """
+    target_keys = {item[field] for item in target}
+    for index in range(len(source) - 1, -1, -1):
+        if source[index][field] not in target_keys:
+            operations.append({"op": "remove", "path": _pointer(path, index)})
+
+    kept = [item for item in source if item[field] in target_keys]
+    rank = {item[field]: position for position, item in enumerate(kept)}
+    staying = _longest_increasing_subsequence([rank[item[field]] for item in target if item[field] in rank])
+
+    # Items placed in the same stretch (after the same staying item, -1 before the first) in target order
+    placed_after = defaultdict(list)
+    anchor = -1
+    for target_index, item in enumerate(target):
+        position = rank.get(item[field])
+        if position in staying:
+            anchor = position
+        else:
+            placed_after[anchor].append(target_index)
+
+    # Slot order: each stretch follows its staying item, a moving item's old slot sits at its
+    # source position between them
+    occupied = []
+    old_slot = {}
+    new_slot = {}
+    def place(anchor_position: int):
+        for target_index in placed_after[anchor_position]:
+            new_slot[target_index] = len(occupied)
+            occupied.append(0)
+    place(-1)
+    for position in range(len(kept)):
+        if position in staying:
+            occupied.append(1)
+            place(position)
+        else:
+            old_slot[position] = len(occupied)
+            occupied.append(1)
+
+    slots = _Fenwick(occupied)
+    for target_index, item in enumerate(target):
+        position = rank.get(item[field])
+        if position in staying:
+            continue
+        if position is not None:
+            from_index = slots.count_before(old_slot[position])
+            slots.add(old_slot[position], -1)
+        to_index = slots.count_before(new_slot[target_index])
+        slots.add(new_slot[target_index], 1)
+        if position is None:
+            operations.append({"op": "add", "path": _pointer(path, to_index), "value": item})
+        elif from_index != to_index:
+            operations.append({"op": "move", "from": _pointer(path, from_index), "path": _pointer(path, to_index)})
+
+    # The list is in target order now, so the changes inside items use their target index
+    source_by_key = {item[field]: item for item in kept}
+    for target_index, item in enumerate(target):
+        if item[field] in source_by_key:
+            _diff(source_by_key[item[field]], item, _pointer(path, target_index), operations)
+
+def _diff_lists(source: list, target: list, path: str, operations: list):
+    field = _list_key_field(source, target)
+    if field is not None:
+        _diff_keyed_lists(source, target, field, path, operations)
+        return
+
+    common = min(len(source), len(target))
+    for index in range(common):
+        _diff(source[index], target[index], _pointer(path, index), operations)
+    for index in range(len(source) - 1, common - 1, -1):
+        operations.append({"op": "remove", "path": _pointer(path, index)})
+    for index in range(common, len(target)):
+        operations.append({"op": "add", "path": _pointer(path, index), "value": target[index]})
+
+def _diff_dicts(source: dict, target: dict, path: str, operations: list):
+    for key in source:
+        if key not in target:
+            operations.append({"op": "remove", "path": _pointer(path, key)})
+    for key, value in target.items():
+        if key in source:
+            _diff(source[key], value, _pointer(path, key), operations)
+        else:
+            operations.append({"op": "add", "path": _pointer(path, key), "value": value})
+
+def _diff(source: Any, target: Any, path: str, operations: list):
+    if isinstance(source, dict) and isinstance(target, dict):
+        _diff_dicts(source, target, path, operations)
+    elif isinstance(source, list) and isinstance(target, list):
+        _diff_lists(source, target, path, operations)
+    # The type check keeps true and 1 (equal in Python) apart
+    elif type(source) is not type(target) or source != target:
+        operations.append({"op": "replace", "path": path, "value": target})
+
+def diff(source: Any, target: Any) -> list[dict]:
+    """RFC 6902 JSON Patch that turns source into target.
+
+    Lists of objects are matched on LIST_KEY_FIELDS, so reordering produces move operations and
+    changed items are patched in place instead of being replaced. Runs in O(n log n) for the
+    items of a keyed list and linear time for everything else.
+    """
+    operations: list[dict] = []
+    _diff(source, target, "", operations)
+    return operations
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def publish_digital_twin(digital_twin_id: int, db: Session) -> dict:
+    """Store the current export as the published one, returning the patch from the previous publication"""
+    _, export_data = export_service.export_digital_twin_cached(db, digital_twin_id)
+    content = json.dumps(export_data, indent=2)
+    previous = repo.get_published_export(db, digital_twin_id)
+    patch = diff(json.loads(previous.content), export_data) if previous is not None else None
+    published = repo.save_published_export(db, digital_twin_id, content, _content_hash(content))
+    return {
+        "digital_twin_id": digital_twin_id,
+        "content_hash": published.content_hash,
+        "published_at": published.published_at,
+        # None on the first publication
+        "patch": patch,
+    }
+
+async def get_published_export(digital_twin_id: int, db: AsyncSession):
+    return await repo.get_published_export_async(db, digital_twin_id)
+
+def diff_with_published(digital_twin_id: int, published_content: str) -> tuple[str, list[dict]]:
+    """(fingerprint of the current export, patch from the published export to it), renders on a session of its own"""
+    fingerprint, (_, export_data) = export_service.render_digital_twin_export(digital_twin_id)
+    return fingerprint, diff(json.loads(published_content), export_data)
@@ -1,24 +1,26 @@
 import repositories.digital_twin_repository as digital_twin_repo
-import repositories.layer_repository as layer_repo
-import repositories.viewer_repository as viewer_repo
-import repositories.group_repository as group_repo
-import repositories.tool_repository as tool_repo
-import repositories.digital_twin_tool_relation_repository as tool_relation_repo
 import repositories.bookmark_repository as bookmark_repo
 import repositories.project_repository as project_repo
 import repositories.story_repository as story_repo
 import repositories.terrain_provider_repository as terrain_provider_repo
 import services.content_type_service as content_type_service
-import services.digital_twin_cesium_config_service as cesium_config_service
-import services.digital_twin_terrain_provider_relation_service as terrain_provider_service
-import copy
+import services.export_cache_service as export_cache_service
+import os
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
 from schemas.layer_schema import LayerResponse
 from schemas.viewer_schema import ViewerResponse
-from schemas.group_schema import GroupResponse
 from schemas.tool_schema import ToolResponse
 
 from sqlalchemy.orm import Session
+from db.database import SessionLocal
+
+# Content types referenced by the export, resolved together in one lookup
+EXPORT_CONTENT_TYPES = ["bookmark", "project", "story", "terrain_provider"]
+
+# Concurrent renders (and so database connections) used by bulk exports
+EXPORT_BULK_WORKERS = int(os.getenv("EXPORT_BULK_WORKERS", "4"))
 
 def transform_layer(layer, assoc=None):
     content = layer.content if isinstance(layer.content, dict) else {}
@@ -152,69 +154,201 @@ def build_viewer_export(digital_twin, viewer):
     
     return viewer_export
 
-def build_chapter_groups(chapters):
-    """Build chapterGroups from story chapters"""
-    if not chapters or not isinstance(chapters, list):
-        return []
+# Chapter fields that only feed chapterGroups and are left out of the exported chapters
+CHAPTER_GROUP_KEYS = ("title", "buttonText")
+
+def export_step_layers(layers):
+    """
+    Layer Property Cleaning Strategy:
+    - Remove unused/frontend properties to minimize export size
+    - Only export 'opacity' when transparency is actually enabled
+    - Only export 'style' when custom styling is defined
+    - Never export 'transparent' or 'title' fields - they're frontend-only
+    - Only preserve 'id' as it's essential for layer identification
+    """
+    for layer in layers:
+        if not isinstance(layer, dict):
+            # Handle simple layer references (just IDs)
+            yield layer
+            continue
+        cleaned_layer = {"id": layer.get("id")}
+        # Only include opacity if transparent is true and opacity exists
+        # Note: transparent field itself is never exported, it's only used to determine if opacity should be included
+        if layer.get("transparent") and "opacity" in layer:
+            cleaned_layer["opacity"] = layer["opacity"]
+        # Only include style if it has a meaningful value
+        if layer.get("style") and str(layer["style"]).strip():
+            cleaned_layer["style"] = layer["style"]
+        yield cleaned_layer
+
+def export_steps(steps):
+    for step in steps:
+        if isinstance(step, dict) and isinstance(step.get("layers"), list):
+            yield {
+                key: list(export_step_layers(value)) if key == "layers" else value
+                for key, value in step.items()
+            }
+        else:
+            yield step
 
+def export_story_chapters(chapters):
+    """Exported chapters and their chapterGroups, built in one pass over the story content.
+
+    The source content is never modified or copied: new dicts are built only where fields are
+    dropped or cleaned, all other values are shared with the source.
+    """
+    if not isinstance(chapters, list):
+        return chapters, []
+
+    exported_chapters = []
     chapter_groups = []
     for index, chapter in enumerate(chapters):
-        if isinstance(chapter, dict):
-            chapter_id = str(index + 1)
-            # Use chapter.title and chapter.buttonText, fallback to defaults
-            title = chapter.get("title") or f"Hoofdstuk {chapter_id}"
-            button_text = chapter.get("buttonText") or title
-            chapter_group = {
-                "id": chapter_id,
-                "title": title,
-                "buttonText": button_text
-            }
-            chapter_groups.append(chapter_group)
-    return chapter_groups
+        if not isinstance(chapter, dict):
+            exported_chapters.append(chapter)
+            continue
+        chapter_id = str(index + 1)
+        # Use chapter.title and chapter.buttonText, fallback to defaults
+        title = chapter.get("title") or f"Hoofdstuk {chapter_id}"
+        chapter_groups.append({
+            "id": chapter_id,
+            "title": title,
+            "buttonText": chapter.get("buttonText") or title
+        })
+        exported_chapters.append({
+            key: list(export_steps(value)) if key == "steps" and isinstance(value, list) else value
+            for key, value in chapter.items()
+            if key not in CHAPTER_GROUP_KEYS
+        })
+    return exported_chapters, chapter_groups
+
+def without_empty_values(values):
+    # Lists lose their empty strings, nested dicts their empty strings and empty lists
+    for key, value in values.items():
+        # Remove keys with empty string
+        if isinstance(value, str) and value == "":
+            continue
+        # Remove arrays that are empty or only contain empty strings
+        elif isinstance(value, list):
+            filtered = [item for item in value if item != ""]
+            if filtered:
+                yield key, filtered
+        # For nested dicts (specialResources)
+        elif isinstance(value, dict):
+            cleaned_nested = {}
+            for nested_key, nested_value in value.items():
+                if isinstance(nested_value, list):
+                    filtered_nested = [item for item in nested_value if item != ""]
+                    if filtered_nested:
+                        cleaned_nested[nested_key] = filtered_nested
+                elif isinstance(nested_value, str) and nested_value != "":
+                    cleaned_nested[nested_key] = nested_value
+            if cleaned_nested:
+                yield key, cleaned_nested
+        else:
+            yield key, value
+
+def export_connectors(connectors):
+    """The layerlibrary connectors without empty values, built without copying the source"""
+    for connector in connectors:
+        yield dict(without_empty_values(connector))
+
+def export_group_hierarchy(groups, digital_twin_id: int | None = None) -> list[dict]:
+    """Groups in parent-before-child (depth first) order, siblings by sort_order, without sort_order.
+
+    Walks a parent -> children index instead of rescanning the group list per node, so the export
+    stays linear in the number of groups. Groups whose parent chain never reaches a root (a
+    parent_id cycle or a parent outside this twin) cannot be placed and are left out with a warning.
+    """
+    children_by_parent = defaultdict(list)
+    for group in groups:
+        children_by_parent[group.parent_id].append(group)
+    for children in children_by_parent.values():
+        children.sort(key=lambda g: getattr(g, 'sort_order', 0))
+
+    result = []
+    visited = set()
+    # Iterative depth first walk, so deep hierarchies cannot hit the recursion limit
+    stack = list(reversed(children_by_parent[None]))
+    while stack:
+        group = stack.pop()
+        if group.id in visited:
+            continue
+        visited.add(group.id)
+        result.append({
+            "id": str(group.id),
+            "title": group.title,
+            "parentId": str(group.parent_id) if group.parent_id is not None else "",
+        })
+        stack.extend(reversed(children_by_parent.get(group.id, [])))
+
+    skipped = [group.id for group in groups if group.id not in visited]
+    if skipped:
+        print(
+            f"Warning: groups {skipped} of digital twin {digital_twin_id} are not connected to a root group "
+            "(parent_id cycle or missing parent), leaving them out of the export"
+        )
+    return result
+
+def load_shared_export_data(db: Session) -> dict:
+    """Load the lookup data every export uses, so bulk exports fetch it once instead of per twin"""
+    return {
+        "content_types": content_type_service.get_content_types_by_names(db, EXPORT_CONTENT_TYPES),
+        "terrain_providers_by_id": {tp.id: tp for tp in terrain_provider_repo.get_all(db)},
+    }
 
-def export_digital_twin(db: Session, digital_twin_id: int):
-    digital_twin = digital_twin_repo.get_digital_twin_by_id(db, digital_twin_id)
+def export_digital_twin(db: Session, digital_twin_id: int, shared: dict | None = None):
+    # Twin, viewer, groups, layer and tool associations (with their layers and tools) in one eager load
+    digital_twin = digital_twin_repo.get_digital_twin_for_export(db, digital_twin_id)
     if not digital_twin:
         raise ValueError("Digital twin not found")
 
     # Sort layer associations by sort_order
     sorted_layer_assocs = sorted(digital_twin.layer_associations, key=lambda assoc: getattr(assoc, 'sort_order', 0))
-    layer_ids = [assoc.layer_id for assoc in sorted_layer_assocs]
-    print(layer_ids)
-    layers = layer_repo.get_layers_by_ids(db, layer_ids)
-    # Reorder layers to match layer_ids order
-    layers_by_id = {str(layer.id): layer for layer in layers}
-    ordered_layers = [layers_by_id[str(lid)] for lid in layer_ids if str(lid) in layers_by_id]
+    ordered_layers = [assoc.layer for assoc in sorted_layer_assocs if assoc.layer is not None]
+    layer_titles_by_id = {layer.id: layer.title for layer in ordered_layers}
 
-    viewer = viewer_repo.get_viewer_by_digital_twin_id(db, digital_twin_id)
+    viewer = digital_twin.viewer
 
     # Get ALL groups for this digital twin (not just ones with layers)
-    groups = group_repo.get_groups_by_digital_twin_id(db, digital_twin_id)
-
-    tool_ids = [assoc.tool_id for assoc in digital_twin.tool_associations]
-    tools = tool_repo.get_tools_by_ids(db, tool_ids)
+    groups = digital_twin.groups
+
+    # Get all tool associations for this digital twin, ordered like the repository query
+    all_tool_associations = sorted(digital_twin.tool_associations, key=lambda assoc: (assoc.sort_order, assoc.id))
+    # Content types come from the in-process registry, so they cost no query per export. The tools
+    # are the rows loaded with the associations: a registry that another process has not invalidated
+    # yet would render old tool settings under the current fingerprint and ETag.
+    if shared is not None:
+        content_types = shared["content_types"]
+    else:
+        content_types = content_type_service.get_content_types_by_names(db, EXPORT_CONTENT_TYPES)
+    tools_by_id = {assoc.tool_id: assoc.tool for assoc in all_tool_associations if assoc.tool is not None}
+    tools = [tools_by_id[tool_id] for tool_id in sorted(tools_by_id)]
+
+    # Index the tool associations once so the assembly below stays linear in the size of the twin
+    content_associations_by_type = defaultdict(list)
+    settings_association_by_tool_id = {}
+    for assoc in all_tool_associations:
+        if assoc.content_type_id is None:
+            # The first tool-level association holds the customized tool settings
+            settings_association_by_tool_id.setdefault(assoc.tool_id, assoc)
+        elif assoc.content_id:
+            content_associations_by_type[assoc.content_type_id].append(assoc)
 
-    # Get all tool associations for this digital twin
-    all_tool_associations = tool_relation_repo.get_associations_by_digital_twin(db, digital_twin_id)
-    
     # Get bookmark content type
-    bookmark_content_type = content_type_service.get_content_type_by_name(db, "bookmark")
+    bookmark_content_type = content_types.get("bookmark")
     bookmark_associations = []
     
     # Get project content type
-    project_content_type = content_type_service.get_content_type_by_name(db, "project")
+    project_content_type = content_types.get("project")
     project_associations = []
     
     # Get story content type
-    story_content_type = content_type_service.get_content_type_by_name(db, "story")
+    story_content_type = content_types.get("story")
     story_associations = []
     
     if bookmark_content_type:
         # Filter associations that are bookmarks and have content_id
-        bookmark_tool_associations = [
-            assoc for assoc in all_tool_associations 
-            if assoc.content_type_id == bookmark_content_type.id and assoc.content_id
-        ]
+        bookmark_tool_associations = content_associations_by_type[bookmark_content_type.id]
         
         # Get bookmark details for each association
         bookmark_ids = [assoc.content_id for assoc in bookmark_tool_associations]
@@ -225,7 +359,7 @@ def export_digital_twin(db: Session, digital_twin_id: int):
             # Create bookmark entries with tool reference, but only for existing bookmarks
             for assoc in bookmark_tool_associations:
                 bookmark = bookmarks_by_id.get(assoc.content_id)
-                tool = next((t for t in tools if t.id == assoc.tool_id), None)
+                tool = tools_by_id.get(assoc.tool_id)
                 
                 # Only process if both bookmark and tool exist
                 if bookmark and tool:
@@ -246,10 +380,7 @@ def export_digital_twin(db: Session, digital_twin_id: int):
 
     if project_content_type:
         # Filter associations that are projects and have content_id
-        project_tool_associations = [
-            assoc for assoc in all_tool_associations 
-            if assoc.content_type_id == project_content_type.id and assoc.content_id
-        ]
+        project_tool_associations = content_associations_by_type[project_content_type.id]
         
         # Get project details for each association
         project_ids = [assoc.content_id for assoc in project_tool_associations]
@@ -260,7 +391,7 @@ def export_digital_twin(db: Session, digital_twin_id: int):
             # Create project entries with tool reference and default flag, but only for existing projects
             for assoc in project_tool_associations:
                 project = projects_by_id.get(assoc.content_id)
-                tool = next((t for t in tools if t.id == assoc.tool_id), None)
+                tool = tools_by_id.get(assoc.tool_id)
                 
                 # Only process if both project and tool exist
                 if project and tool:
@@ -282,9 +413,9 @@ def export_digital_twin(db: Session, digital_twin_id: int):
                                 layer_titles = []
                                 for layer_id in layer_ids:
                                     # Find the layer by ID and get its title
-                                    layer = next((l for l in layers if l.id == int(layer_id)), None)
-                                    if layer:
-                                        layer_titles.append(layer.title)
+                                    layer_title = layer_titles_by_id.get(int(layer_id))
+                                    if layer_title is not None:
+                                        layer_titles.append(layer_title)
                                     else:
                                         # Fallback to ID if layer not found
                                         layer_titles.append(str(layer_id))
@@ -301,10 +432,7 @@ def export_digital_twin(db: Session, digital_twin_id: int):
 
     if story_content_type:
         # Filter associations that are stories and have content_id
-        story_tool_associations = [
-            assoc for assoc in all_tool_associations 
-            if assoc.content_type_id == story_content_type.id and assoc.content_id
-        ]
+        story_tool_associations = content_associations_by_type[story_content_type.id]
         
         # Get story details for each association
         story_ids = [assoc.content_id for assoc in story_tool_associations]
@@ -315,7 +443,7 @@ def export_digital_twin(db: Session, digital_twin_id: int):
             # Create story entries with tool reference, but only for existing stories
             for assoc in story_tool_associations:
                 story = stories_by_id.get(assoc.content_id)
-                tool = next((t for t in tools if t.id == assoc.tool_id), None)
+                tool = tools_by_id.get(assoc.tool_id)
                 
                 # Only process if both story and tool exist
                 if story and tool:
@@ -337,54 +465,10 @@ def export_digital_twin(db: Session, digital_twin_id: int):
                             story_data["baseLayerId"] = str(story.content["baseLayerId"]) if story.content["baseLayerId"] is not None else ""
                         # Add chapters if they exist
                         if "chapters" in story.content:
-                            chapters_copy = copy.deepcopy(story.content["chapters"])
-                            chapter_groups = build_chapter_groups(chapters_copy)
+                            chapters, chapter_groups = export_story_chapters(story.content["chapters"])
                             if chapter_groups:
                                 story_data["chapterGroups"] = chapter_groups
-                            
-                            # Process chapters to clean up layer properties and remove title/buttonText
-                            for chapter in chapters_copy:
-                                if "title" in chapter:
-                                    del chapter["title"]
-                                if "buttonText" in chapter:
-                                    del chapter["buttonText"]
-                                
-                                # Process steps within each chapter
-                                if "steps" in chapter and isinstance(chapter["steps"], list):
-                                    for step in chapter["steps"]:
-                                        if "layers" in step and isinstance(step["layers"], list):
-                                            """
-                                            Layer Property Cleaning Strategy:
-                                            - Remove unused/frontend properties to minimize export size
-                                            - Only export 'opacity' when transparency is actually enabled
-                                            - Only export 'style' when custom styling is defined
-                                            - Never export 'transparent' or 'title' fields - they're frontend-only
-                                            - Only preserve 'id' as it's essential for layer identification
-                                            """
-                                            cleaned_layers = []
-                                            for layer in step["layers"]:
-                                                if isinstance(layer, dict):
-                                                    cleaned_layer = {
-                                                        "id": layer.get("id")
-                                                    }
-                                                    
-                                                    # Only include opacity if transparent is true and opacity exists
-                                                    # Note: transparent field itself is never exported, it's only used to determine if opacity should be included
-                                                    if layer.get("transparent") and "opacity" in layer:
-                                                        cleaned_layer["opacity"] = layer["opacity"]
-                                                    
-                                                    # Only include style if it has a meaningful value
-                                                    if layer.get("style") and str(layer["style"]).strip():
-                                                        cleaned_layer["style"] = layer["style"]
-                                                    
-                                                    cleaned_layers.append(cleaned_layer)
-                                                else:
-                                                    # Handle simple layer references (just IDs)
-                                                    cleaned_layers.append(layer)
-                                            
-                                            step["layers"] = cleaned_layers
-                            
-                            story_data["chapters"] = chapters_copy
+                            story_data["chapters"] = chapters
 
                     story_associations.append(story_data)
                 elif not story:
@@ -404,6 +488,23 @@ def export_digital_twin(db: Session, digital_twin_id: int):
         for layer in background_layers + feature_layers
     ]
 
+    # Group bookmarks, stories and projects per tool name and remove the tool reference
+    bookmarks_by_tool = defaultdict(list)
+    for bookmark in bookmark_associations:
+        bookmarks_by_tool[bookmark["tool"]].append({k: v for k, v in bookmark.items() if k != "tool"})
+
+    stories_by_tool = defaultdict(list)
+    for story in story_associations:
+        stories_by_tool[story["tool"]].append({k: v for k, v in story.items() if k != "tool"})
+
+    projects_by_tool = defaultdict(list)
+    default_project_by_tool = {}
+    for project in project_associations:
+        # Drop the is_default flag as well, it only tracks the default project
+        projects_by_tool[project["tool"]].append({k: v for k, v in project.items() if k not in ["tool", "is_default"]})
+        if project.get("is_default"):
+            default_project_by_tool[project["tool"]] = project.get("name")
+
     # Transform tools to include bookmarks, projects, and stories
     tools_with_content = []
     bookmark_tool_added = False
@@ -414,36 +515,13 @@ def export_digital_twin(db: Session, digital_twin_id: int):
         tool_data = ToolResponse.model_validate(tool).model_dump()
         
         # Get the tool association to access customized settings
-        tool_association = next((assoc for assoc in all_tool_associations if assoc.tool_id == tool.id and assoc.content_type_id is None), None)
+        tool_association = settings_association_by_tool_id.get(tool.id)
         
-        # Get bookmarks for this specific tool and remove the tool reference
-        tool_bookmarks = []
-        for bookmark in bookmark_associations:
-            if bookmark.get("tool") == tool.name:
-                # Create a copy without the tool reference
-                clean_bookmark = {k: v for k, v in bookmark.items() if k != "tool"}
-                tool_bookmarks.append(clean_bookmark)
-        
-        # Get stories for this specific tool and remove the tool reference
-        tool_stories = []
-        for story in story_associations:
-            if story.get("tool") == tool.name:
-                # Create a copy without the tool reference
-                clean_story = {k: v for k, v in story.items() if k != "tool"}
-                tool_stories.append(clean_story)
-
-        # Get projects for this specific tool and remove the tool reference
-        tool_projects = []
-        default_project = None
-        for project in project_associations:
-            if project.get("tool") == tool.name:
-                # Create a copy without the tool reference and is_default flag
-                clean_project = {k: v for k, v in project.items() if k not in ["tool", "is_default"]}
-                tool_projects.append(clean_project)
-                
-                # Track the default project name
-                if project.get("is_default"):
-                    default_project = project.get("name")
+        # Get bookmarks, stories and projects for this specific tool
+        tool_bookmarks = bookmarks_by_tool.get(tool.name, [])
+        tool_stories = stories_by_tool.get(tool.name, [])
+        tool_projects = projects_by_tool.get(tool.name, [])
+        default_project = default_project_by_tool.get(tool.name)
         
         # Check if this is a bookmarks tool and there are bookmarks
         if tool.name == "bookmarks" and tool_bookmarks:
@@ -489,22 +567,40 @@ def export_digital_twin(db: Session, digital_twin_id: int):
             story_tool_added = True
         # Check if this is a cesium tool
         elif tool.name == "cesium":
-            # Get cesium configuration
-            cesium_config = cesium_config_service.get_cesium_configuration(digital_twin_id, db) or {}
+            # Get cesium configuration from the tool-level association (no content type, no content id)
+            cesium_association = next(
+                (assoc for assoc in all_tool_associations
+                 if assoc.tool_id == tool.id and
+                    assoc.content_type_id is None and
+                    assoc.content_id is None),
+                None
+            )
+            cesium_config = (cesium_association.content if cesium_association else None) or {}
             
             # Check cesium settings mode setting
             cesium_settings_mode = cesium_config.get("cesiumSettingsMode", "default")
             
             # Always get terrain providers (regardless of mode)
             terrain_providers_data = []
-            terrain_provider_associations = terrain_provider_service.get_digital_twin_terrain_providers(digital_twin_id, db)
+            terrain_provider_content_type = content_types.get("terrain_provider")
+            terrain_provider_associations = []
+            if terrain_provider_content_type:
+                terrain_provider_associations = [
+                    assoc for assoc in all_tool_associations
+                    if (assoc.tool_id == tool.id and
+                        assoc.content_type_id == terrain_provider_content_type.id and
+                        assoc.content_id)
+                ]
             
             # Get terrain provider details
             if terrain_provider_associations:
                 terrain_provider_ids = [assoc.content_id for assoc in terrain_provider_associations if assoc.content_id]
                 if terrain_provider_ids:
-                    terrain_providers = terrain_provider_repo.get_by_ids(db, terrain_provider_ids)
-                    terrain_providers_by_id = {tp.id: tp for tp in terrain_providers}
+                    if shared is not None:
+                        terrain_providers_by_id = shared["terrain_providers_by_id"]
+                    else:
+                        terrain_providers = terrain_provider_repo.get_by_ids(db, terrain_provider_ids)
+                        terrain_providers_by_id = {tp.id: tp for tp in terrain_providers}
                     
                     for assoc in terrain_provider_associations:
                         if assoc.content_id and assoc.content_id in terrain_providers_by_id:
@@ -567,37 +663,8 @@ def export_digital_twin(db: Session, digital_twin_id: int):
             if settings:
                 # Clean connectors for layerlibrary tool only before export
                 if tool.name == "layerlibrary" and "connectors" in settings:
-                    def clean_connectors(connectors):
-                        cleaned_connectors = []
-                        for connector in connectors:
-                            cleaned_connector = {}
-                            for k, v in connector.items():
-                                # Remove keys with empty string
-                                if isinstance(v, str) and v == "":
-                                    continue
-                                # Remove arrays that are empty or only contain empty strings
-                                elif isinstance(v, list):
-                                    filtered = [item for item in v if item != ""]
-                                    if filtered:
-                                        cleaned_connector[k] = filtered
-                                # For nested dicts (specialResources)
-                                elif isinstance(v, dict):
-                                    cleaned_nested = {}
-                                    for nk, nv in v.items():
-                                        if isinstance(nv, list):
-                                            filtered_nested = [item for item in nv if item != ""]
-                                            if filtered_nested:
-                                                cleaned_nested[nk] = filtered_nested
-                                        elif isinstance(nv, str) and nv != "":
-                                            cleaned_nested[nk] = nv
-                                    if cleaned_nested:
-                                        cleaned_connector[k] = cleaned_nested
-                                else:
-                                    cleaned_connector[k] = v
-                            cleaned_connectors.append(cleaned_connector)
-                        return cleaned_connectors
-                    settings = copy.deepcopy(settings)
-                    settings["connectors"] = clean_connectors(settings["connectors"])
+                    # A new top level dict, the bookmarks added below must not end up in the source settings
+                    settings = {**settings, "connectors": list(export_connectors(settings["connectors"]))}
                 transformed_tool["settings"] = settings
             
             # For other tools, add bookmarks to existing settings if there are any
@@ -688,29 +755,7 @@ def export_digital_twin(db: Session, digital_twin_id: int):
             tools_with_content.append(stories_tool)
 
 
-    # Export groups in parent-before-child order, recursively, and remove sort_order from output
-    def export_group_hierarchy(groups, parent_id=None):
-        # Get direct children of parent_id, sorted by sort_order
-        children = [g for g in groups if (g.parent_id == parent_id)]
-        children = sorted(children, key=lambda g: getattr(g, 'sort_order', 0))
-        result = []
-        for group in children:
-            group_dict = GroupResponse.model_validate(group).model_dump()
-            group_dict.pop('sort_order', None)
-            # Convert IDs to strings and rename parent_id to parentId
-            group_dict['id'] = str(group_dict['id'])
-            if group_dict.get('parent_id') is not None:
-                group_dict['parentId'] = str(group_dict['parent_id'])
-            else:
-                group_dict['parentId'] = ""
-            # Remove the snake_case version
-            group_dict.pop('parent_id', None)
-            result.append(group_dict)
-            # Recursively add children
-            result.extend(export_group_hierarchy(groups, group.id))
-        return result
-
-    exported_groups = export_group_hierarchy(groups, parent_id=None)
+    exported_groups = export_group_hierarchy(groups, digital_twin.id)
 
     export_data = {
         "layers": layers_response,
@@ -722,3 +767,80 @@ def export_digital_twin(db: Session, digital_twin_id: int):
     # Format filename: lowercase, spaces to underscores
     export_filename = digital_twin.name.lower().replace(' ', '_') if digital_twin.name else 'export'
     return export_filename, export_data
+
+def get_export_fingerprint(db: Session, digital_twin_id: int) -> str:
+    """Fingerprint of the twin, read in the snapshot the export is then rendered from.
+
+    Postgres takes a new snapshot per statement by default, so a write committed between the
+    fingerprint and the render would be cached under the older fingerprint and ETag. Repeatable
+    read keeps the rest of the session's transaction on the snapshot of the fingerprint.
+    """
+    if db.get_bind().dialect.name == "postgresql" and not db.in_transaction():
+        db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    fingerprint = export_cache_service.get_fingerprint(db, digital_twin_id)
+    if fingerprint is None:
+        raise ValueError("Digital twin not found")
+    return fingerprint
+
+def export_digital_twin_cached(db: Session, digital_twin_id: int, fingerprint: str | None = None, live: bool = False):
+    """Return the export from the cache while the twin's fingerprint is unchanged, rendering it otherwise.
+
+    live skips the cache lookup and always renders, the result still replaces the cached export.
+    Without a fingerprint it is read on db, in the same snapshot as the render.
+    """
+    if fingerprint is None:
+        fingerprint = get_export_fingerprint(db, digital_twin_id)
+
+    if not live:
+        cached = export_cache_service.get(digital_twin_id, fingerprint)
+        if cached is not None:
+            return cached
+
+    export = export_digital_twin(db, digital_twin_id)
+    export_cache_service.put(digital_twin_id, fingerprint, export)
+    return export
+
+def render_digital_twin_export(digital_twin_id: int, live: bool = False):
+    """export_digital_twin_cached on a session of its own, for async routes that offload rendering to a thread.
+
+    Returns (fingerprint, export), the fingerprint matches the rendered export and is the one to build ETags from.
+    """
+    with SessionLocal() as db:
+        fingerprint = get_export_fingerprint(db, digital_twin_id)
+        return fingerprint, export_digital_twin_cached(db, digital_twin_id, fingerprint, live)
+
+def export_digital_twins(digital_twin_ids: list[int] | None = None, max_workers: int = EXPORT_BULK_WORKERS):
+    """Render many digital twins concurrently, yielding (filename, export_data) in the given order.
+
+    Each worker uses its own session, so at most max_workers pool connections are checked out
+    at once. Only a bounded window of exports is held in memory while earlier ones are consumed.
+    """
+    db = SessionLocal()
+    try:
+        if digital_twin_ids is None:
+            digital_twin_ids = [twin.id for twin in digital_twin_repo.get_all_digital_twins(db)]
+        shared = load_shared_export_data(db)
+    finally:
+        db.close()
+
+    def render(digital_twin_id: int):
+        with SessionLocal() as worker_db:
+            try:
+                return export_digital_twin(worker_db, digital_twin_id, shared)
+            except ValueError:
+                # Deleted (or never existed) since the list of IDs was taken
+                print(f"Warning: Digital twin {digital_twin_id} not found, skipping it in bulk export")
+                return None
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        pending = deque()
+        for digital_twin_id in digital_twin_ids:
+            pending.append(executor.submit(render, digital_twin_id))
+            if len(pending) >= max_workers * 2:
+                export = pending.popleft().result()
+                if export is not None:
+                    yield export
+        while pending:
+            export = pending.popleft().result()
+            if export is not None:
+                yield export
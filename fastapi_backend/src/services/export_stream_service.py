@@ -0,0 +1,123 @@
+import json
+import zipfile
+import zlib
+from typing import Any, Iterable, Iterator, Tuple
+
+# Flush encoded output to the response roughly every 64 KiB
+CHUNK_SIZE = 64 * 1024
+
+def _encode(value: Any, compact: bool, depth: int) -> str:
+    if compact:
+        return json.dumps(value, separators=(",", ":"))
+    # Literal newlines only occur between tokens (they are escaped inside strings),
+    # so re-indenting them nests the value at the right depth
+    return json.dumps(value, indent=2).replace("\n", "\n" + "  " * depth)
+
+def _iter_export_parts(export_data: dict, compact: bool) -> Iterator[str]:
+    newline = "" if compact else "\n"
+    key_separator = ":" if compact else ": "
+    item_separator = "," if compact else ",\n"
+
+    if not export_data:
+        yield "{}"
+        return
+
+    yield "{" + newline
+    for key_index, (key, value) in enumerate(export_data.items()):
+        if key_index:
+            yield item_separator
+        prefix = "" if compact else "  "
+        yield prefix + json.dumps(key) + key_separator
+
+        # Stream list sections (layers, groups, tools) item by item, encode everything else at once
+        if isinstance(value, list) and value:
+            yield "[" + newline
+            for item_index, item in enumerate(value):
+                if item_index:
+                    yield item_separator
+                yield ("" if compact else "    ") + _encode(item, compact, 2)
+            yield newline + prefix + "]"
+        else:
+            yield _encode(value, compact, 1)
+    yield newline + "}"
+
+def iter_export_json(export_data: dict, compact: bool = False) -> Iterator[bytes]:
+    """Encode an export incrementally, byte-identical to json.dumps(export_data, indent=2) unless compact.
+
+    Only the encoding is chunked: export_data is the complete export, built in memory before the
+    first byte is sent. This bounds the encoded copy and starts the response sooner, it does not
+    lower the peak memory of rendering a large twin.
+    """
+    buffer = []
+    size = 0
+    for part in _iter_export_parts(export_data, compact):
+        buffer.append(part)
+        size += len(part)
+        if size >= CHUNK_SIZE:
+            yield "".join(buffer).encode("utf-8")
+            buffer = []
+            size = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+def iter_text(content: str) -> Iterator[bytes]:
+    """Encode an already rendered export in CHUNK_SIZE pieces"""
+    for start in range(0, len(content), CHUNK_SIZE):
+        yield content[start:start + CHUNK_SIZE].encode("utf-8")
+
+def iter_gzip(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip a stream of chunks without collecting them first"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+class _ZipBuffer:
+    """Write-only file object that collects what zipfile writes until it is drained"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+def iter_export_zip(exports: Iterable[Tuple[str, dict]], compact: bool = False) -> Iterator[bytes]:
+    """Stream a zip archive with one <name>.config.json entry per export, as the exports arrive"""
+    buffer = _ZipBuffer()
+    used_names = set()
+    with zipfile.ZipFile(buffer, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, export_data in exports:
+            filename = f"{name}.config.json"
+            suffix = 2
+            while filename in used_names:
+                # Different twin names can normalize to the same filename
+                filename = f"{name}_{suffix}.config.json"
+                suffix += 1
+            used_names.add(filename)
+
+            with archive.open(filename, mode="w") as entry:
+                for chunk in iter_export_json(export_data, compact=compact):
+                    entry.write(chunk)
+            data = buffer.drain()
+            if data:
+                yield data
+    # Closing the archive writes the central directory
+    data = buffer.drain()
+    if data:
+        yield data
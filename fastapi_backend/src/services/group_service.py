@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.group_schema import GroupCreate, GroupUpdate
 import repositories.group_repository as repo
+import services.export_cache_service as export_cache_service
 from models.group import Group
 
 def get_group(group_id: int, db: Session) -> Group | None:
@@ -9,20 +11,51 @@ def get_group(group_id: int, db: Session) -> Group | None:
 def list_groups(digital_twin_id: int, db: Session) -> list[Group]:
     return repo.get_groups_by_digital_twin_id(db, digital_twin_id)
 
+async def get_group_tree(digital_twin_id: int, db: AsyncSession) -> list[dict]:
+    """The groups of the twin as a nested tree, each node with its own and its subtree's layer count"""
+    rows = await repo.get_group_tree_rows(db, digital_twin_id)
+    nodes = {}
+    roots = []
+    # Parents come before their children, and siblings in sort_order
+    for row in rows:
+        node = {
+            "id": row.id,
+            "title": row.title,
+            "parent_id": row.parent_id,
+            "sort_order": row.sort_order,
+            "depth": row.depth,
+            "layer_count": row.layer_count,
+            "total_layer_count": row.layer_count,
+            "children": [],
+        }
+        nodes[row.id] = node
+        if row.parent_id is None:
+            roots.append(node)
+        else:
+            nodes[row.parent_id]["children"].append(node)
+    # Children last, so every subtree total is complete before it is added to its parent
+    for row in reversed(rows):
+        if row.parent_id is not None:
+            nodes[row.parent_id]["total_layer_count"] += nodes[row.id]["total_layer_count"]
+    return roots
+
 def create_group(digital_twin_id: int, group_create: GroupCreate, db: Session) -> Group:
     data = group_create.dict()
     data["digital_twin_id"] = digital_twin_id
+    export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
     return repo.insert_group(db, data)
 
 def update_group(digital_twin_id: int, group_id: int, group_update: GroupUpdate, db: Session) -> Group | None:
     group = repo.get_group_by_id(db, group_id)
     if not group or group.digital_twin_id != digital_twin_id:
         return None
+    export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
     return repo.update_group(db, group, group_update.dict(exclude_unset=True))
 
 def delete_group(digital_twin_id: int, group_id: int, db: Session) -> bool:
     group = repo.get_group_by_id(db, group_id)
     if not group or group.digital_twin_id != digital_twin_id:
         return False
+    export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
     repo.delete_group(db, group)
     return True
\ No newline at end of file
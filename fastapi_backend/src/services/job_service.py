@@ -0,0 +1,225 @@
+import os
+import tempfile
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from db.database import SessionLocal
+from schemas.job_schema import ExportJobParams, RefreshExportsJobParams, BulkAssociationsJobParams
+import repositories.job_repository as repo
+import repositories.digital_twin_repository as digital_twin_repo
+
+# Seconds an idle worker waits before looking for new jobs again
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1"))
+# Seconds without a heartbeat after which a running job is taken over by another worker
+JOB_STALE_AFTER = float(os.getenv("JOB_STALE_AFTER", "300"))
+# Times a job is started before it is failed, only jobs whose worker stopped are retried
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# Seconds finished jobs and their results are kept
+JOB_RESULT_TTL = float(os.getenv("JOB_RESULT_TTL", "86400"))
+# Largest result file a job may produce in bytes (0 disables the limit). Results are stored in
+# the job row, so a finished result is held in worker memory once while it is saved.
+JOB_MAX_RESULT_BYTES = int(os.getenv("JOB_MAX_RESULT_BYTES", str(256 * 1024 * 1024)))
+# Seconds between heartbeats of a running job, several per JOB_STALE_AFTER so a handler that
+# reports no progress for a while is not taken over while its worker is alive
+JOB_HEARTBEAT_INTERVAL = JOB_STALE_AFTER / 4
+
+# report(progress, total, message) of the running job
+Report = Callable[[int, Optional[int], Optional[str]], None]
+
+class JobTakenOver(Exception):
+    """Raised by report() when another worker claimed the job, the handler must stop"""
+
+@dataclass
+class JobOutput:
+    # JSON result, and/or a file such as an export archive
+    result: Any = None
+    file: Optional[bytes] = None
+    filename: Optional[str] = None
+    media_type: Optional[str] = None
+
+def collect_result_file(chunks: Iterable[bytes]) -> bytes:
+    """Write chunks to a temporary file as they are produced, failing as soon as they pass JOB_MAX_RESULT_BYTES"""
+    with tempfile.TemporaryFile() as file:
+        size = 0
+        for chunk in chunks:
+            size += len(chunk)
+            if JOB_MAX_RESULT_BYTES and size > JOB_MAX_RESULT_BYTES:
+                raise ValueError(
+                    f"Result is larger than JOB_MAX_RESULT_BYTES ({JOB_MAX_RESULT_BYTES} bytes), export fewer digital twins per job"
+                )
+            file.write(chunk)
+        file.seek(0)
+        return file.read()
+
+def run_export_job(db: Session, params: ExportJobParams, report: Report) -> JobOutput:
+    from services.export_service import export_digital_twins
+    from services.export_stream_service import iter_export_zip
+
+    digital_twin_ids = params.ids
+    if digital_twin_ids is None:
+        digital_twin_ids = [twin.id for twin in digital_twin_repo.get_all_digital_twins(db)]
+    total = len(digital_twin_ids)
+    report(0, total, "Exporting digital twins")
+
+    exported = 0
+    def counted(exports):
+        nonlocal exported
+        for export in exports:
+            yield export
+            exported += 1
+            report(exported, total, f"Exported {export[0]}")
+
+    archive = collect_result_file(iter_export_zip(counted(export_digital_twins(digital_twin_ids)), compact=params.compact))
+    # Twins deleted since the job was submitted are skipped
+    report(total, total, None)
+    return JobOutput(
+        result={"digital_twins": exported},
+        file=archive,
+        filename="digital_twins.zip",
+        media_type="application/zip"
+    )
+
+def run_refresh_exports_job(db: Session, params: RefreshExportsJobParams, report: Report) -> JobOutput:
+    from services.export_artifact_service import refresh_exports
+
+    report(0, None, "Refreshing stored exports")
+    refreshed = refresh_exports(db)
+    report(len(refreshed), len(refreshed), None)
+    return JobOutput(result={"refreshed": refreshed})
+
+def run_bulk_associations_job(db: Session, params: BulkAssociationsJobParams, report: Report) -> JobOutput:
+    import services.digital_twin_layer_relation_service as layer_service
+    import services.digital_twin_group_relation_service as group_service
+
+    if not digital_twin_repo.digital_twin_exists(db, params.digital_twin_id):
+        raise ValueError("Digital twin not found")
+    report(0, 2, "Updating layer associations")
+    layer_results = layer_service.handle_bulk_layer_operations(
+        params.digital_twin_id, params.payload.layer_payload.operations, db
+    )
+    report(1, 2, "Updating group associations")
+    group_results = group_service.handle_bulk_group_operations(
+        params.digital_twin_id, params.payload.group_payload.operations, db
+    )
+    report(2, 2, None)
+    return JobOutput(result={"layers": layer_results, "groups": group_results})
+
+# Job type -> (parameter schema, handler running on a session of its own)
+JOB_TYPES = {
+    "export": (ExportJobParams, run_export_job),
+    "refresh_exports": (RefreshExportsJobParams, run_refresh_exports_job),
+    "bulk_associations": (BulkAssociationsJobParams, run_bulk_associations_job),
+}
+
+def submit_job(job_type: str, params: dict, db: Session):
+    if job_type not in JOB_TYPES:
+        raise ValueError(f"Unknown job type {job_type}, use one of {', '.join(JOB_TYPES)}")
+    params_schema, _ = JOB_TYPES[job_type]
+    # Reject invalid parameters now instead of failing the job later
+    validated = params_schema.model_validate(params)
+    return repo.insert_job(db, job_type, validated.model_dump(mode="json"))
+
+async def get_job(job_id: int, db: AsyncSession):
+    return await repo.get_job_async(db, job_id)
+
+async def get_job_with_result(job_id: int, db: AsyncSession):
+    return await repo.get_job_async(db, job_id, with_result_file=True)
+
+def _keep_alive(job_id: int, attempts: int, stop: threading.Event, lost: threading.Event):
+    """Refresh the heartbeat of a running job until stop is set, on a session of its own"""
+    while not stop.wait(JOB_HEARTBEAT_INTERVAL):
+        try:
+            with SessionLocal() as db:
+                if not repo.touch_heartbeat(db, job_id, attempts):
+                    lost.set()
+                    return
+        except Exception as e:
+            # Try again on the next beat, the database may be restarting
+            print(f"Warning: heartbeat of job {job_id} failed: {str(e)}")
+
+def run_next_job(jobs_db: Session) -> bool:
+    """Claim and run one job, False when no job is waiting.
+
+    jobs_db only records the job's state and progress, the handler works on a session of its
+    own so progress reports never commit half of the handler's changes. Every write of the job
+    row is fenced on the attempt that was claimed, so after a takeover the earlier run stops at
+    its next progress report and its outcome is discarded.
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=JOB_STALE_AFTER)
+    job = repo.claim_next_job(jobs_db, stale_before)
+    if job is None:
+        return False
+    job_id, job_type, params, attempts = job.id, job.type, job.params, job.attempts
+
+    if attempts > JOB_MAX_ATTEMPTS:
+        repo.finish_job(jobs_db, job_id, attempts, "failed", error=f"Stopped {JOB_MAX_ATTEMPTS} times before finishing")
+        return True
+
+    lost = threading.Event()
+    def report(progress: int, total: Optional[int], message: Optional[str]):
+        if lost.is_set() or not repo.update_progress(jobs_db, job_id, attempts, progress, total, message):
+            raise JobTakenOver(f"Job {job_id} was taken over by another worker")
+
+    stop = threading.Event()
+    heartbeat = threading.Thread(target=_keep_alive, args=(job_id, attempts, stop, lost), daemon=True)
+    heartbeat.start()
+    print(f"Running job {job_id} ({job_type})")
+    output, error = None, None
+    try:
+        params_schema, handler = JOB_TYPES[job_type]
+        with SessionLocal() as db:
+            output = handler(db, params_schema.model_validate(params), report)
+    except JobTakenOver as e:
+        print(f"Warning: {str(e)}, stopped running it")
+        return True
+    except Exception as e:
+        # Handlers raise ValueError for expected failures such as a missing digital twin
+        if not isinstance(e, ValueError):
+            traceback.print_exc()
+        jobs_db.rollback()
+        error = str(e) or type(e).__name__
+    finally:
+        stop.set()
+        heartbeat.join()
+
+    if error is not None:
+        finished = repo.finish_job(jobs_db, job_id, attempts, "failed", error=error)
+    else:
+        finished = repo.finish_job(
+            jobs_db,
+            job_id,
+            attempts,
+            "succeeded",
+            result=output.result,
+            result_file=output.file,
+            result_filename=output.filename,
+            result_media_type=output.media_type
+        )
+    if not finished:
+        print(f"Warning: job {job_id} was taken over by another worker, discarding the outcome of this run")
+    elif error is None:
+        print(f"Finished job {job_id} ({job_type})")
+    return True
+
+def run_job_worker(poll_interval: float = JOB_POLL_INTERVAL):
+    """Run jobs until interrupted, any number of workers can share the queue"""
+    print(f"Job worker started, job types: {', '.join(JOB_TYPES)}")
+    last_cleanup = 0.0
+    while True:
+        try:
+            with SessionLocal() as jobs_db:
+                if time.monotonic() - last_cleanup > 60:
+                    repo.delete_finished_jobs(jobs_db, datetime.now(timezone.utc) - timedelta(seconds=JOB_RESULT_TTL))
+                    last_cleanup = time.monotonic()
+                while run_next_job(jobs_db):
+                    pass
+        except Exception as e:
+            # Keep running, the database may be restarting
+            print(f"Job worker error: {str(e)}")
+        time.sleep(poll_interval)
@@ -1,4 +1,5 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.layer_schema import LayerCreate, LayerUpdate
 import repositories.layer_repository as repo
 from models.layer import Layer
@@ -6,8 +7,8 @@ from models.layer import Layer
 def get_layer(layer_id: int, db: Session):
     return repo.get_layer_by_id(db, layer_id)
 
-def list_layers(db: Session):
-    return repo.get_all_layers(db)
+async def list_layers(db: AsyncSession, columns: list[str] | None = None):
+    return await repo.get_all_layers_async(db, columns)
 
 def create_layer(layer_create: LayerCreate, db: Session):
     layer = Layer(**layer_create.dict())
@@ -22,21 +23,27 @@ def delete_layer(existing_layer, db: Session):
 def get_digital_twins_for_layer(layer_id: int, db: Session):
     return repo.get_digital_twins_for_layer(db, layer_id)
 
-def get_layers_filtered_paginated(
-    db: Session,
+async def get_layers_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "title",
     sort_direction: str = "asc",
-    is_background: bool | None = None
+    is_background: bool | None = None,
+    cursor: str | None = None,
+    count_strategy: str = "exact",
+    columns: list[str] | None = None
 ):
-    return repo.get_filtered_paginated(
+    return await repo.get_filtered_paginated(
         db,
         search,
         page,
         page_size,
         sort_column,
         sort_direction,
-        is_background
+        is_background,
+        cursor,
+        count_strategy,
+        columns
     )
\ No newline at end of file
@@ -1,7 +1,9 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import repositories.project_repository as repository
 import repositories.digital_twin_tool_relation_repository as tool_relation_repo
 import services.content_type_service as content_type_service
+import services.export_cache_service as export_cache_service
 from models.tool_associations import Project
 from schemas.project_schema import (
     ProjectCreate,
@@ -11,8 +13,8 @@ from schemas.project_schema import (
 def get_project(db: Session, project_id: int) -> Project | None:
     return repository.get_by_id(db, project_id)
 
-def get_all_projects(db: Session) -> list[Project]:
-    return repository.get_all(db)
+async def get_all_projects(db: AsyncSession, columns: list[str] | None = None) -> list[Project]:
+    return await repository.get_all_async(db, columns)
 
 def create_project(db: Session, data: ProjectCreate) -> Project:
     project = Project(**data.dict())
@@ -35,15 +37,11 @@ def delete_project(db: Session, project_id: int) -> bool:
         project_content_type = content_type_service.get_content_type_by_name(db, "project")
         
         if project_content_type:
-            # Delete all digital_twin_tool_association records that reference this project
-            from models.associations import DigitalTwinToolAssociation
-            associations = db.query(DigitalTwinToolAssociation).filter(
-                DigitalTwinToolAssociation.content_type_id == project_content_type.id,
-                DigitalTwinToolAssociation.content_id == project_id
-            ).all()
-            
-            for assoc in associations:
-                db.delete(assoc)
+            # Delete all digital_twin_tool_association records that reference this project, and bump
+            # those twins so their fingerprint changes for every worker process
+            digital_twin_ids = tool_relation_repo.delete_content_associations(db, project_content_type.id, project_id)
+            for digital_twin_id in digital_twin_ids:
+                export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
         
         # Delete the project itself
         db.delete(project)
@@ -54,19 +52,25 @@ def delete_project(db: Session, project_id: int) -> bool:
         db.rollback()
         raise
 
-def get_projects_filtered_paginated(
-    db: Session,
+async def get_projects_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact",
+    columns: list[str] | None = None
 ):
-    return repository.get_filtered_paginated(
+    return await repository.get_filtered_paginated(
         db,
         search,
         page,
         page_size,
         sort_column,
-        sort_direction
+        sort_direction,
+        cursor,
+        count_strategy,
+        columns
     )
\ No newline at end of file
@@ -0,0 +1,77 @@
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy.orm import Session
+import repositories.tool_repository as tool_repo
+import repositories.content_type_repository as content_type_repo
+from models.tool import Tool
+from models.content_type import ContentType
+
+# Seconds the tools and content types stay cached; the write endpoints of this process invalidate
+# them immediately, the TTL bounds how long other workers serve them after a change
+REFERENCE_DATA_CACHE_TTL = float(os.getenv("REFERENCE_DATA_CACHE_TTL", "300"))
+
+# Loaded tools and content types, None until first use or after invalidate()
+_registry: Optional[dict] = None
+_generation = 0
+_lock = threading.Lock()
+
+def _load(db: Session) -> dict:
+    # A session of its own so the objects can be detached without touching the caller's session.
+    # Detached objects are safe to share between threads as long as only their columns are read.
+    with Session(bind=db.get_bind()) as session:
+        tools = tool_repo.get_all_tools(session)
+        content_types = content_type_repo.get_all(session)
+    return {
+        "expires_at": time.monotonic() + REFERENCE_DATA_CACHE_TTL,
+        "tools": tools,
+        "tools_by_id": {tool.id: tool for tool in tools},
+        "tools_by_name": {tool.name: tool for tool in tools},
+        "content_types": content_types,
+        "content_types_by_id": {content_type.id: content_type for content_type in content_types},
+        "content_types_by_name": {content_type.name: content_type for content_type in content_types},
+    }
+
+def _get_registry(db: Session) -> dict:
+    global _registry
+    with _lock:
+        registry, generation = _registry, _generation
+    if registry is not None and registry["expires_at"] > time.monotonic():
+        return registry
+
+    registry = _load(db)
+    with _lock:
+        # Do not store data that was loaded while a write invalidated the registry
+        if generation == _generation:
+            _registry = registry
+    return registry
+
+def invalidate():
+    """Drop the cached tools and content types, call after committing a change to either table"""
+    global _registry, _generation
+    with _lock:
+        _registry = None
+        _generation += 1
+
+def get_tools(db: Session) -> list[Tool]:
+    return _get_registry(db)["tools"]
+
+def get_tools_by_id(db: Session) -> dict[int, Tool]:
+    return _get_registry(db)["tools_by_id"]
+
+def get_tool_by_id(db: Session, tool_id: int) -> Tool | None:
+    return _get_registry(db)["tools_by_id"].get(tool_id)
+
+def get_tool_by_name(db: Session, name: str) -> Tool | None:
+    return _get_registry(db)["tools_by_name"].get(name)
+
+def get_content_types(db: Session) -> list[ContentType]:
+    return _get_registry(db)["content_types"]
+
+def get_content_type_by_id(db: Session, content_type_id: int) -> ContentType | None:
+    return _get_registry(db)["content_types_by_id"].get(content_type_id)
+
+def get_content_type_by_name(db: Session, name: str) -> ContentType | None:
+    return _get_registry(db)["content_types_by_name"].get(name)
@@ -1,5 +1,9 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import repositories.story_repository as repo
+import repositories.digital_twin_tool_relation_repository as tool_relation_repo
+import services.content_type_service as content_type_service
+import services.export_cache_service as export_cache_service
 from models.tool_associations import Story
 from schemas.story_schema import (
     StoryCreate,
@@ -9,8 +13,8 @@ from schemas.story_schema import (
 def get_story(db: Session, story_id: int) -> Story | None:
     return repo.get_by_id(db, story_id)
 
-def get_all_stories(db: Session) -> list[Story]:
-    return repo.get_all(db)
+async def get_all_stories(db: AsyncSession, columns: list[str] | None = None) -> list[Story]:
+    return await repo.get_all_async(db, columns)
 
 def create_story(db: Session, data: StoryCreate) -> Story:
     story = Story(**data.dict())
@@ -23,21 +27,46 @@ def update_story(db: Session, story_id: int, updates: StoryUpdate) -> Story | No
     return repo.update(db, story, updates.dict(exclude_unset=True))
 
 def delete_story(db: Session, story_id: int) -> bool:
-    return repo.delete(db, story_id)
+    story = repo.get_by_id(db, story_id)
+    if not story:
+        return False
+
+    try:
+        # Remove the story from every digital twin and bump those twins, so their fingerprint
+        # changes for every worker process and the stored exports are refreshed
+        story_content_type = content_type_service.get_content_type_by_name(db, "story")
+        if story_content_type:
+            digital_twin_ids = tool_relation_repo.delete_content_associations(db, story_content_type.id, story_id)
+            for digital_twin_id in digital_twin_ids:
+                export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
+
+        db.delete(story)
+        db.commit()
+        return True
+
+    except Exception:
+        db.rollback()
+        raise
 
-def get_stories_filtered_paginated(
-    db: Session,
+async def get_stories_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact",
+    columns: list[str] | None = None
 ):
-    return repo.get_filtered_paginated(
+    return await repo.get_filtered_paginated(
         db,
         search,
         page,
         page_size,
         sort_column,
-        sort_direction
+        sort_direction,
+        cursor,
+        count_strategy,
+        columns
     )
\ No newline at end of file
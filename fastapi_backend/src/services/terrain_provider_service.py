@@ -1,5 +1,9 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import repositories.terrain_provider_repository as repo
+import repositories.digital_twin_tool_relation_repository as tool_relation_repo
+import services.content_type_service as content_type_service
+import services.export_cache_service as export_cache_service
 from models.tool_associations import TerrainProvider
 from schemas.terrain_provider_schema import (
     TerrainProviderCreate,
@@ -9,8 +13,8 @@ from schemas.terrain_provider_schema import (
 def get_terrain_provider(db: Session, terrain_provider_id: int) -> TerrainProvider | None:
     return repo.get_by_id(db, terrain_provider_id)
 
-def get_all_terrain_providers(db: Session) -> list[TerrainProvider]:
-    return repo.get_all(db)
+async def get_all_terrain_providers(db: AsyncSession) -> list[TerrainProvider]:
+    return await repo.get_all_async(db)
 
 def create_terrain_provider(db: Session, data: TerrainProviderCreate) -> TerrainProvider:
     terrain_provider = TerrainProvider(**data.dict())
@@ -23,21 +27,44 @@ def update_terrain_provider(db: Session, terrain_provider_id: int, updates: Terr
     return repo.update(db, terrain_provider, updates.dict(exclude_unset=True))
 
 def delete_terrain_provider(db: Session, terrain_provider_id: int) -> bool:
-    return repo.delete(db, terrain_provider_id)
+    terrain_provider = repo.get_by_id(db, terrain_provider_id)
+    if not terrain_provider:
+        return False
+
+    try:
+        # Remove the terrain provider from every digital twin and bump those twins, so their fingerprint
+        # changes for every worker process and the stored exports are refreshed
+        terrain_provider_content_type = content_type_service.get_content_type_by_name(db, "terrain_provider")
+        if terrain_provider_content_type:
+            digital_twin_ids = tool_relation_repo.delete_content_associations(db, terrain_provider_content_type.id, terrain_provider_id)
+            for digital_twin_id in digital_twin_ids:
+                export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
+
+        db.delete(terrain_provider)
+        db.commit()
+        return True
+
+    except Exception:
+        db.rollback()
+        raise
 
-def get_terrain_providers_filtered_paginated(
-    db: Session,
+async def get_terrain_providers_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "title",
-    sort_direction: str = "asc"
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact"
 ):
-    return repo.get_filtered_paginated(
+    return await repo.get_filtered_paginated(
         db,
         search,
         page,
         page_size,
         sort_column,
-        sort_direction
+        sort_direction,
+        cursor,
+        count_strategy
     )
\ No newline at end of file
@@ -1,39 +1,53 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.tool_schema import ToolCreate, ToolUpdate
 import repositories.tool_repository as repo
+import services.reference_data_service as reference_data_service
 
 def get_tool(tool_id: int, db: Session):
     return repo.get_tool_by_id(db, tool_id)
 
 def get_tool_by_name(name: str, db: Session):
-    return repo.get_tool_by_name(db, name)
+    # Served from the in-process registry, the returned tool is detached and read-only
+    return reference_data_service.get_tool_by_name(db, name)
 
-def list_tools(db: Session):
-    return repo.get_all_tools(db)
+async def list_tools(db: AsyncSession, columns: list[str] | None = None):
+    return await repo.get_all_tools_async(db, columns)
 
 def create_tool(tool_create: ToolCreate, db: Session):
-    return repo.insert_tool(db, tool_create.dict())
+    tool = repo.insert_tool(db, tool_create.dict())
+    reference_data_service.invalidate()
+    return tool
 
 def update_tool(existing_tool, tool_update: ToolUpdate, db: Session):
-    return repo.update_tool(db, existing_tool, tool_update.dict())
+    tool = repo.update_tool(db, existing_tool, tool_update.dict())
+    reference_data_service.invalidate()
+    return tool
 
 def delete_tool(existing_tool, db: Session):
     repo.delete_tool(db, existing_tool)
+    reference_data_service.invalidate()
 
-def get_tools_filtered_paginated(
-    db: Session,
+async def get_tools_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact",
+    columns: list[str] | None = None
 ):
     import repositories.tool_repository as repo
-    return repo.get_filtered_paginated(
+    return await repo.get_filtered_paginated(
         db,
         search,
         page,
         page_size,
         sort_column,
-        sort_direction
+        sort_direction,
+        cursor,
+        count_strategy,
+        columns
     )
\ No newline at end of file
@@ -1,12 +1,13 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import repositories.user_repository as repo
 from schemas.user_schema import UserCreate, UserUpdate
 
 def get_user(user_id: int, db: Session):
     return repo.get_user_by_id(db, user_id)
 
-def list_users(db: Session):
-    return repo.get_all_users(db)
+async def list_users(db: AsyncSession):
+    return await repo.get_all_users_async(db)
 
 def create_user(user_create: UserCreate, db: Session):
     return repo.create_user(db, user_create)
@@ -17,19 +18,23 @@ def update_user(existing_user, user_update: UserUpdate, db: Session):
 def delete_user(existing_user, db: Session):
     return repo.delete_user(db, existing_user)
 
-def get_users_filtered_paginated(
-    db: Session,
+async def get_users_filtered_paginated(
+    db: AsyncSession,
     search: str = "",
     page: int = 1,
     page_size: int = 10,
     sort_column: str = "name",
-    sort_direction: str = "asc"
+    sort_direction: str = "asc",
+    cursor: str | None = None,
+    count_strategy: str = "exact"
 ):
-    return repo.get_filtered_paginated(
+    return await repo.get_filtered_paginated(
         db,
         search,
         page,
         page_size,
         sort_column,
-        sort_direction
+        sort_direction,
+        cursor,
+        count_strategy
     )
\ No newline at end of file
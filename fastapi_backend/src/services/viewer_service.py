@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from schemas.viewer_schema import ViewerCreate, ViewerUpdate
 import repositories.viewer_repository as repo
+import services.export_cache_service as export_cache_service
 
 def get_viewer_by_digital_twin_id(digital_twin_id: int, db: Session):
     return repo.get_viewer_by_digital_twin_id(db, digital_twin_id)
@@ -13,17 +14,20 @@ def create_viewer_with_digital_twin_id(viewer_create: ViewerCreate, digital_twin
     if existing:
         raise ValueError("Viewer already exists for this digital twin")
 
+    export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
     return repo.insert_viewer(db, viewer_data)
 
 def update_viewer_by_digital_twin_id(digital_twin_id: int, viewer_update: ViewerUpdate, db: Session):
     viewer = repo.get_viewer_by_digital_twin_id(db, digital_twin_id)
     if not viewer:
         return None
+    export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
     return repo.update_viewer(db, viewer, viewer_update.dict())
 
 def delete_viewer_by_digital_twin_id(digital_twin_id: int, db: Session):
     viewer = repo.get_viewer_by_digital_twin_id(db, digital_twin_id)
     if not viewer:
         return False
+    export_cache_service.mark_digital_twin_changed(db, digital_twin_id)
     repo.delete_viewer(db, viewer)
     return True
@@ -0,0 +1,43 @@
+"""Shared fixtures. Run from fastapi_backend with: python -m pytest tests
+
+The tests use a SQLite file database per test instead of Postgres, so they cover the
+dialect-independent code paths.
+"""
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import db.database as database
+import models  # noqa: F401, registers every table on Base.metadata
+
+@pytest.fixture
+def engine(tmp_path):
+    """SQLite engine bound to SessionLocal and AsyncSessionLocal for the duration of the test"""
+    path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    database.Base.metadata.create_all(engine)
+    # Tests run async code on a new event loop each time, so async connections are not pooled
+    # (a pooled aiosqlite connection also keeps its thread, and the test process, alive)
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}", poolclass=NullPool)
+    database.SessionLocal.configure(bind=engine)
+    database.AsyncSessionLocal.configure(bind=async_engine)
+    yield engine
+    database.SessionLocal.configure(bind=database.engine)
+    database.AsyncSessionLocal.configure(bind=database.async_engine)
+    engine.dispose()
+
+@pytest.fixture
+def db(engine):
+    with database.SessionLocal() as session:
+        yield session
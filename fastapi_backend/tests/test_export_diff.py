@@ -0,0 +1,149 @@
+import copy
+import random
+
+import pytest
+
+from services.export_diff_service import diff
+
+# Minimal RFC 6902 applier for the operations diff() produces (add, remove, replace, move)
+
+def _tokens(pointer: str) -> list[str]:
+    if pointer == "":
+        return []
+    assert pointer.startswith("/"), pointer
+    return [token.replace("~1", "/").replace("~0", "~") for token in pointer[1:].split("/")]
+
+def _resolve(document, tokens: list[str]):
+    for token in tokens:
+        document = document[int(token)] if isinstance(document, list) else document[token]
+    return document
+
+def _add(document, pointer: str, value):
+    tokens = _tokens(pointer)
+    if not tokens:
+        return value
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, list):
+        index = len(parent) if tokens[-1] == "-" else int(tokens[-1])
+        assert 0 <= index <= len(parent), (pointer, len(parent))
+        parent.insert(index, value)
+    else:
+        parent[tokens[-1]] = value
+    return document
+
+def _remove(document, pointer: str):
+    tokens = _tokens(pointer)
+    parent = _resolve(document, tokens[:-1])
+    if isinstance(parent, list):
+        return parent.pop(int(tokens[-1]))
+    return parent.pop(tokens[-1])
+
+def apply_patch(document, patch: list[dict]):
+    document = copy.deepcopy(document)
+    for operation in patch:
+        op = operation["op"]
+        if op == "add":
+            document = _add(document, operation["path"], copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            _remove(document, operation["path"])
+        elif op == "replace":
+            tokens = _tokens(operation["path"])
+            if not tokens:
+                document = copy.deepcopy(operation["value"])
+            else:
+                parent = _resolve(document, tokens[:-1])
+                key = int(tokens[-1]) if isinstance(parent, list) else tokens[-1]
+                parent[key] = copy.deepcopy(operation["value"])
+        elif op == "move":
+            value = _remove(document, operation["from"])
+            document = _add(document, operation["path"], value)
+        else:
+            raise AssertionError(f"unexpected operation {op}")
+    return document
+
+# Random exports: nested dicts and lists, with lists of objects keyed on id, title or name
+
+def _scalar(rng: random.Random):
+    return rng.choice([None, True, False, 0, 1, rng.randint(-5, 5), 1.5, "", "a", "b/c", "d~e", rng.choice("xyz")])
+
+def _value(rng: random.Random, depth: int):
+    kind = rng.random()
+    if depth <= 0 or kind < 0.4:
+        return _scalar(rng)
+    if kind < 0.65:
+        return {rng.choice(["a", "b", "c", "x/y", "t~1"]): _value(rng, depth - 1) for _ in range(rng.randint(0, 4))}
+    if kind < 0.8:
+        return [_value(rng, depth - 1) for _ in range(rng.randint(0, 4))]
+    return _keyed_list(rng, depth - 1)
+
+def _keyed_list(rng: random.Random, depth: int) -> list:
+    field = rng.choice(["id", "title", "name"])
+    keys = rng.sample(range(30), rng.randint(0, 12))
+    if field != "id":
+        keys = [f"item {key}" for key in keys]
+    return [{field: key, "value": _value(rng, depth), "other": _scalar(rng)} for key in keys]
+
+def _mutate(rng: random.Random, value, depth: int):
+    if rng.random() < 0.1:
+        return _value(rng, depth)
+    if isinstance(value, dict):
+        result = {key: (_mutate(rng, item, depth - 1) if rng.random() < 0.5 else item) for key, item in value.items()}
+        for key in list(result):
+            if rng.random() < 0.15:
+                del result[key]
+        if rng.random() < 0.3:
+            result[rng.choice(["a", "new", "x/y"])] = _value(rng, depth - 1)
+        return result
+    if isinstance(value, list):
+        result = [_mutate(rng, item, depth - 1) if rng.random() < 0.3 else item for item in value if rng.random() > 0.15]
+        if rng.random() < 0.5:
+            rng.shuffle(result)
+        elif len(result) > 1 and rng.random() < 0.5:
+            # One item moved, the common reorder in the frontend
+            result.insert(rng.randrange(len(result)), result.pop(rng.randrange(len(result))))
+        if result and isinstance(result[0], dict) and rng.random() < 0.4:
+            field = next((field for field in ("id", "title", "name") if field in result[0]), None)
+            if field is not None:
+                new_key = 100 + rng.randint(0, 50) if field == "id" else f"new {rng.randint(0, 50)}"
+                if all(item.get(field) != new_key for item in result if isinstance(item, dict)):
+                    result.insert(rng.randint(0, len(result)), {field: new_key, "value": _scalar(rng)})
+        return result
+    return _scalar(rng) if rng.random() < 0.3 else value
+
+def _same(a, b) -> bool:
+    # == treats True and 1 as equal, the patch must keep the JSON types
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_same(a[key], b[key]) for key in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+@pytest.mark.parametrize("seed", range(20))
+def test_patch_round_trips(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        source = {"layers": _keyed_list(rng, 2), "groups": _keyed_list(rng, 2), "settings": _value(rng, 3)}
+        target = _mutate(rng, source, 4)
+        patch = diff(source, target)
+        assert _same(apply_patch(source, patch), target), (source, target, patch)
+
+def test_identical_exports_give_an_empty_patch():
+    export = {"layers": [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}], "viewer": {"x": 1}}
+    assert diff(export, copy.deepcopy(export)) == []
+
+def test_moving_one_item_is_one_move():
+    source = [{"id": key, "title": str(key)} for key in range(10)]
+    target = source[:2] + source[3:8] + [source[2]] + source[8:]
+    patch = diff(source, target)
+    assert [operation["op"] for operation in patch] == ["move"]
+    assert apply_patch(source, patch) == target
+
+def test_changed_item_is_patched_in_place():
+    source = [{"id": 1, "title": "a"}, {"id": 2, "title": "b"}]
+    target = [{"id": 1, "title": "a"}, {"id": 2, "title": "changed"}]
+    assert diff(source, target) == [{"op": "replace", "path": "/1/title", "value": "changed"}]
+
+def test_bool_and_int_are_different_values():
+    assert diff({"a": True}, {"a": 1}) == [{"op": "replace", "path": "/a", "value": 1}]
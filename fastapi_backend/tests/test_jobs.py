@@ -0,0 +1,151 @@
+import io
+import threading
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import undefer
+
+import db.database as database
+import repositories.job_repository as repo
+import services.job_service as job_service
+from models import DigitalTwin
+from models.job import Job
+from schemas.job_schema import RefreshExportsJobParams
+
+def _now():
+    return datetime.now(timezone.utc)
+
+def _claim(db):
+    return repo.claim_next_job(db, _now() - timedelta(seconds=job_service.JOB_STALE_AFTER))
+
+def _make_stale(db, job_id):
+    db.execute(update(Job).where(Job.id == job_id).values(heartbeat_at=_now() - timedelta(hours=1)))
+    db.commit()
+
+def _take_over(job_id):
+    # What claim_next_job does in another worker once the heartbeat is stale
+    with database.SessionLocal() as other:
+        _make_stale(other, job_id)
+        job = _claim(other)
+        assert job.id == job_id
+        return job.attempts
+
+def _load(job_id):
+    with database.SessionLocal() as session:
+        return session.get(Job, job_id)
+
+def _use_handler(monkeypatch, handler):
+    monkeypatch.setitem(job_service.JOB_TYPES, "refresh_exports", (RefreshExportsJobParams, handler))
+
+def test_claim_skips_running_jobs_with_a_fresh_heartbeat(db):
+    job = repo.insert_job(db, "refresh_exports", {})
+    claimed = _claim(db)
+    assert (claimed.id, claimed.status, claimed.attempts) == (job.id, "running", 1)
+    assert _claim(db) is None
+
+def test_stale_running_job_is_reclaimed(db):
+    job = repo.insert_job(db, "refresh_exports", {})
+    _claim(db)
+    _make_stale(db, job.id)
+    reclaimed = _claim(db)
+    assert (reclaimed.id, reclaimed.status, reclaimed.attempts) == (job.id, "running", 2)
+
+def test_lost_claim_cannot_update_the_job(db):
+    job = repo.insert_job(db, "refresh_exports", {})
+    first = _claim(db).attempts
+    second = _take_over(job.id)
+
+    assert repo.update_progress(db, job.id, first, 1, 2, "old worker") is False
+    assert repo.touch_heartbeat(db, job.id, first) is False
+    assert repo.finish_job(db, job.id, first, "succeeded", result={"worker": "old"}) is False
+    assert repo.update_progress(db, job.id, second, 1, 2, "new worker") is True
+    assert repo.finish_job(db, job.id, second, "succeeded", result={"worker": "new"}) is True
+
+    finished = _load(job.id)
+    assert (finished.status, finished.result, finished.message) == ("succeeded", {"worker": "new"}, "new worker")
+    # A finished job is no longer running, so no claim can write to it
+    assert repo.finish_job(db, job.id, second, "failed", error="late") is False
+
+def test_worker_stops_at_the_next_report_after_a_takeover(db, monkeypatch):
+    steps = []
+    def handler(handler_db, params, report):
+        report(0, 2, "first step")
+        steps.append("first")
+        _take_over(job.id)
+        report(1, 2, "second step")
+        steps.append("second")
+        return job_service.JobOutput(result={"worker": "old"})
+    _use_handler(monkeypatch, handler)
+    job = repo.insert_job(db, "refresh_exports", {})
+
+    assert job_service.run_next_job(db) is True
+    assert steps == ["first"]
+    # The job belongs to the worker that took it over: still running, untouched by the old run
+    taken_over = _load(job.id)
+    assert (taken_over.status, taken_over.attempts, taken_over.result) == ("running", 2, None)
+
+def test_outcome_of_a_run_that_lost_its_claim_is_discarded(db, monkeypatch):
+    def handler(handler_db, params, report):
+        # Taken over without reporting progress afterwards, so only the final write is fenced
+        _take_over(job.id)
+        return job_service.JobOutput(result={"worker": "old"})
+    _use_handler(monkeypatch, handler)
+    job = repo.insert_job(db, "refresh_exports", {})
+
+    assert job_service.run_next_job(db) is True
+    assert (_load(job.id).status, _load(job.id).result) == ("running", None)
+
+def test_heartbeat_runs_while_the_handler_is_silent(db, monkeypatch):
+    beats = threading.Event()
+    touch_heartbeat = repo.touch_heartbeat
+    def counted_touch(session, job_id, attempts):
+        beats.set()
+        return touch_heartbeat(session, job_id, attempts)
+    monkeypatch.setattr(repo, "touch_heartbeat", counted_touch)
+    monkeypatch.setattr(job_service, "JOB_HEARTBEAT_INTERVAL", 0.01)
+
+    def handler(handler_db, params, report):
+        assert beats.wait(5), "no heartbeat while the handler ran"
+        return job_service.JobOutput(result={"ok": True})
+    _use_handler(monkeypatch, handler)
+    job = repo.insert_job(db, "refresh_exports", {})
+
+    assert job_service.run_next_job(db) is True
+    finished = _load(job.id)
+    assert (finished.status, finished.result) == ("succeeded", {"ok": True})
+
+def test_jobs_past_the_attempt_limit_fail(db, monkeypatch):
+    monkeypatch.setattr(job_service, "JOB_MAX_ATTEMPTS", 1)
+    job = repo.insert_job(db, "refresh_exports", {})
+    _claim(db)
+    _make_stale(db, job.id)
+
+    assert job_service.run_next_job(db) is True
+    failed = _load(job.id)
+    assert (failed.status, failed.attempts) == ("failed", 2)
+
+def test_result_file_is_limited(monkeypatch):
+    monkeypatch.setattr(job_service, "JOB_MAX_RESULT_BYTES", 10)
+    assert job_service.collect_result_file([b"12345", b"67890"]) == b"1234567890"
+    produced = []
+    def chunks():
+        for chunk in [b"12345", b"67890", b"x", b"never produced"]:
+            produced.append(chunk)
+            yield chunk
+    with pytest.raises(ValueError, match="JOB_MAX_RESULT_BYTES"):
+        job_service.collect_result_file(chunks())
+    assert produced[-1] == b"x"
+
+def test_export_job_stores_the_archive(db):
+    db.add(DigitalTwin(name="twin", title="Twin", owner="test", isPrivate=False))
+    db.commit()
+    job = job_service.submit_job("export", {}, db)
+
+    assert job_service.run_next_job(db) is True
+    with database.SessionLocal() as session:
+        finished = session.query(Job).options(undefer(Job.result_file)).filter(Job.id == job.id).one()
+        assert (finished.status, finished.result) == ("succeeded", {"digital_twins": 1})
+        with zipfile.ZipFile(io.BytesIO(finished.result_file)) as archive:
+            assert archive.namelist() == ["twin.config.json"]
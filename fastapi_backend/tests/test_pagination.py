@@ -0,0 +1,156 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert, select
+
+import db.database as database
+from db import count_cache
+from main import app
+from models import Layer
+from repositories.pagination import count, decode_cursor, encode_cursor
+
+# featureName has NULLs and duplicates, so the walks cover both _seek branches and the id tie-breaker
+FEATURE_NAMES = ["b", None, "a", "c", None, "b", "a", None, "d", "b", None]
+
+@pytest.fixture
+def client(engine):
+    return TestClient(app)
+
+@pytest.fixture
+def layers(db):
+    rows = [
+        Layer(type="wms", title=f"Layer {index:02d}", url=f"https://example.com/{index}", featureName=name)
+        for index, name in enumerate(FEATURE_NAMES)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return [(row.id, row.featureName) for row in rows]
+
+@pytest.fixture(autouse=True)
+def empty_count_cache():
+    count_cache.clear()
+    yield
+    count_cache.clear()
+
+def _expected_ids(layers, direction: str) -> list[int]:
+    # ORDER BY featureName NULLS LAST, id (asc) or featureName DESC NULLS FIRST, id DESC (desc)
+    present = sorted((name, layer_id) for layer_id, name in layers if name is not None)
+    nulls = sorted(layer_id for layer_id, name in layers if name is None)
+    if direction == "asc":
+        return [layer_id for _, layer_id in present] + nulls
+    return nulls[::-1] + [layer_id for _, layer_id in present[::-1]]
+
+def _search(client, direction: str, cursor: str = "", page_size: int = 3) -> dict:
+    response = client.get("/layers/search", params={
+        "sort_column": "featureName", "sort_direction": direction, "page_size": page_size, "cursor": cursor, "fields": "id"
+    })
+    assert response.status_code == 200, response.text
+    return response.json()
+
+# More pages than any walk below needs, so a cursor that stops advancing fails instead of looping
+MAX_PAGES = 50
+
+def _walk(client, direction: str, page_size: int = 3) -> list[int]:
+    ids, cursor = [], ""
+    for _ in range(MAX_PAGES):
+        page = _search(client, direction, cursor, page_size)
+        ids.extend(result["id"] for result in page["results"])
+        if not page["has_more"]:
+            assert page["next_cursor"] is None
+            return ids
+        cursor = page["next_cursor"]
+    pytest.fail("the cursor walk did not reach the last page")
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+@pytest.mark.parametrize("page_size", [1, 2, 3, 4, 11])
+def test_cursor_walk_visits_every_row_once_with_null_sort_values(client, layers, direction, page_size):
+    assert _walk(client, direction, page_size) == _expected_ids(layers, direction)
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_cursor_walk_matches_page_mode(client, layers, direction):
+    paged = []
+    for page in range(1, 5):
+        response = client.get("/layers/search", params={
+            "sort_column": "featureName", "sort_direction": direction, "page_size": 3, "page": page, "fields": "id"
+        })
+        paged.extend(result["id"] for result in response.json()["results"])
+    assert _walk(client, direction) == paged
+
+@pytest.mark.parametrize("direction", ["asc", "desc"])
+def test_cursor_reused_after_a_write_continues_after_its_row(client, layers, db, direction):
+    first = _search(client, direction)
+    seen = [result["id"] for result in first["results"]]
+
+    # New rows before and after the cursor position, including in the NULL group
+    new_rows = [
+        Layer(type="wms", title="New", url="https://example.com/new", featureName=name)
+        for name in ["a", "z", None, "b"]
+    ]
+    db.add_all(new_rows)
+    db.commit()
+    current = [*layers, *((row.id, row.featureName) for row in new_rows)]
+
+    rest = []
+    cursor = first["next_cursor"]
+    for _ in range(MAX_PAGES):
+        if not cursor:
+            break
+        page = _search(client, direction, cursor)
+        rest.extend(result["id"] for result in page["results"])
+        cursor = page["next_cursor"]
+
+    # Exactly the current rows after the last row of the first page, none seen twice
+    expected = _expected_ids(current, direction)
+    assert rest == expected[expected.index(seen[-1]) + 1:]
+    assert not set(rest) & set(seen)
+
+def test_cursor_round_trips_datetimes():
+    moment = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    cursor = encode_cursor("last_updated", "desc", moment, 42)
+    assert decode_cursor(cursor, "last_updated", "desc") == (moment, 42)
+    assert decode_cursor(encode_cursor("title", "asc", None, 7), "title", "asc") == (None, 7)
+
+@pytest.mark.parametrize("cursor", ["not base64!", "bm90IGpzb24", encode_cursor("title", "asc", "x", 1)[:-3]])
+def test_malformed_cursor_is_rejected(client, layers, cursor):
+    response = client.get("/layers/search", params={"sort_column": "featureName", "cursor": cursor})
+    assert response.status_code == 400
+
+def test_cursor_of_another_sort_is_rejected(client, layers):
+    for cursor in [encode_cursor("title", "asc", "x", 1), encode_cursor("featureName", "desc", "x", 1)]:
+        response = client.get("/layers/search", params={"sort_column": "featureName", "sort_direction": "asc", "cursor": cursor})
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Cursor does not match the requested sort"
+
+def _cached_count() -> int:
+    async def run():
+        async with database.AsyncSessionLocal() as session:
+            return await count(session, select(Layer), Layer, "cached")
+    return asyncio.run(run())
+
+def test_cached_count_is_invalidated_when_a_write_commits(layers, db):
+    assert _cached_count() == len(layers)
+
+    db.add(Layer(type="wms", title="New", url="https://example.com/new"))
+    db.flush()
+    # Flushed but not committed: other sessions still see the old total
+    assert _cached_count() == len(layers)
+    db.commit()
+    assert _cached_count() == len(layers) + 1
+
+    db.execute(insert(Layer).values(type="wms", title="Statement", url="https://example.com/statement"))
+    db.commit()
+    assert _cached_count() == len(layers) + 2
+
+def test_rolled_back_write_keeps_the_cached_count(layers, db, engine):
+    assert _cached_count() == len(layers)
+    db.add(Layer(type="wms", title="Discarded", url="https://example.com/discarded"))
+    db.flush()
+    db.rollback()
+    db.commit()
+
+    # An insert outside any session is not seen by the cache, so the old total shows it was kept
+    with engine.begin() as connection:
+        connection.execute(insert(Layer).values(type="wms", title="Unseen", url="https://example.com/unseen"))
+    assert _cached_count() == len(layers)